@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Import-time check for create_name_pdfs, to catch heavy imports creeping back.
+
+Measures the cumulative import time with `python -X importtime`, then runs
+a combined-PDF-only job in a fresh interpreter and checks which heavy
+modules it loaded. Exits non-zero if a deferred module was loaded or the
+import takes longer than the budget.
+
+Run from the decals directory:
+    python benchmarks/bench_import_time.py [budget_ms]
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+DECALS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Only needed for outlines and previews; a combined-PDF run must not load them.
+# PIL isn't listed because reportlab itself imports PIL.Image unconditionally.
+DEFERRED_MODULES = ("cv2", "numpy")
+
+DEFAULT_BUDGET_MS = 250
+
+COMBINED_ONLY_RUN = """
+import json, sys, tempfile
+from create_name_pdfs import NamesPDFGenerator
+with tempfile.TemporaryDirectory() as output_dir:
+    NamesPDFGenerator("sample.png", output_dir=output_dir).create_combined_pdf()
+print(json.dumps(sorted(m for m in {modules!r} if m in sys.modules)))
+"""
+
+
+def import_times(statement):
+    """
+    Per-module import times for a statement, from -X importtime.
+
+    Returns:
+        Dict of module name to (self microseconds, cumulative microseconds)
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=DECALS_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+def main():
+    budget_ms = float(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_BUDGET_MS
+    failures = []
+
+    times = import_times("import create_name_pdfs")
+    total_ms = times["create_name_pdfs"][1] / 1000
+    print(f"import create_name_pdfs: {total_ms:.1f}ms (budget {budget_ms:.0f}ms)")
+    if total_ms > budget_ms:
+        failures.append(
+            f"import took {total_ms:.1f}ms, over the {budget_ms:.0f}ms budget"
+        )
+
+    print("Slowest packages:")
+    top_level = {name: t for name, t in times.items() if "." not in name}
+    for name, (_, cumulative_us) in sorted(
+        top_level.items(), key=lambda item: item[1][1], reverse=True
+    )[:8]:
+        print(f"  {name:<24} {cumulative_us / 1000:8.1f}ms")
+
+    for module in DEFERRED_MODULES:
+        if module in times:
+            failures.append(f"'import create_name_pdfs' loaded {module}")
+        cost_ms = import_times(f"import {module}")[module][1] / 1000
+        print(f"Deferred: {module} would add {cost_ms:.1f}ms")
+
+    result = subprocess.run(
+        [sys.executable, "-c", COMBINED_ONLY_RUN.format(modules=DEFERRED_MODULES)],
+        cwd=DECALS_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    loaded = json.loads(result.stdout.strip().splitlines()[-1])
+    print(
+        f"Combined-PDF-only run loaded deferred modules: {', '.join(loaded) or 'none'}"
+    )
+    failures += [f"combined-PDF-only run loaded {module}" for module in loaded]
+
+    if failures:
+        print("\nFAILED:")
+        for failure in failures:
+            print(f"  - {failure}")
+        sys.exit(1)
+    print("\nOK")
+
+
+if __name__ == "__main__":
+    main()
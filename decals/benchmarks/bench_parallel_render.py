@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Names-per-second of create_all_pdfs at different worker counts.
+
+Run from the decals directory:
+    python benchmarks/bench_parallel_render.py [names] [workers ...]
+"""
+
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from create_name_pdfs import NamesPDFGenerator  # noqa: E402
+
+DEFAULT_WORKERS = (1, 2, 4, 8)
+
+
+def synthetic_names(count, base_names):
+    """Repeat the built-in names with a numeric suffix to reach count"""
+    return [
+        f"{base_names[i % len(base_names)]} {i // len(base_names) + 1}"
+        for i in range(count)
+    ]
+
+
+def time_render(names, workers):
+    with tempfile.TemporaryDirectory() as output_dir:
+        generator = NamesPDFGenerator("sample.png", output_dir=output_dir)
+        generator.names = names
+
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            created_files = generator.render_names(workers)
+        elapsed = time.perf_counter() - start
+
+    if generator.errors:
+        raise RuntimeError(f"{len(generator.errors)} names failed to render")
+    return len(created_files), elapsed
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    worker_counts = [int(arg) for arg in sys.argv[2:]] or DEFAULT_WORKERS
+
+    with tempfile.TemporaryDirectory() as scratch:
+        base_names = NamesPDFGenerator("sample.png", output_dir=scratch).names
+    names = synthetic_names(count, base_names)
+
+    print(f"Rendering {count} names ({os.cpu_count()} CPUs available)")
+    print(f"{'workers':>8} {'seconds':>9} {'names/s':>9} {'speedup':>8}")
+
+    baseline = None
+    for workers in worker_counts:
+        rendered, elapsed = time_render(names, workers)
+        rate = rendered / elapsed
+        baseline = baseline or rate
+        print(f"{workers:>8} {elapsed:>9.2f} {rate:>9.1f} {rate / baseline:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,229 @@
+"""
+Bridges that hold a cut design together in one piece.
+
+The design is rasterized coarsely and split into connected components of
+material. Boundary points of every component go into a uniform grid, so
+the closest pair of points between neighbouring components is found by
+only comparing points in the same or adjacent cells. Those pairs are the
+candidate bridges, and a minimum spanning tree over them (Kruskal) picks
+the shortest set that connects every component. Components with nothing
+near them (a frame around the text) are joined to their nearest neighbour
+with a distance transform.
+
+In stencil mode the material is the sheet around the letters, so the
+islands are letter counters (the inside of "o", "a", "e") and bridges cut
+through the letter strokes instead of adding material.
+"""
+
+import cv2
+import numpy as np
+from reportlab.lib.units import mm
+
+from outlines import rasterize
+
+DEFAULT_BRIDGE_WIDTH = 1.5 * mm
+
+# Raster pixels per point for finding components. Coarser than the outlines,
+# but fine enough that gaps between close glyphs stay open
+ANALYSIS_SCALE = 2
+
+# Grid cell size in points. Components further apart than this are joined
+# through a distance transform instead
+GRID_CELL_SIZE = 12
+
+# Half of the 3x3 cell neighbourhood, so each pair of cells is compared once
+_NEIGHBOUR_OFFSETS = ((0, 0), (1, -1), (1, 0), (1, 1), (0, 1))
+
+
+def _boundary_mask(labels):
+    """Labelled pixels with a 4-neighbour of a different label"""
+    padded = np.pad(labels, 1)
+    inner = padded[1:-1, 1:-1]
+    return (inner > 0) & (
+        (inner != padded[:-2, 1:-1])
+        | (inner != padded[2:, 1:-1])
+        | (inner != padded[1:-1, :-2])
+        | (inner != padded[1:-1, 2:])
+    )
+
+
+def boundary_points(labels, page_height, scale=ANALYSIS_SCALE):
+    """
+    Boundary pixels of every labelled component, in page coordinates.
+
+    Args:
+        labels: Component label image (0 is empty space)
+        page_height: Page height in points
+        scale: Raster pixels per point of the label image
+
+    Returns:
+        Tuple of ((N, 2) points in points, (N,) component labels)
+    """
+    rows, cols = np.nonzero(_boundary_mask(labels))
+    points = np.column_stack([(cols + 0.5) / scale, page_height - (rows + 0.5) / scale])
+    return points, labels[rows, cols]
+
+
+def candidate_edges(points, point_labels, cell_size=GRID_CELL_SIZE):
+    """
+    Closest point pair between every two components near each other.
+
+    Args:
+        points: (N, 2) boundary points
+        point_labels: (N,) component label per point
+        cell_size: Grid cell size in points
+
+    Returns:
+        Tuple of arrays (distance, point i, point j) with one entry per
+        pair of components that have points in the same or adjacent cells
+    """
+    cells = np.floor(points / cell_size).astype(np.int64)
+    order = np.lexsort((cells[:, 1], cells[:, 0]))
+    keys, starts, counts = np.unique(
+        cells[order], axis=0, return_index=True, return_counts=True
+    )
+    cell_index = {(int(x), int(y)): k for k, (x, y) in enumerate(keys)}
+
+    pair_i = []
+    pair_j = []
+    for k, (x, y) in enumerate(keys):
+        members = order[starts[k] : starts[k] + counts[k]]
+        for dx, dy in _NEIGHBOUR_OFFSETS:
+            other = cell_index.get((int(x) + dx, int(y) + dy))
+            if other is None:
+                continue
+            neighbours = order[starts[other] : starts[other] + counts[other]]
+            i, j = np.meshgrid(members, neighbours, indexing="ij")
+            different = point_labels[i] != point_labels[j]
+            pair_i.append(i[different])
+            pair_j.append(j[different])
+
+    if not pair_i:
+        empty = np.array([], dtype=np.int64)
+        return np.array([]), empty, empty
+    pair_i = np.concatenate(pair_i)
+    pair_j = np.concatenate(pair_j)
+
+    distances = np.hypot(*(points[pair_i] - points[pair_j]).T)
+    low = np.minimum(point_labels[pair_i], point_labels[pair_j]).astype(np.int64)
+    high = np.maximum(point_labels[pair_i], point_labels[pair_j]).astype(np.int64)
+    pair_keys = low * (int(point_labels.max()) + 1) + high
+
+    # Shortest pair per component pair: sort by key then distance, keep firsts
+    by_key = np.lexsort((distances, pair_keys))
+    _, first = np.unique(pair_keys[by_key], return_index=True)
+    best = by_key[first]
+    return distances[best], pair_i[best], pair_j[best]
+
+
+def _find(parents, x):
+    while parents[x] != x:
+        parents[x] = parents[parents[x]]
+        x = parents[x]
+    return x
+
+
+def _nearest_outside(labels, group, points, point_labels, page_height, scale):
+    """Closest boundary point outside a group of components, and its label"""
+    # Distance from every pixel to the group, and which group pixel is closest
+    source = np.where(np.isin(labels, group), 0, 1).astype(np.uint8)
+    distance, nearest = cv2.distanceTransformWithLabels(
+        source, cv2.DIST_L2, cv2.DIST_MASK_PRECISE, labelType=cv2.DIST_LABEL_PIXEL
+    )
+    # Pixel labels number the group's pixels in scan order, starting at 1
+    group_rows, group_cols = np.nonzero(source == 0)
+
+    outside = np.flatnonzero(~np.isin(point_labels, group))
+    cols = (points[outside, 0] * scale).astype(np.int64)
+    rows = ((page_height - points[outside, 1]) * scale).astype(np.int64)
+    m = int(np.argmin(distance[rows, cols]))
+    pixel = nearest[rows[m], cols[m]] - 1
+
+    start = (
+        (group_cols[pixel] + 0.5) / scale,
+        page_height - (group_rows[pixel] + 0.5) / scale,
+    )
+    return start, points[outside[m]], int(point_labels[outside[m]])
+
+
+def spanning_bridges(
+    labels, page_height, scale=ANALYSIS_SCALE, cell_size=GRID_CELL_SIZE
+):
+    """
+    Shortest set of bridge segments that connects every component.
+
+    Args:
+        labels: Component label image (0 is empty space)
+        page_height: Page height in points
+        scale: Raster pixels per point of the label image
+        cell_size: Grid cell size in points
+
+    Returns:
+        List of ((x1, y1), (x2, y2)) bridge segments
+    """
+    points, point_labels = boundary_points(labels, page_height, scale)
+    parents = {int(label): int(label) for label in np.unique(point_labels)}
+    bridges = []
+
+    distances, pair_i, pair_j = candidate_edges(points, point_labels, cell_size)
+    for m in np.argsort(distances):
+        i, j = pair_i[m], pair_j[m]
+        a = _find(parents, int(point_labels[i]))
+        b = _find(parents, int(point_labels[j]))
+        if a != b:
+            parents[a] = b
+            bridges.append((points[i], points[j]))
+
+    # Groups with no neighbour within the grid: join each to its nearest
+    while True:
+        roots = {}
+        for label in parents:
+            roots.setdefault(_find(parents, label), []).append(label)
+        if len(roots) < 2:
+            return bridges
+        group = next(iter(roots.values()))
+        start, end, other = _nearest_outside(
+            labels, group, points, point_labels, page_height, scale
+        )
+        bridges.append((start, end))
+        parents[_find(parents, group[0])] = _find(parents, other)
+
+
+def add_bridges(
+    display_list, width=DEFAULT_BRIDGE_WIDTH, stencil=False, scale=ANALYSIS_SCALE
+):
+    """
+    Add bridges so the cut design comes out as one piece.
+
+    Args:
+        display_list: DisplayList of the design
+        width: Bridge width in points
+        stencil: Treat the sheet around the design as the material, so
+            letter counters are the islands and bridges cut through strokes
+        scale: Raster pixels per point for finding components
+
+    Returns:
+        Tuple of (copy of the display list with bridges added, islands
+        found, bridges inserted)
+    """
+    bridged = display_list.copy()
+    design = rasterize(display_list, scale) > 0
+    material = ~design if stencil else design
+
+    count, labels = cv2.connectedComponents(material.astype(np.uint8), connectivity=4)
+    islands = max(count - 2, 0)
+    if islands == 0:
+        return bridged, 0, 0
+
+    bridges = spanning_bridges(labels, display_list.page_height, scale)
+
+    # Bridges overlap the material they join by half their width at each end
+    fill = 0 if stencil else 255
+    for (x1, y1), (x2, y2) in bridges:
+        length = np.hypot(x2 - x1, y2 - y1) or 1.0
+        ux, uy = (x2 - x1) / length * width / 2, (y2 - y1) / length * width / 2
+        bridged.add_bridge(
+            float(x1 - ux), float(y1 - uy), float(x2 + ux), float(y2 + uy), width, fill
+        )
+
+    return bridged, islands, len(bridges)
@@ -0,0 +1,126 @@
+"""
+Job bundles: every output of a run streamed into one ZIP or tar archive.
+
+Files go into the archive straight from memory as they are rendered, so a
+batch for the laser shop needs no intermediate files and no second pass
+over the output directory. A manifest.json listing every design's files,
+dimensions, material area and estimated cut length, and the same figures
+for each combined sheet, is added last.
+"""
+
+import io
+import json
+import tarfile
+import time
+import zipfile
+
+# Archive suffixes and the tarfile write mode for each (None is a ZIP)
+ARCHIVE_FORMATS = {
+    ".zip": None,
+    ".tar": "w",
+    ".tar.gz": "w:gz",
+    ".tgz": "w:gz",
+}
+
+MANIFEST_NAME = "manifest.json"
+
+# Already-compressed outputs are stored as is rather than deflated again
+_STORED_EXTENSIONS = (".pdf", ".png")
+
+
+def archive_mode(path):
+    """The tarfile write mode for an archive path, or None for a ZIP"""
+    for suffix, mode in ARCHIVE_FORMATS.items():
+        if path.lower().endswith(suffix):
+            return mode
+    raise ValueError(
+        f"Unknown archive type for {path!r}: use one of {', '.join(ARCHIVE_FORMATS)}"
+    )
+
+
+def parse_archive_path(path):
+    """Check an archive path has a known suffix, for argparse"""
+    archive_mode(path)
+    return path
+
+
+class JobBundle:
+    """
+    A ZIP or tar archive that rendered outputs are written into.
+
+    Use as a context manager; the manifest is written when it closes.
+
+    Args:
+        path: Archive path ending in .zip, .tar, .tar.gz or .tgz
+        metadata: Extra top-level manifest entries
+    """
+
+    def __init__(self, path, **metadata):
+        self.path = path
+        self.metadata = metadata
+        self.designs = []
+        self.sheets = []
+        self.files = []
+        self._tar_mode = archive_mode(path)
+        if self._tar_mode is None:
+            self._archive = zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED)
+        else:
+            self._archive = tarfile.open(path, self._tar_mode)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def add(self, name, data):
+        """
+        Add one file to the archive.
+
+        Args:
+            name: Path inside the archive
+            data: File contents, bytes or text
+
+        Returns:
+            Where the file went, as "<archive>:<name>"
+        """
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+
+        if self._tar_mode is None:
+            compression = (
+                zipfile.ZIP_STORED
+                if name.lower().endswith(_STORED_EXTENSIONS)
+                else zipfile.ZIP_DEFLATED
+            )
+            self._archive.writestr(name, data, compress_type=compression)
+        else:
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            info.mtime = int(time.time())
+            self._archive.addfile(info, io.BytesIO(data))
+
+        self.files.append(name)
+        return f"{self.path}:{name}"
+
+    def add_design(self, record):
+        """Record a design's manifest entry (name, files and estimates)"""
+        self.designs.append(record)
+
+    def add_sheet(self, record):
+        """Record a combined sheet's manifest entry (names and estimates)"""
+        self.sheets.append(record)
+
+    def close(self):
+        """Write the manifest and finish the archive"""
+        if self._archive is None:
+            return
+        manifest = {
+            **self.metadata,
+            "designs": self.designs,
+            "sheets": self.sheets,
+            "files": self.files,
+        }
+        self.add(MANIFEST_NAME, json.dumps(manifest, indent=2))
+        self._archive.close()
+        self._archive = None
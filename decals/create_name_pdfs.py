@@ -5,21 +5,108 @@ This script creates individual PDF files for each name of God with interconnecte
 laser-cutting friendly designs based on the sample image style.
 """
 
+import argparse
+import contextlib
+import hashlib
+import io
+import json
 import os
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
 
-import cv2
-import numpy as np
-from PIL import Image, ImageDraw, ImageFont
-from reportlab.lib.pagesizes import A4, letter
-from reportlab.lib.units import inch, mm
-from reportlab.pdfbase import pdfmetrics, pdfutils
-from reportlab.pdfbase.ttfonts import TTFont
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.units import mm
 from reportlab.pdfgen import canvas
 
+from bundle import JobBundle, parse_archive_path
+from display_list import DisplayList, draw_pdf
+from font_registry import (
+    BUNDLED_FONTS,
+    DEFAULT_FONT,
+    font_metrics,
+    register_font,
+    string_width,
+)
+from name_sources import FORMATS, NameFile, normalize_entry
+from nesting import (
+    fits_on_sheet,
+    pack_rectangles,
+    parse_sheet_size,
+    sheet_utilization,
+)
+from text_layout import fit_text, line_height
+
+
+def load_json_cache(path):
+    """Load a JSON cache file, treating a missing or corrupt one as empty"""
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_json_cache(cache, path):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(cache, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+# Per-process generator used by the render pool workers
+_worker_generator = None
+
+
+def _init_render_worker(generator):
+    global _worker_generator
+    _worker_generator = generator
+
+
+def _render_in_worker(entry, index):
+    return _worker_generator._render_or_error(entry, index)
+
+
+# Read size when hashing the sample image
+HASH_CHUNK_SIZE = 1 << 16
+
+# Bump when the design code changes so cached renders are redrawn
+GENERATOR_VERSION = 3
+
+# Full-page designs: the name is auto-fitted between these sizes, keeping
+# clear of the flourishes and border at the sides
+DESIGN_FONT_SIZES = (24, 96)
+DESIGN_SIDE_CLEARANCE = 80
+DESIGN_MAX_TEXT_HEIGHT = 220
+
+# Compact designs for combined sheets: auto-fit sizes, the box the name is
+# fitted to, and the padding around it
+COMPACT_FONT_SIZES = (14, 36)
+COMPACT_TEXT_BOX = (180, 60)
+COMPACT_PADDING = 20
+
 
 class NamesPDFGenerator:
-    def __init__(self, sample_image_path):
+    def __init__(
+        self, sample_image_path, output_dir="name_pdfs", font_name=DEFAULT_FONT
+    ):
         self.sample_image_path = sample_image_path
+        self.font_name = font_name
+        self.export_outlines = False
+        self.export_previews = False
+        self.export_design_svg = False
+        # Bridge width in points for the outlines (None adds no bridges)
+        self.bridge_width = None
+        self.stencil = False
+        # Cut outline compensation in points (0 leaves the geometry as drawn)
+        self.kerf = 0
+        self.min_stroke_width = 0
+        # Open bundle.JobBundle that outputs are written into instead of
+        # the output directory, and whether designs get cut estimates
+        self.bundle = None
+        self.estimate_cuts = False
+        # Overrides of estimates.DEFAULT_RATES for the cost summary
+        self.cut_rates = {}
         self.names = [
             "Jehovah Jireh",
             "Jehovah Shammah",
@@ -42,76 +129,156 @@ class NamesPDFGenerator:
             "El Gibbor",
             "Qedosh",
         ]
-        self.output_dir = "name_pdfs"
-        self.ensure_output_directory()
+        self.output_dir = output_dir
+        self.errors = []
+        self.analysis_cache_path = os.path.join(output_dir, ".sample_analysis.json")
+        self.manifest_path = os.path.join(output_dir, ".render_manifest.json")
+        self.estimates_cache_path = os.path.join(output_dir, ".cut_estimates.json")
+        self.unchanged_count = 0
+        self.contact_sheet_files = []
+        # (label, estimates.design_estimate) per name and per combined sheet
+        self.design_estimates = []
+        self.sheet_estimates = []
+
+    def __getstate__(self):
+        # Pool workers render the entries they are sent and never read the
+        # name source, which may be a large or unpicklable stream; they
+        # return their outputs rather than writing them to the bundle
+        state = self.__dict__.copy()
+        state["names"] = []
+        state["bundle"] = None
+        return state
+
+    def entries(self):
+        """
+        Iterate the name list as name entries.
+
+        self.names may be any iterable of names or entry dictionaries, such
+        as a name_sources.NameFile, and is consumed lazily.
+        """
+        for item in self.names:
+            yield normalize_entry(item)
 
     def ensure_output_directory(self):
-        """Create output directory if it doesn't exist"""
+        """
+        Create output directory if it doesn't exist.
+
+        Called before anything is written there, so a run that writes into
+        a bundle leaves no directory behind.
+        """
         if not os.path.exists(self.output_dir):
             os.makedirs(self.output_dir)
 
     def analyze_sample_image(self):
-        """Analyze the sample image to understand the style requirements"""
+        """
+        Analyze the sample image to understand the style requirements.
+
+        Results are cached in the output directory keyed by a hash of the
+        image's contents, and only the image header is read for its size.
+        """
+        sha256 = hashlib.sha256()
         try:
-            # Load the sample image
-            img = cv2.imread(self.sample_image_path)
-            if img is None:
-                print(
-                    f"Warning: Could not load sample image from {self.sample_image_path}"
-                )
-                return None
-
-            # Convert to grayscale for analysis
-            gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-
-            # Get image dimensions
-            height, width = gray.shape
-
-            # Analyze for text characteristics
-            # This is a simple analysis - in practice, you might use OCR or other techniques
-            return {
-                "width": width,
-                "height": height,
-                "dominant_color": "black",  # Assume black text for laser cutting
-                "style": "bold_serif",  # Default assumption
-            }
+            with open(self.sample_image_path, "rb") as f:
+                for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+                    sha256.update(chunk)
+        except OSError:
+            print(f"Warning: Could not load sample image from {self.sample_image_path}")
+            return None
+
+        digest = sha256.hexdigest()
+        cache = load_json_cache(self.analysis_cache_path)
+        if digest in cache:
+            return cache[digest]
+
+        # Imported here so runs that skip the analysis never load PIL
+        from PIL import Image
+
+        try:
+            # Image.open parses the header; pixel data is never decoded
+            with Image.open(self.sample_image_path) as img:
+                width, height = img.size
         except Exception as e:
             print(f"Error analyzing sample image: {e}")
             return None
 
-    def get_font_path(self):
-        """Get a suitable font path for the design"""
-        # Try to find system fonts that work well for laser cutting
-        possible_fonts = [
-            "/System/Library/Fonts/Times.ttc",  # macOS Times
-            "/System/Library/Fonts/Georgia.ttc",  # macOS Georgia
-            "/System/Library/Fonts/Helvetica.ttc",  # macOS Helvetica
-            "/usr/share/fonts/truetype/liberation/LiberationSerif-Bold.ttf",  # Linux
-            "C:\\Windows\\Fonts\\times.ttf",  # Windows
-            "C:\\Windows\\Fonts\\georgia.ttf",  # Windows
-        ]
+        # This is a simple analysis - in practice, you might use OCR or other techniques
+        analysis = {
+            "width": width,
+            "height": height,
+            "dominant_color": "black",  # Assume black text for laser cutting
+            "style": "bold_serif",  # Default assumption
+        }
+        # A bundle run writes nothing outside the archive
+        if self.bundle is None:
+            cache[digest] = analysis
+            self.ensure_output_directory()
+            save_json_cache(cache, self.analysis_cache_path)
+        return analysis
 
-        for font_path in possible_fonts:
-            if os.path.exists(font_path):
-                return font_path
+    def draw_design(
+        self, canvas_obj, name, page_width, page_height, layout="full", **overrides
+    ):
+        """
+        Draw one name's page in its layout.
 
-        return None  # Use default font
+        Args:
+            canvas_obj: reportlab canvas (or a stand-in with the same API)
+            name: Name to draw
+            page_width: Page width in points
+            page_height: Page height in points
+            layout: "full" for the decorated page, "compact" for a centred
+                compact design
+            **overrides: Per-name font_name and font_size
+        """
+        if layout == "compact":
+            width, height = self.compact_design_size(name, **overrides)
+            self.create_compact_design(
+                name,
+                canvas_obj,
+                (page_width - width) / 2,
+                (page_height - height) / 2,
+                width,
+                height,
+                margin=0,
+                **overrides,
+            )
+        else:
+            self.create_interconnected_design(
+                name, canvas_obj, page_width, page_height, **overrides
+            )
 
-    def create_interconnected_design(self, text, canvas_obj, page_width, page_height):
+    def create_interconnected_design(
+        self, text, canvas_obj, page_width, page_height, font_name=None, font_size=None
+    ):
         """Create an interconnected design suitable for laser cutting"""
 
         # Set up the canvas for laser cutting (black lines on white background)
         canvas_obj.setStrokeColor("black")
         canvas_obj.setFillColor("black")
 
-        # Calculate text positioning
-        text_width = canvas_obj.stringWidth(text, "Helvetica-Bold", 48)
+        # Fit the name to the page, wrapping long names onto two lines
+        font_name, font_size, lines = self.layout_text(
+            text,
+            font_name,
+            font_size,
+            page_width - 2 * DESIGN_SIDE_CLEARANCE,
+            DESIGN_MAX_TEXT_HEIGHT,
+            DESIGN_FONT_SIZES,
+        )
+        leading = line_height(font_name, font_size)
+        text_width = max(string_width(line, font_name, font_size) for line in lines)
         x = (page_width - text_width) / 2
-        y = page_height / 2
+        # The block of lines is centred on the page's middle baseline
+        first_y = page_height / 2 + (len(lines) - 1) * leading / 2
+        y = first_y - (len(lines) - 1) * leading
 
         # Create the main text
-        canvas_obj.setFont("Helvetica-Bold", 48)
-        canvas_obj.drawString(x, y, text)
+        canvas_obj.setFont(font_name, font_size)
+        for i, line in enumerate(lines):
+            line_width = string_width(line, font_name, font_size)
+            canvas_obj.drawString(
+                (page_width - line_width) / 2, first_y - i * leading, line
+            )
 
         # Add decorative elements for interconnectedness
         self.add_decorative_elements(
@@ -183,19 +350,141 @@ class NamesPDFGenerator:
         canvas_obj.line(right_start, flourish_y, right_start + 25, flourish_y)
         canvas_obj.circle(right_start + 30, flourish_y, 3, stroke=1, fill=1)
 
-    def create_single_pdf(self, name, index):
-        """Create a single PDF for one name"""
-        filename = f"{self.output_dir}/{index:02d}_{name.replace(' ', '_').replace('/', '_')}.pdf"
+    def output_basename(self, name, index):
+        """Output path for a name without its extension"""
+        return (
+            f"{self.output_dir}/{index:02d}_{name.replace(' ', '_').replace('/', '_')}"
+        )
+
+    def output_files(self, name, index):
+        """Every file rendering a name produces"""
+        basename = self.output_basename(name, index)
+        extensions = ["pdf"]
+        if self.export_outlines:
+            extensions += ["svg", "dxf"]
+        if self.export_previews:
+            extensions.append("png")
+        if self.export_design_svg:
+            extensions.append("design.svg")
+        return [f"{basename}.{extension}" for extension in extensions]
+
+    def render_key(self, entry):
+        """Hash of every input that affects a name entry's rendered files"""
+        inputs = {
+            "generator_version": GENERATOR_VERSION,
+            "name": entry["name"],
+            "font": entry.get("font_name", self.font_name),
+            "page_size": A4,
+            "font_size": entry.get("font_size", "auto"),
+            "layout": entry.get("layout", "full"),
+            "outlines": self.export_outlines,
+            "bridge_width": self.bridge_width,
+            "stencil": self.stencil,
+            "kerf": self.kerf,
+            "min_stroke_width": self.min_stroke_width,
+            "previews": self.export_previews,
+            "design_svg": self.export_design_svg,
+        }
+        return hashlib.sha256(json.dumps(inputs, sort_keys=True).encode()).hexdigest()
+
+    def create_single_pdf(self, name, index, **overrides):
+        """Create a single PDF for one name, with optional per-name overrides"""
+        outputs, _, failures, notes = self.render_outputs(name, index, **overrides)
+        for path, data in outputs:
+            self.write_output(path, data)
+        print(f"Created: {outputs[0][0]}")
+        for note in notes:
+            print(f"  {note}")
+        for kind, message in failures:
+            print(f"Error creating {kind} for '{name}': {message}")
+        return outputs[0][0]
+
+    def write_output(self, path, data):
+        """
+        Write one rendered file, into the job bundle when one is open.
+
+        Args:
+            path: Path in the output directory
+            data: File contents, bytes or text
+
+        Returns:
+            Where the file went
+        """
+        if self.bundle is not None:
+            return self.bundle.add(os.path.relpath(path, self.output_dir), data)
+        self.ensure_output_directory()
+        with open(path, "w" if isinstance(data, str) else "wb") as f:
+            f.write(data)
+        return path
+
+    def render_outputs(self, name, index, **overrides):
+        """
+        Render every output of one name in memory, without writing any files.
+
+        Args:
+            name: Name to render
+            index: Position of the name, used in the filenames
+            **overrides: Per-name font_name, font_size and layout
+
+        Returns:
+            Tuple of (list of (path, data) in output_files order, the
+            design's estimates.design_estimate or None, list of (output,
+            error message) for outputs that failed, list of report lines
+            about the tracing)
+        """
+        basename = self.output_basename(name, index)
+
+        # Lay the design out once; the PDF and every other output draw it
+        display_list = self.record_design(name, **overrides)
+        outputs = [(f"{basename}.pdf", self.pdf_data(name, display_list))]
+
+        # The rasterized outputs can fail on their own (a standard PDF font
+        # has no TTF to rasterize); that loses only them, never the PDF
+        failures = []
+        notes = []
+        pieces = None
+        estimate = None
+        if self.export_outlines:
+            try:
+                svg, dxf, pieces = self.outline_documents(display_list, notes)
+                outputs += [(f"{basename}.svg", svg), (f"{basename}.dxf", dxf)]
+            except Exception as e:
+                failures.append(("outlines", str(e)))
+        if self.export_previews:
+            # Imported here so PDF-only runs never load OpenCV or NumPy
+            from preview import preview_png
+
+            try:
+                outputs.append((f"{basename}.png", preview_png(display_list)))
+            except Exception as e:
+                failures.append(("preview", str(e)))
+        if self.export_design_svg:
+            from display_list import svg_document
+
+            outputs.append((f"{basename}.design.svg", svg_document(display_list)))
+        if self.estimate_cuts:
+            from estimates import ESTIMATE_SCALE, design_estimate
+
+            try:
+                if pieces is None:
+                    pieces = self.cut_pieces(display_list, ESTIMATE_SCALE)
+                estimate = design_estimate(pieces)
+            except Exception as e:
+                failures.append(("estimate", str(e)))
+        return outputs, estimate, failures, notes
+
+    def pdf_data(self, name, display_list):
+        """One name's design as PDF file data"""
+        buffer = io.BytesIO()
 
         # Create PDF with A4 size (good for laser cutting)
-        page_width, page_height = A4
-        c = canvas.Canvas(filename, pagesize=A4)
+        c = canvas.Canvas(buffer, pagesize=A4)
 
         # Set title
         c.setTitle(f"Names of God - {name}")
 
-        # Create the interconnected design
-        self.create_interconnected_design(name, c, page_width, page_height)
+        # Draw the interconnected design
+        draw_pdf(display_list, c)
 
         # Add metadata for laser cutting
         c.setSubject("Laser Cutting Design")
@@ -203,11 +492,262 @@ class NamesPDFGenerator:
 
         # Save the PDF
         c.save()
-        print(f"Created: {filename}")
+        return buffer.getvalue()
 
-        return filename
+    def record_design(self, name, **overrides):
+        """
+        Lay out one name's design on an A4 page.
+
+        Args:
+            name: Name to draw
+            **overrides: Per-name font_name, font_size and layout
+
+        Returns:
+            DisplayList of the design
+        """
+        page_width, page_height = A4
+        display_list = DisplayList(page_width, page_height)
+        self.draw_design(display_list, name, page_width, page_height, **overrides)
+        return display_list
+
+    def cut_pieces(self, display_list, scale=None, bridges=True, notes=None):
+        """
+        Trace a design into the pieces of material the laser cuts out.
+
+        Glyphs and decorative strokes are merged into one closed cut path per
+        connected piece of material, plus a path per hole. Strokes are first
+        widened to min_stroke_width, and with bridge_width set, bridges join
+        every island so the design cuts as one piece. Paths are then moved
+        half the kerf away from the material.
+
+        Args:
+            display_list: The design's DisplayList
+            scale: Raster pixels per point to trace at (the outlines'
+                default if not given)
+            bridges: Join islands with bridges when bridge_width is set
+            notes: List to append a report line of the bridges inserted to
+
+        Returns:
+            List of pieces, see outlines.trace_pieces
+        """
+        # Imported here so PDF-only runs never load OpenCV or NumPy
+        from outlines import DEFAULT_SCALE, outline_pieces
+
+        if self.min_stroke_width:
+            from kerf import widen_strokes
+
+            display_list = widen_strokes(display_list, self.min_stroke_width)
+        if self.bridge_width and bridges:
+            from bridges import add_bridges
+
+            display_list, islands, inserted = add_bridges(
+                display_list, self.bridge_width, self.stencil
+            )
+            if notes is not None:
+                notes.append(
+                    f"Bridges: {islands} islands found, {inserted} bridges inserted"
+                )
+
+        pieces = outline_pieces(display_list, scale or DEFAULT_SCALE)
+        if self.kerf:
+            from kerf import kerf_offset_pieces
+
+            pieces = kerf_offset_pieces(pieces, self.kerf, self.stencil)
+        return pieces
+
+    def outline_documents(self, display_list, notes=None):
+        """
+        SVG and DXF cut outlines of a design.
+
+        The pieces from cut_pieces are written in an order that keeps head
+        travel short, holes before outlines.
+
+        Args:
+            display_list: The design's DisplayList
+            notes: List to append report lines of the pieces, nodes and
+                cut path travel to
+
+        Returns:
+            Tuple of (SVG text, DXF text, cut pieces)
+        """
+        from outlines import PT_TO_MM, dxf_document, node_count, svg_document
+        from toolpath import cut_contours, optimize_cut_order
+
+        pieces = self.cut_pieces(display_list, notes=notes)
+        contours, travel_before, travel_after = optimize_cut_order(
+            *cut_contours(pieces)
+        )
+
+        svg = svg_document(contours, display_list.page_width, display_list.page_height)
+        dxf = dxf_document(contours)
+
+        if notes is not None:
+            notes.append(
+                f"Outlines: {len(pieces)} pieces, {node_count(contours)} nodes"
+            )
+            notes.append(
+                f"Cut path travel: {travel_before * PT_TO_MM:.0f}mm -> "
+                f"{travel_after * PT_TO_MM:.0f}mm"
+            )
+        return svg, dxf, pieces
 
-    def create_all_pdfs(self):
+    def _render_or_error(self, entry, index):
+        """Render one name entry, returning the exception instead of raising it"""
+        try:
+            return self.render_outputs(index=index, **entry)
+        except Exception as e:
+            return e
+
+    def _render_jobs(self, manifest, force, estimates=None):
+        """
+        Yield (index, entry, render key, existing filename or None) per name.
+
+        The existing filename is set when the manifest shows the name's
+        outputs are up to date, and, given cached estimates by render key,
+        the name's estimate is among them.
+        """
+        for index, entry in enumerate(self.entries(), 1):
+            outputs = self.output_files(entry["name"], index)
+            key = self.render_key(entry)
+            up_to_date = (
+                not force
+                and manifest.get(outputs[0]) == key
+                and (estimates is None or key in estimates)
+                and all(os.path.exists(path) for path in outputs)
+            )
+            yield index, entry, key, outputs[0] if up_to_date else None
+
+    def _render_stream(self, jobs, executor=None, window=1):
+        """
+        Render jobs in order, keeping at most `window` renders in flight.
+
+        Yields:
+            (index, entry, key, unchanged, filename or exception), in job order
+        """
+        pending = deque()
+        for index, entry, key, existing in jobs:
+            if existing:
+                outcome = existing
+            elif executor is not None:
+                outcome = executor.submit(_render_in_worker, entry, index)
+            else:
+                outcome = self._render_or_error(entry, index)
+            pending.append((index, entry, key, bool(existing), outcome))
+
+            while pending and (
+                len(pending) > window or not isinstance(pending[0][4], Future)
+            ):
+                *job, outcome = pending.popleft()
+                yield *job, outcome.result() if isinstance(outcome, Future) else outcome
+
+        while pending:
+            *job, outcome = pending.popleft()
+            yield *job, outcome.result() if isinstance(outcome, Future) else outcome
+
+    def render_names(self, workers=1, force=False):
+        """
+        Render every name's PDF, optionally across a process pool.
+
+        Names are streamed from self.names, with a bounded number of renders
+        in flight, so memory doesn't grow with the length of the list. A
+        name whose outputs exist and whose render_key matches the manifest
+        from the last run is left as is, unless force is set. A failing name
+        is recorded in self.errors and does not stop the batch. Files are
+        numbered by each name's position in the list, so the output is the
+        same whatever the worker count.
+
+        Args:
+            workers: Number of worker processes (1 renders in this process)
+            force: Re-render every name even if it is unchanged
+
+        Returns:
+            List of created filenames, in name order
+        """
+        self.errors = []
+        self.unchanged_count = 0
+        self.design_estimates = []
+        manifest = load_json_cache(self.manifest_path)
+        estimates = (
+            load_json_cache(self.estimates_cache_path) if self.estimate_cuts else None
+        )
+        # A bundle starts empty, so every name goes into it afresh
+        jobs = self._render_jobs(manifest, force or self.bundle is not None, estimates)
+        created_files = []
+        contact_sheets = None
+        if self.export_previews:
+            from preview import ContactSheets
+
+            contact_sheets = ContactSheets(
+                self.write_output, os.path.join(self.output_dir, "00_contact_sheet")
+            )
+
+        def collect(results):
+            for index, entry, key, unchanged, outcome in results:
+                if isinstance(outcome, Exception):
+                    self.errors.append((entry["name"], str(outcome)))
+                    print(f"Error creating PDF for '{entry['name']}': {outcome}")
+                    continue
+                if unchanged:
+                    filename = outcome
+                    png = f"{os.path.splitext(filename)[0]}.png"
+                    estimate = estimates[key] if estimates is not None else None
+                else:
+                    # Workers only render; every file is written here
+                    outputs, estimate, failures, notes = outcome
+                    files = [self.write_output(path, data) for path, data in outputs]
+                    filename = outputs[0][0]
+                    print(f"Created: {files[0]}")
+                    for note in notes:
+                        print(f"  {note}")
+                    for kind, message in failures:
+                        self.errors.append((entry["name"], f"{kind}: {message}"))
+                        print(f"Error creating {kind} for '{entry['name']}': {message}")
+                    png = dict(outputs).get(f"{os.path.splitext(filename)[0]}.png")
+                    if self.bundle is not None:
+                        self.bundle.add_design(
+                            {
+                                "index": index,
+                                **entry,
+                                "files": [
+                                    os.path.relpath(path, self.output_dir)
+                                    for path, _ in outputs
+                                ],
+                                **(estimate or {}),
+                            }
+                        )
+                if estimate is not None:
+                    estimates[key] = estimate
+                    self.design_estimates.append(
+                        (f"{index:02d} {entry['name']}", estimate)
+                    )
+                if contact_sheets is not None and png is not None:
+                    contact_sheets.add(f"{index:02d} {entry['name']}", png)
+                created_files.append(filename)
+                manifest[filename] = key
+                self.unchanged_count += unchanged
+
+        if workers > 1:
+            # The generator is sent to each worker once, not with every name
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_render_worker,
+                initargs=(self,),
+            ) as executor:
+                collect(self._render_stream(jobs, executor, window=workers * 4))
+        else:
+            collect(self._render_stream(jobs))
+
+        if contact_sheets is not None:
+            contact_sheets.flush()
+            self.contact_sheet_files = contact_sheets.paths
+        if self.bundle is None:
+            self.ensure_output_directory()
+            save_json_cache(manifest, self.manifest_path)
+            if estimates is not None:
+                save_json_cache(estimates, self.estimates_cache_path)
+        return created_files
+
+    def create_all_pdfs(self, workers=1, force=False):
         """Create PDFs for all names"""
         print("Analyzing sample image...")
         sample_analysis = self.analyze_sample_image()
@@ -217,81 +757,277 @@ class NamesPDFGenerator:
         else:
             print("Using default styling...")
 
-        print(f"\nCreating PDFs for {len(self.names)} names...")
-        created_files = []
+        print("\nCreating PDFs for all names...")
+        start = time.perf_counter()
+        created_files = self.render_names(workers, force)
+        elapsed = time.perf_counter() - start
 
-        for i, name in enumerate(self.names, 1):
-            try:
-                filename = self.create_single_pdf(name, i)
-                created_files.append(filename)
-            except Exception as e:
-                print(f"Error creating PDF for '{name}': {e}")
+        rendered = len(created_files) - self.unchanged_count
+        print(
+            f"Rendered {rendered} names in {elapsed:.2f}s "
+            f"({rendered / elapsed:.1f} names/s, {workers} worker(s)), "
+            f"{self.unchanged_count} unchanged"
+        )
+        if self.errors:
+            print(f"{len(self.errors)} name(s) failed:")
+            for name, error in self.errors:
+                print(f"  - {name}: {error}")
+
+        if self.export_previews:
+            for path in self.contact_sheet_files:
+                print(f"Contact sheet: {path}")
 
+        destination = self.bundle.path if self.bundle is not None else self.output_dir
         print(
-            f"\nCompleted! Created {len(created_files)} PDF files in '{self.output_dir}' directory."
+            f"\nCompleted! Created {len(created_files)} PDF files in '{destination}'."
         )
         print("\nLaser Cutting Notes:")
         print("- All designs use black lines on white background")
         print("- Interconnected elements ensure structural integrity")
         print("- A4 size provides good material usage")
-        print("- 2-3mm line widths recommended for most laser cutters")
+        if self.export_outlines:
+            print(
+                f"- Cut outlines widen strokes to {self.min_stroke_width / mm:.1f}mm"
+                f" and compensate a {self.kerf / mm:.2f}mm kerf"
+            )
+        else:
+            print("- 2-3mm line widths recommended for most laser cutters")
 
         return created_files
 
-    def create_combined_pdf(self):
-        """Create a single PDF with multiple names per page for efficient cutting"""
-        filename = f"{self.output_dir}/00_Combined_Names_of_God.pdf"
-        c = canvas.Canvas(filename, pagesize=A4)
-        page_width, page_height = A4
+    def create_combined_pdf(self, sheet_size=A4, spacing=3 * mm):
+        """
+        Create a single PDF with the compact designs packed onto sheets.
 
-        # Calculate layout for multiple names per page
-        names_per_page = 4
-        cols = 2
-        rows = 2
+        Each design is sized to its name and bin-packed, so short names
+        don't waste a fixed cell and long ones aren't squeezed into one.
+        Per-name font overrides apply; sizes and layouts are for the
+        single-name pages.
 
-        for page_start in range(0, len(self.names), names_per_page):
-            page_names = self.names[page_start : page_start + names_per_page]
+        Args:
+            sheet_size: (width, height) of the material sheet in points
+            spacing: Kerf/spacing margin between designs in points
 
-            for i, name in enumerate(page_names):
-                col = i % cols
-                row = i // cols
+        Returns:
+            Where the combined PDF went
+        """
+        filename = f"{self.output_dir}/00_Combined_Names_of_God.pdf"
+        sheet_width, sheet_height = sheet_size
+        buffer = io.BytesIO()
+        c = canvas.Canvas(buffer, pagesize=sheet_size)
+        self.sheet_estimates = []
 
-                # Calculate position
-                x_offset = col * (page_width / cols)
-                y_offset = (rows - row - 1) * (page_height / rows)
+        # Packing needs every size up front, so only names and fonts are kept
+        designs = []
+        sizes = []
+        for entry in self.entries():
+            font_name = entry.get("font_name")
+            try:
+                size = self.compact_design_size(entry["name"], font_name)
+            except Exception as e:
+                print(f"Skipping '{entry['name']}' on the combined sheet: {e}")
+                continue
+            if not fits_on_sheet(size, sheet_width, sheet_height, spacing):
+                print(
+                    f"Skipping '{entry['name']}' on the combined sheet: "
+                    f"{size[0] / mm:.0f}x{size[1] / mm:.0f}mm design is larger"
+                    " than the sheet"
+                )
+                continue
+            sizes.append(size)
+            designs.append((entry["name"], font_name))
+        sheets = pack_rectangles(sizes, sheet_width, sheet_height, spacing)
 
-                # Create smaller version of the design
+        for number, placed in enumerate(sheets, 1):
+            sheet = DisplayList(sheet_width, sheet_height)
+            for i, x, y in placed:
+                name, font_name = designs[i]
+                width, height = sizes[i]
                 self.create_compact_design(
-                    name, c, x_offset, y_offset, page_width / cols, page_height / rows
+                    name, sheet, x, y, width, height, margin=0, font_name=font_name
                 )
+            draw_pdf(sheet, c)
+            c.showPage()
 
-            if page_start + names_per_page < len(self.names):
-                c.showPage()
+            utilization = sheet_utilization(sizes, placed, sheet_width, sheet_height)
+            print(
+                f"Sheet {number}: {len(placed)} names, "
+                f"{utilization:.1%} material utilization"
+            )
+            estimate = None
+            if self.estimate_cuts:
+                from estimates import ESTIMATE_SCALE, design_estimate
+
+                # The names on a sheet are separate parts, so no bridges
+                try:
+                    pieces = self.cut_pieces(sheet, ESTIMATE_SCALE, bridges=False)
+                    estimate = design_estimate(pieces)
+                    self.sheet_estimates.append((f"Sheet {number}", estimate))
+                except Exception as e:
+                    print(f"Error estimating sheet {number}: {e}")
+            if self.bundle is not None:
+                self.bundle.add_sheet(
+                    {
+                        "sheet": number,
+                        "names": [designs[i][0] for i, _, _ in placed],
+                        "utilization": round(utilization, 3),
+                        **(estimate or {}),
+                    }
+                )
 
         c.save()
+        filename = self.write_output(filename, buffer.getvalue())
         print(f"Created combined PDF: {filename}")
         return filename
 
+    def create_estimates_csv(self):
+        """
+        Write a CSV of cut time and cost per name and per combined sheet.
+
+        Covers the names and sheets of the last render_names and
+        create_combined_pdf, priced at self.cut_rates.
+
+        Returns:
+            Where the CSV went
+        """
+        from estimates import cost_estimate, estimates_csv
+
+        rows = self.design_estimates + self.sheet_estimates
+        filename = self.write_output(
+            f"{self.output_dir}/00_cut_estimates.csv",
+            estimates_csv(rows, **self.cut_rates),
+        )
+        costs = [cost_estimate(estimate, **self.cut_rates) for _, estimate in rows]
+        print(
+            f"Cut estimates: {filename} ({len(self.design_estimates)} names, "
+            f"{len(self.sheet_estimates)} sheets)"
+        )
+        if self.design_estimates:
+            named = costs[: len(self.design_estimates)]
+            print(
+                f"Names: {sum(cost['machine_time_s'] for cost in named) / 60:.1f} min"
+                f" machine time, {sum(cost['cost'] for cost in named):.2f} total cost"
+            )
+        if self.sheet_estimates:
+            sheets = costs[len(self.design_estimates) :]
+            print(
+                f"Sheets: {sum(cost['machine_time_s'] for cost in sheets) / 60:.1f} min"
+                f" machine time, {sum(cost['cost'] for cost in sheets):.2f} total cost"
+            )
+        return filename
+
+    def create_multipage_pdf(self, filename=None):
+        """
+        Render every name as a page of one PDF, appending pages as it goes.
+
+        Names are streamed from self.names onto a single open canvas, so the
+        list is never held in memory.
+
+        Args:
+            filename: Output path (defaults to 00_All_Names_of_God.pdf in the
+                output directory)
+
+        Returns:
+            Tuple of (path of the PDF, number of pages)
+        """
+        if filename is None:
+            self.ensure_output_directory()
+            filename = f"{self.output_dir}/00_All_Names_of_God.pdf"
+        c = canvas.Canvas(filename, pagesize=A4)
+        c.setTitle("Names of God")
+        c.setSubject("Laser Cutting Design")
+
+        pages = 0
+        self.errors = []
+        for entry in self.entries():
+            try:
+                display_list = self.record_design(**entry)
+            except Exception as e:
+                self.errors.append((entry["name"], str(e)))
+                print(f"Error drawing page for '{entry['name']}': {e}")
+                continue
+            draw_pdf(display_list, c)
+            c.showPage()
+            pages += 1
+
+        c.save()
+        print(f"Created multi-page PDF: {filename} ({pages} pages)")
+        return filename, pages
+
+    def layout_text(
+        self, text, font_name, font_size, box_width, box_height, size_range
+    ):
+        """
+        Font, size and lines for a name.
+
+        A per-name font size is used as given, on one line; otherwise the
+        name is auto-fitted to the box within size_range.
+
+        Returns:
+            Tuple of (registered font name, font size, tuple of lines)
+        """
+        font_name = register_font(font_name or self.font_name)
+        if font_size:
+            return font_name, font_size, (text,)
+        font_size, lines = fit_text(text, font_name, box_width, box_height, *size_range)
+        return font_name, font_size, lines
+
+    def _compact_text(self, text, font_name, font_size):
+        """Font, size and lines of a compact design, and its text block size"""
+        font_name, font_size, lines = self.layout_text(
+            text, font_name, font_size, *COMPACT_TEXT_BOX, COMPACT_FONT_SIZES
+        )
+        ascent, descent = font_metrics(font_name)
+        leading = line_height(font_name, font_size)
+        block_width = max(string_width(line, font_name, font_size) for line in lines)
+        block_height = (ascent - descent) * font_size / 1000 + (
+            len(lines) - 1
+        ) * leading
+        return font_name, font_size, lines, block_width, block_height
+
+    def compact_design_size(self, text, font_name=None, font_size=None):
+        """Width and height of the compact design's border box for a name"""
+        *_, block_width, block_height = self._compact_text(text, font_name, font_size)
+        return (
+            block_width + 2 * COMPACT_PADDING,
+            block_height + 2 * COMPACT_PADDING,
+        )
+
     def create_compact_design(
-        self, text, canvas_obj, x_offset, y_offset, width, height
+        self,
+        text,
+        canvas_obj,
+        x_offset,
+        y_offset,
+        width,
+        height,
+        margin=10,
+        font_name=None,
+        font_size=None,
     ):
         """Create a compact version of the design for combined layouts"""
         canvas_obj.setStrokeColor("black")
         canvas_obj.setFillColor("black")
 
-        # Scale font size for compact layout
-        font_size = 24
-        canvas_obj.setFont("Helvetica-Bold", font_size)
-
-        # Center text in the allocated space
-        text_width = canvas_obj.stringWidth(text, "Helvetica-Bold", font_size)
-        x = x_offset + (width - text_width) / 2
-        y = y_offset + height / 2
+        # Fit the font size to the name for the compact layout
+        font_name, font_size, lines, block_width, block_height = self._compact_text(
+            text, font_name, font_size
+        )
+        canvas_obj.setFont(font_name, font_size)
 
-        canvas_obj.drawString(x, y, text)
+        # Center the block of lines in the allocated space
+        ascent, _ = font_metrics(font_name)
+        leading = line_height(font_name, font_size)
+        first_y = y_offset + (height + block_height) / 2 - ascent * font_size / 1000
+        for i, line in enumerate(lines):
+            line_width = string_width(line, font_name, font_size)
+            canvas_obj.drawString(
+                x_offset + (width - line_width) / 2, first_y - i * leading, line
+            )
+        x = x_offset + (width - block_width) / 2
+        y = first_y - (len(lines) - 1) * leading
 
         # Add simple border
-        margin = 10
         canvas_obj.setLineWidth(1)
         canvas_obj.rect(
             x_offset + margin,
@@ -303,10 +1039,172 @@ class NamesPDFGenerator:
         )
 
         # Add simple underline
-        canvas_obj.line(x - 10, y - 5, x + text_width + 10, y - 5)
+        canvas_obj.line(x - 10, y - 5, x + block_width + 10, y - 5)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Create laser-cutting PDFs for the Names of God"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Render names in N worker processes (default: 1)",
+    )
+    parser.add_argument(
+        "--font",
+        choices=[*BUNDLED_FONTS, "Helvetica-Bold"],
+        default=DEFAULT_FONT,
+        help=f"Font for the names (default: {DEFAULT_FONT})",
+    )
+    parser.add_argument(
+        "--outlines",
+        action="store_true",
+        help="Also write SVG and DXF cut outlines next to each PDF",
+    )
+    parser.add_argument(
+        "--previews",
+        action="store_true",
+        help="Also write a PNG thumbnail of each design and contact sheets",
+    )
+    parser.add_argument(
+        "--design-svg",
+        action="store_true",
+        help="Also write each design as an editable SVG with live text",
+    )
+    parser.add_argument(
+        "--bridges",
+        action="store_true",
+        help="Add bridges to the outlines so each design cuts as one piece",
+    )
+    parser.add_argument(
+        "--bridge-width",
+        type=float,
+        default=1.5,
+        help="Bridge width in mm (default: 1.5)",
+    )
+    parser.add_argument(
+        "--stencil",
+        action="store_true",
+        help="Bridge the sheet around the letters (letter counters) instead"
+        " of the letters themselves",
+    )
+    parser.add_argument(
+        "--kerf",
+        type=float,
+        default=0.2,
+        help="Laser kerf in mm; cut outlines are offset by half of it"
+        " (default: 0.2, 0 to disable)",
+    )
+    parser.add_argument(
+        "--stroke-width",
+        type=float,
+        default=2.0,
+        help="Minimum material width of decorative strokes in the cut outlines,"
+        " in mm (default: 2)",
+    )
+    parser.add_argument(
+        "--sheet",
+        type=parse_sheet_size,
+        default=A4,
+        help="Sheet size for the combined PDF: A4, A3 or WIDTHxHEIGHT in mm",
+    )
+    parser.add_argument(
+        "--spacing",
+        type=float,
+        default=3.0,
+        help="Kerf/spacing margin between designs on a sheet, in mm (default: 3)",
+    )
+    parser.add_argument(
+        "--names",
+        metavar="FILE",
+        help="Read names from a CSV, JSON, JSON Lines or text file ('-' for stdin)"
+        " instead of the built-in list. Entries may set font, size and layout",
+    )
+    parser.add_argument(
+        "--format",
+        choices=FORMATS,
+        help="Format of the --names input (default: from the file extension,"
+        " text for stdin)",
+    )
+    parser.add_argument(
+        "--single-file",
+        metavar="PDF",
+        help="Write every name as a page of one PDF instead of a file per name",
+    )
+    parser.add_argument(
+        "--estimates",
+        action="store_true",
+        help="Estimate cut length, pierces, material, machine time and cost per"
+        " name and per combined sheet, written to 00_cut_estimates.csv",
+    )
+    parser.add_argument(
+        "--cut-speed",
+        type=float,
+        default=20.0,
+        help="Cutting feed rate for --estimates, in mm/s (default: 20)",
+    )
+    parser.add_argument(
+        "--travel-speed",
+        type=float,
+        default=300.0,
+        help="Head travel rate between cuts for --estimates, in mm/s (default: 300)",
+    )
+    parser.add_argument(
+        "--pierce-time",
+        type=float,
+        default=0.5,
+        help="Seconds to pierce the material at the start of each cut path"
+        " (default: 0.5)",
+    )
+    parser.add_argument(
+        "--machine-rate",
+        type=float,
+        default=60.0,
+        help="Machine cost per hour for --estimates (default: 60)",
+    )
+    parser.add_argument(
+        "--material-rate",
+        type=float,
+        default=25.0,
+        help="Material cost per square metre of each design's bounding box"
+        " (default: 25)",
+    )
+    parser.add_argument(
+        "--bundle",
+        metavar="ARCHIVE",
+        type=parse_archive_path,
+        help="Write every output into one .zip, .tar, .tar.gz or .tgz archive,"
+        " with a manifest.json of sizes and cut estimates, instead of the"
+        " output directory",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-render every name, even those unchanged since the last run",
+    )
+    parser.add_argument(
+        "--combined-only",
+        action="store_true",
+        help="Only create the combined PDF, skipping the per-name files",
+    )
+    args = parser.parse_args()
+
+    # Outlines, previews and estimates rasterize the names from their TTFs
+    if args.font not in BUNDLED_FONTS and (
+        args.outlines or args.previews or args.estimates or args.bundle
+    ):
+        parser.error(
+            f"--font {args.font} is a standard PDF font with no TTF to rasterize;"
+            " --outlines, --previews, --estimates and --bundle need one of "
+            + ", ".join(BUNDLED_FONTS)
+        )
+    return args
 
 
 def main():
+    args = parse_args()
     sample_path = "sample.png"
 
     if not os.path.exists(sample_path):
@@ -314,13 +1212,57 @@ def main():
             f"Warning: Sample image '{sample_path}' not found. Using default styling."
         )
 
-    generator = NamesPDFGenerator(sample_path)
+    generator = NamesPDFGenerator(sample_path, font_name=args.font)
+    generator.export_outlines = args.outlines
+    generator.export_previews = args.previews
+    generator.export_design_svg = args.design_svg
+    generator.kerf = args.kerf * mm
+    generator.min_stroke_width = args.stroke_width * mm
+    if args.bridges or args.stencil:
+        generator.bridge_width = args.bridge_width * mm
+        generator.stencil = args.stencil
+    if args.names:
+        generator.names = NameFile(args.names, args.format)
+
+    if args.single_file:
+        generator.create_multipage_pdf(args.single_file)
+        return
 
-    # Create individual PDFs
-    created_files = generator.create_all_pdfs()
+    # Outputs go into the archive as they are rendered, or to the directory
+    generator.estimate_cuts = args.estimates or bool(args.bundle)
+    generator.cut_rates = {
+        "cut_speed": args.cut_speed,
+        "travel_speed": args.travel_speed,
+        "pierce_time": args.pierce_time,
+        "machine_rate": args.machine_rate,
+        "material_rate": args.material_rate,
+    }
+    bundle = (
+        JobBundle(
+            args.bundle,
+            generator_version=GENERATOR_VERSION,
+            page_size_mm=[round(size / mm, 1) for size in A4],
+            kerf_mm=args.kerf,
+            min_stroke_width_mm=args.stroke_width,
+        )
+        if args.bundle
+        else contextlib.nullcontext()
+    )
+    with bundle as generator.bundle:
+        # Create individual PDFs
+        created_files = []
+        if not args.combined_only:
+            created_files = generator.create_all_pdfs(
+                workers=args.workers, force=args.force
+            )
+
+        # Create combined PDF
+        combined_file = generator.create_combined_pdf(
+            sheet_size=args.sheet, spacing=args.spacing * mm
+        )
 
-    # Create combined PDF
-    combined_file = generator.create_combined_pdf()
+        if args.estimates:
+            generator.create_estimates_csv()
 
     print(f"\nAll files created successfully!")
     print(f"Individual PDFs: {len(created_files)} files")
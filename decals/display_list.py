@@ -0,0 +1,260 @@
+"""
+Display list: a design's geometry, laid out once and drawn by any backend.
+
+The design methods draw onto a DisplayList through the subset of the
+reportlab canvas API they use. It keeps one table per kind of element
+(text runs, line segments, rects, circles and cut bridges) and hands each
+table out as a NumPy array, so backends work on whole arrays instead of
+re-running the layout. A backend is any function taking a DisplayList:
+draw_pdf and svg_document here, and outlines.rasterize for previews and
+cut outlines.
+
+Rows are kept as tuples until an array is asked for, so building a list
+and drawing it as a PDF never imports NumPy.
+"""
+
+import hashlib
+import json
+
+from font_registry import string_width
+
+# Columns of each table, in points; stroke and fill are 0/1 flags, except a
+# bridge's fill, which is the raster value it paints (0 cuts, 255 joins)
+COLUMNS = {
+    "text": ("x", "y", "size"),
+    "lines": ("x1", "y1", "x2", "y2", "line_width"),
+    "rects": ("x", "y", "width", "height", "line_width", "stroke", "fill"),
+    "circles": ("x", "y", "r", "line_width", "stroke", "fill"),
+    "bridges": ("x1", "y1", "x2", "y2", "width", "fill"),
+}
+
+PT_TO_MM = 25.4 / 72
+
+
+class DisplayList:
+    """
+    Records the drawing calls the design methods make on a reportlab canvas.
+
+    Text runs are a (N, 3) array of x, y and font size, with the strings
+    and font names alongside in text_strings and text_fonts.
+    """
+
+    def __init__(self, page_width, page_height):
+        self.page_width = page_width
+        self.page_height = page_height
+        self.rows = {kind: [] for kind in COLUMNS}
+        self.text_strings = []
+        self.text_fonts = []
+        self._font = (None, 0)
+        self._line_width = 1
+
+    # reportlab canvas API
+
+    def setStrokeColor(self, color):
+        pass
+
+    def setFillColor(self, color):
+        pass
+
+    def setFont(self, font_name, font_size):
+        self._font = (font_name, font_size)
+
+    def setLineWidth(self, width):
+        self._line_width = width
+
+    def stringWidth(self, text, font_name, font_size):
+        return string_width(text, font_name, font_size)
+
+    def drawString(self, x, y, text):
+        font_name, font_size = self._font
+        self.rows["text"].append((x, y, font_size))
+        self.text_strings.append(text)
+        self.text_fonts.append(font_name)
+
+    def line(self, x1, y1, x2, y2):
+        self.rows["lines"].append((x1, y1, x2, y2, self._line_width))
+
+    def rect(self, x, y, width, height, stroke=1, fill=0):
+        self.rows["rects"].append(
+            (x, y, width, height, self._line_width, int(stroke), int(fill))
+        )
+
+    def circle(self, x, y, r, stroke=1, fill=0):
+        self.rows["circles"].append((x, y, r, self._line_width, int(stroke), int(fill)))
+
+    def add_bridge(self, x1, y1, x2, y2, width, fill):
+        """Add a bridge, drawn after everything else by the raster backend"""
+        self.rows["bridges"].append((x1, y1, x2, y2, width, fill))
+
+    # Arrays and comparison
+
+    def array(self, kind):
+        """One kind's table as a float (N, columns) array"""
+        import numpy as np
+
+        return np.array(self.rows[kind], dtype=float).reshape(-1, len(COLUMNS[kind]))
+
+    @property
+    def text(self):
+        return self.array("text")
+
+    @property
+    def lines(self):
+        return self.array("lines")
+
+    @property
+    def rects(self):
+        return self.array("rects")
+
+    @property
+    def circles(self):
+        return self.array("circles")
+
+    @property
+    def bridges(self):
+        return self.array("bridges")
+
+    def text_runs(self):
+        """Yield (x, y, text, font name, font size) per text run"""
+        for (x, y, size), text, font_name in zip(
+            self.rows["text"], self.text_strings, self.text_fonts
+        ):
+            yield x, y, text, font_name, size
+
+    def __len__(self):
+        return sum(len(rows) for rows in self.rows.values())
+
+    def to_dict(self):
+        """JSON-serializable form, for caching"""
+        return {
+            "page_size": [self.page_width, self.page_height],
+            "rows": {
+                kind: [list(row) for row in rows] for kind, rows in self.rows.items()
+            },
+            "text_strings": self.text_strings,
+            "text_fonts": self.text_fonts,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        display_list = cls(*data["page_size"])
+        for kind, rows in data["rows"].items():
+            display_list.rows[kind] = [tuple(row) for row in rows]
+        display_list.text_strings = list(data["text_strings"])
+        display_list.text_fonts = list(data["text_fonts"])
+        return display_list
+
+    def digest(self):
+        """Hash of the geometry; equal designs hash equal"""
+        return hashlib.sha256(
+            json.dumps(self.to_dict(), sort_keys=True).encode()
+        ).hexdigest()
+
+    def __eq__(self, other):
+        return isinstance(other, DisplayList) and self.to_dict() == other.to_dict()
+
+    def diff(self, other):
+        """
+        Elements that differ from another display list.
+
+        Returns:
+            Dictionary of kind -> (rows only in self, rows only in other)
+            for every kind that differs
+        """
+        mine, theirs = self._element_rows(), other._element_rows()
+        changes = {}
+        for kind in COLUMNS:
+            removed = [row for row in mine[kind] if row not in theirs[kind]]
+            added = [row for row in theirs[kind] if row not in mine[kind]]
+            if removed or added:
+                changes[kind] = (removed, added)
+        return changes
+
+    def _element_rows(self):
+        rows = {kind: set(rows) for kind, rows in self.rows.items()}
+        rows["text"] = set(self.text_runs())
+        return rows
+
+    def copy(self):
+        return DisplayList.from_dict(self.to_dict())
+
+
+def draw_pdf(display_list, canvas_obj):
+    """
+    Draw a display list onto a reportlab canvas page.
+
+    Args:
+        display_list: DisplayList to draw; bridges only apply to cut outlines
+        canvas_obj: reportlab canvas
+    """
+    canvas_obj.setStrokeColor("black")
+    canvas_obj.setFillColor("black")
+    current_width = None
+
+    def set_line_width(line_width):
+        nonlocal current_width
+        if line_width != current_width:
+            canvas_obj.setLineWidth(line_width)
+            current_width = line_width
+
+    for x, y, text, font_name, font_size in display_list.text_runs():
+        canvas_obj.setFont(font_name, font_size)
+        canvas_obj.drawString(x, y, text)
+    for x1, y1, x2, y2, line_width in display_list.rows["lines"]:
+        set_line_width(line_width)
+        canvas_obj.line(x1, y1, x2, y2)
+    for x, y, width, height, line_width, stroke, fill in display_list.rows["rects"]:
+        set_line_width(line_width)
+        canvas_obj.rect(x, y, width, height, stroke=stroke, fill=fill)
+    for x, y, r, line_width, stroke, fill in display_list.rows["circles"]:
+        set_line_width(line_width)
+        canvas_obj.circle(x, y, r, stroke=stroke, fill=fill)
+
+
+def svg_document(display_list):
+    """
+    A display list as an editable SVG, with the names as live text.
+
+    Args:
+        display_list: DisplayList to draw
+
+    Returns:
+        SVG document text
+    """
+    page_width, page_height = display_list.page_width, display_list.page_height
+
+    def paint(stroke, fill):
+        stroke_color = "black" if stroke else "none"
+        fill_color = "black" if fill else "none"
+        return f'stroke="{stroke_color}" fill="{fill_color}"'
+
+    lines = [
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        f'<svg xmlns="http://www.w3.org/2000/svg" '
+        f'width="{page_width * PT_TO_MM:.3f}mm" height="{page_height * PT_TO_MM:.3f}mm" '
+        f'viewBox="0 0 {page_width:.3f} {page_height:.3f}">',
+    ]
+    for x, y, text, font_name, font_size in display_list.text_runs():
+        escaped = text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+        lines.append(
+            f'<text x="{x:.3f}" y="{page_height - y:.3f}" font-family="{font_name}" '
+            f'font-size="{font_size:.3f}">{escaped}</text>'
+        )
+    for x1, y1, x2, y2, line_width in display_list.rows["lines"]:
+        lines.append(
+            f'<line x1="{x1:.3f}" y1="{page_height - y1:.3f}" x2="{x2:.3f}" '
+            f'y2="{page_height - y2:.3f}" stroke="black" stroke-width="{line_width}"/>'
+        )
+    for x, y, width, height, line_width, stroke, fill in display_list.rows["rects"]:
+        lines.append(
+            f'<rect x="{x:.3f}" y="{page_height - y - height:.3f}" '
+            f'width="{width:.3f}" height="{height:.3f}" {paint(stroke, fill)} '
+            f'stroke-width="{line_width}" stroke-linejoin="miter"/>'
+        )
+    for x, y, r, line_width, stroke, fill in display_list.rows["circles"]:
+        lines.append(
+            f'<circle cx="{x:.3f}" cy="{page_height - y:.3f}" r="{r:.3f}" '
+            f'{paint(stroke, fill)} stroke-width="{line_width}"/>'
+        )
+    lines.append("</svg>")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,141 @@
+"""
+Size, material and cutting estimates for traced designs.
+
+Everything is measured on the traced cut pieces, so the figures match the
+SVG/DXF a laser shop receives: the material area is what remains after the
+holes are cut, the cut length is the total length of every path, and each
+closed path costs one pierce. Head travel is that of the greedy cut order.
+
+Machine time and cost are worked out from these figures and the feed
+rates only when a summary is written, so changing the rates never needs a
+design to be traced again.
+"""
+
+import csv
+import io
+
+import numpy as np
+
+from kerf import perimeters, signed_areas
+from outlines import PT_TO_MM
+from toolpath import cut_contours, greedy_travel
+
+# Raster pixels per point when a design is traced only for its estimates;
+# coarser than the cut outlines, which is plenty for areas and lengths
+ESTIMATE_SCALE = 2
+
+# Machine defaults, for a CO2 laser on 3mm plywood: cutting and travel
+# speeds in mm/s, seconds per pierce, cost per machine hour and cost of
+# material per square metre of bounding box
+DEFAULT_RATES = {
+    "cut_speed": 20.0,
+    "travel_speed": 300.0,
+    "pierce_time": 0.5,
+    "machine_rate": 60.0,
+    "material_rate": 25.0,
+}
+
+# Columns of the CSV summary, after the design label
+ESTIMATE_COLUMNS = (
+    "width_mm",
+    "height_mm",
+    "bbox_area_mm2",
+    "material_area_mm2",
+    "cut_length_mm",
+    "travel_mm",
+    "pierces",
+    "machine_time_s",
+    "machine_cost",
+    "material_cost",
+    "cost",
+)
+
+
+def design_estimate(pieces):
+    """
+    Dimensions, material area and cutting figures of a design's pieces.
+
+    Args:
+        pieces: Pieces from outlines.trace_pieces (or kerf_offset_pieces)
+
+    Returns:
+        Dictionary of width_mm and height_mm of the bounding box,
+        bbox_area_mm2, material_area_mm2, cut_length_mm, travel_mm and
+        pierces
+    """
+    if not pieces:
+        return {
+            "width_mm": 0.0,
+            "height_mm": 0.0,
+            "bbox_area_mm2": 0.0,
+            "material_area_mm2": 0.0,
+            "cut_length_mm": 0.0,
+            "travel_mm": 0.0,
+            "pierces": 0,
+        }
+
+    outers = [piece["outer"] for piece in pieces]
+    holes = [hole for piece in pieces for hole in piece["holes"]]
+    area = np.abs(signed_areas(outers)).sum()
+    if holes:
+        area -= np.abs(signed_areas(holes)).sum()
+
+    points = np.concatenate(outers)
+    width, height = (points.max(axis=0) - points.min(axis=0)) * PT_TO_MM
+    return {
+        "width_mm": round(float(width), 2),
+        "height_mm": round(float(height), 2),
+        "bbox_area_mm2": round(float(width * height), 1),
+        "material_area_mm2": round(float(area) * PT_TO_MM**2, 1),
+        "cut_length_mm": round(float(perimeters(outers + holes).sum()) * PT_TO_MM, 1),
+        "travel_mm": round(greedy_travel(*cut_contours(pieces)) * PT_TO_MM, 1),
+        "pierces": len(outers) + len(holes),
+    }
+
+
+def cost_estimate(estimate, **rates):
+    """
+    Machine time and cost of cutting a design.
+
+    Args:
+        estimate: Figures from design_estimate
+        **rates: Overrides of DEFAULT_RATES
+
+    Returns:
+        Dictionary of machine_time_s, machine_cost, material_cost and cost
+    """
+    rates = {**DEFAULT_RATES, **rates}
+    seconds = (
+        estimate["cut_length_mm"] / rates["cut_speed"]
+        + estimate["travel_mm"] / rates["travel_speed"]
+        + estimate["pierces"] * rates["pierce_time"]
+    )
+    machine_cost = seconds / 3600 * rates["machine_rate"]
+    material_cost = estimate["bbox_area_mm2"] / 1e6 * rates["material_rate"]
+    return {
+        "machine_time_s": round(seconds, 1),
+        "machine_cost": round(machine_cost, 2),
+        "material_cost": round(material_cost, 2),
+        "cost": round(machine_cost + material_cost, 2),
+    }
+
+
+def estimates_csv(estimates, **rates):
+    """
+    CSV summary of designs' estimates, with machine time and cost.
+
+    Args:
+        estimates: Iterable of (label, design_estimate figures)
+        **rates: Overrides of DEFAULT_RATES
+
+    Returns:
+        CSV text with a header row and a row per design
+    """
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, ("design", *ESTIMATE_COLUMNS))
+    writer.writeheader()
+    for label, estimate in estimates:
+        writer.writerow(
+            {"design": label, **estimate, **cost_estimate(estimate, **rates)}
+        )
+    return buffer.getvalue()
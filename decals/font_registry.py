@@ -0,0 +1,102 @@
+"""
+Font registry for the TTFs bundled in decals/fonts.
+
+Each font is registered with reportlab once per process, so render pool
+workers pay the TTF parse on their first name only. reportlab embeds a
+TrueType font as a subset of the glyphs a document actually draws, so a
+PDF's size doesn't grow with the size of the font file.
+"""
+
+import os
+from functools import lru_cache
+
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFont
+
+FONTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fonts")
+
+BUNDLED_FONTS = {
+    "GreatVibes": "GreatVibes.ttf",
+    "Lobster": "Lobster.ttf",
+    "Pacifico": "Pacifico.ttf",
+}
+
+# Lobster's heavy, joined script cuts well and keeps letters connected
+DEFAULT_FONT = "Lobster"
+
+_registered_fonts = set()
+
+
+def font_path(font_name):
+    """Path to a bundled font's TTF file"""
+    return os.path.join(FONTS_DIR, BUNDLED_FONTS[font_name])
+
+
+def register_font(font_name):
+    """
+    Make a font available to reportlab, registering bundled TTFs on first use.
+
+    Args:
+        font_name: A bundled font name or one of reportlab's standard fonts
+
+    Returns:
+        The font name, ready for setFont and stringWidth
+    """
+    if font_name in _registered_fonts or font_name in pdfmetrics.standardFonts:
+        return font_name
+    if font_name not in BUNDLED_FONTS:
+        raise ValueError(
+            f"Unknown font {font_name!r}: use one of {', '.join(BUNDLED_FONTS)}"
+            " or a standard PDF font"
+        )
+    pdfmetrics.registerFont(TTFont(font_name, font_path(font_name)))
+    _registered_fonts.add(font_name)
+    return font_name
+
+
+@lru_cache(maxsize=None)
+def _glyph_widths(font_name):
+    """Per-character advance widths in 1/1000 em, or None for standard fonts"""
+    font = pdfmetrics.getFont(register_font(font_name))
+    face = getattr(font, "face", None)
+    if isinstance(getattr(face, "charWidths", None), dict):
+        return face.charWidths, face.defaultWidth
+    return None
+
+
+@lru_cache(maxsize=4096)
+def _text_units(text, font_name):
+    """Width of text at 1000pt, summed from the cached width table"""
+    widths = _glyph_widths(font_name)
+    if widths is None:
+        return pdfmetrics.stringWidth(text, font_name, 1000)
+    char_widths, default_width = widths
+    return sum(char_widths.get(ord(char), default_width) for char in text)
+
+
+def string_width(text, font_name, font_size):
+    """
+    Width of text in points, equivalent to pdfmetrics.stringWidth.
+
+    Args:
+        text: String to measure
+        font_name: Font name (bundled or standard)
+        font_size: Font size in points
+
+    Returns:
+        Width in points
+    """
+    return _text_units(text, font_name) * font_size / 1000
+
+
+def font_metrics(font_name):
+    """
+    Ascent and descent of a font in 1/1000 em.
+
+    Args:
+        font_name: Font name (bundled or standard)
+
+    Returns:
+        Tuple of (ascent, descent), descent being negative
+    """
+    return pdfmetrics.getAscentDescent(register_font(font_name))
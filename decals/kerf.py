@@ -0,0 +1,190 @@
+"""
+Kerf compensation and real material widths for cut outlines.
+
+The laser beam burns away a strip as wide as its kerf, centred on the cut
+path. To keep parts at their drawn size, every path is moved half a kerf
+away from the material it cuts around: outer contours outward, holes
+inward. All contours are offset in one pass over a single vertex array,
+so a dense combined sheet costs a handful of array operations.
+
+Hairline strokes are also widened to a minimum width before outlining,
+so decorative lines come out as closed outlines of material that survives
+being cut.
+"""
+
+import numpy as np
+from reportlab.lib.units import mm
+
+DEFAULT_KERF = 0.2 * mm
+
+# Thinnest stroke the cutter leaves intact, in points
+DEFAULT_MIN_STROKE_WIDTH = 2 * mm
+
+# Longest a mitred corner may reach, as a multiple of the offset distance;
+# sharper corners are clipped to this length
+MITER_LIMIT = 2.0
+
+# Stroke width column of each display list table that has one
+_STROKE_WIDTH_COLUMNS = {"lines": 4, "rects": 4, "circles": 3}
+
+
+def widen_strokes(display_list, min_width=DEFAULT_MIN_STROKE_WIDTH):
+    """
+    Copy of a display list with every stroke at least min_width wide.
+
+    Args:
+        display_list: DisplayList of the design
+        min_width: Minimum stroke width in points
+
+    Returns:
+        Widened DisplayList
+    """
+    widened = display_list.copy()
+    for kind, column in _STROKE_WIDTH_COLUMNS.items():
+        table = display_list.array(kind)
+        table[:, column] = np.maximum(table[:, column], min_width)
+        widened.rows[kind] = [tuple(row) for row in table.tolist()]
+    return widened
+
+
+def _neighbours(lengths):
+    """Indexes of the next and previous vertex of every vertex, per contour"""
+    starts = np.repeat(np.cumsum(lengths) - lengths, lengths)
+    sizes = np.repeat(lengths, lengths)
+    local = np.arange(len(starts)) - starts
+    return starts + (local + 1) % sizes, starts + (local - 1) % sizes
+
+
+def signed_areas(contours):
+    """
+    Shoelace area of each contour: positive counter-clockwise (y up).
+
+    Args:
+        contours: List of (N, 2) contour arrays
+
+    Returns:
+        Array of areas
+    """
+    lengths = np.array([len(contour) for contour in contours])
+    points = np.concatenate(contours)
+    following = points[_neighbours(lengths)[0]]
+    cross = points[:, 0] * following[:, 1] - following[:, 0] * points[:, 1]
+    return np.add.reduceat(cross, np.cumsum(lengths) - lengths) / 2
+
+
+def perimeters(contours):
+    """
+    Length of each closed contour.
+
+    Args:
+        contours: List of (N, 2) contour arrays
+
+    Returns:
+        Array of lengths
+    """
+    lengths = np.array([len(contour) for contour in contours])
+    points = np.concatenate(contours)
+    steps = np.hypot(*(points[_neighbours(lengths)[0]] - points).T)
+    return np.add.reduceat(steps, np.cumsum(lengths) - lengths)
+
+
+def offset_contours(contours, distances, miter_limit=MITER_LIMIT):
+    """
+    Offset closed contours with mitred corners.
+
+    Args:
+        contours: List of (N, 2) contour arrays
+        distances: Distance per contour; positive grows the area it encloses
+        miter_limit: Longest corner reach as a multiple of the distance
+
+    Returns:
+        List of offset contour arrays
+    """
+    lengths = np.array([len(contour) for contour in contours])
+    points = np.concatenate(contours)
+    following, preceding = _neighbours(lengths)
+
+    def unit_normals(edges):
+        # Right-hand normal: outward for a counter-clockwise contour
+        norms = np.hypot(*edges.T)
+        return edges[:, ::-1] * [1, -1] / np.where(norms > 0, norms, 1)[:, None]
+
+    normal_in = unit_normals(points - points[preceding])
+    normal_out = unit_normals(points[following] - points)
+
+    # The miter point sits on the bisector, 1 / cos(half the turn) away
+    cosine = (normal_in * normal_out).sum(axis=1)
+    miter = (normal_in + normal_out) / np.maximum(1 + cosine, 1e-9)[:, None]
+    reach = np.hypot(*miter.T)
+    miter *= np.minimum(1, miter_limit / np.maximum(reach, 1e-9))[:, None]
+
+    orientation = np.sign(signed_areas(contours))
+    shift = np.repeat(np.asarray(distances, dtype=float) * orientation, lengths)
+    offset = points + miter * shift[:, None]
+    return np.split(offset, np.cumsum(lengths)[:-1])
+
+
+def kerf_offset_pieces(pieces, kerf=DEFAULT_KERF, stencil=False):
+    """
+    Move traced pieces' cut paths half a kerf away from the material.
+
+    A contour that shrinks away to nothing is narrower than the kerf, and
+    the beam removes it whole, so it is dropped, along with the holes of a
+    dropped outline.
+
+    Args:
+        pieces: Pieces from outlines.trace_pieces
+        kerf: Kerf width in points
+        stencil: The sheet around the pieces is the part being kept, so
+            outlines move inward and holes outward
+
+    Returns:
+        Offset pieces, with parents renumbered
+    """
+    if not kerf or not pieces:
+        return pieces
+
+    half = -kerf / 2 if stencil else kerf / 2
+    contours = []
+    distances = []
+    for piece in pieces:
+        contours.append(piece["outer"])
+        contours.extend(piece["holes"])
+        distances += [half] + [-half] * len(piece["holes"])
+
+    offset = offset_contours(contours, distances)
+    before = signed_areas(contours)
+    after = signed_areas(offset)
+    # A shrunk contour that collapsed has flipped, or come out no smaller
+    shrunk = np.asarray(distances) < 0
+    kept = (np.sign(after) == np.sign(before)) & (
+        ~shrunk | (np.abs(after) < np.abs(before))
+    )
+
+    result = []
+    piece_ids = {}
+    hole_ids = []
+    k = 0
+    for p, piece in enumerate(pieces):
+        outer_kept, outer = kept[k], offset[k]
+        k += 1
+        holes = []
+        hole_ids.append({})
+        for h in range(len(piece["holes"])):
+            if kept[k]:
+                hole_ids[p][h] = len(holes)
+                holes.append(offset[k])
+            k += 1
+        if outer_kept:
+            piece_ids[p] = len(result)
+            result.append({**piece, "outer": outer, "holes": holes})
+
+    for piece in result:
+        if piece["parent"] is not None:
+            p, h = piece["parent"]
+            if p in piece_ids and h in hole_ids[p]:
+                piece["parent"] = (piece_ids[p], hole_ids[p][h])
+            else:
+                piece["parent"] = None
+
+    return result
@@ -0,0 +1,131 @@
+"""
+Name lists for NamesPDFGenerator from CSV, JSON, JSON Lines, text or stdin.
+
+Every entry is a dictionary with a "name" and optional per-name overrides:
+"font_name", "font_size" and "layout" ("full" page design or "compact").
+Sources are read lazily, one entry at a time, so a list of any length is
+streamed through rendering without being held in memory.
+"""
+
+import csv
+import json
+import os
+import shutil
+import sys
+import tempfile
+
+FORMATS = ("csv", "json", "jsonl", "text")
+LAYOUTS = ("full", "compact")
+
+# Column/key spellings accepted for each override
+FIELD_ALIASES = {
+    "name": "name",
+    "font": "font_name",
+    "font_name": "font_name",
+    "size": "font_size",
+    "font_size": "font_size",
+    "layout": "layout",
+}
+
+
+def normalize_entry(item):
+    """
+    Turn a name or a dictionary from any source into a name entry.
+
+    Args:
+        item: A name string, or a mapping with a name and optional overrides
+
+    Returns:
+        Dictionary with "name" plus any of "font_name", "font_size", "layout"
+    """
+    if isinstance(item, str):
+        return {"name": item}
+
+    entry = {}
+    for key, value in item.items():
+        field = FIELD_ALIASES.get(str(key).strip().lower())
+        if field is None or value is None or str(value).strip() == "":
+            continue
+        entry[field] = value.strip() if isinstance(value, str) else value
+
+    if not entry.get("name"):
+        raise ValueError(f"Name entry without a name: {item!r}")
+    if "font_size" in entry:
+        entry["font_size"] = float(entry["font_size"])
+    if entry.get("layout", "full") not in LAYOUTS:
+        raise ValueError(
+            f"Unknown layout {entry['layout']!r} for {entry['name']!r}: "
+            f"use one of {', '.join(LAYOUTS)}"
+        )
+    return entry
+
+
+def detect_format(path):
+    """Guess a source's format from its file extension (stdin is text)"""
+    extension = os.path.splitext(path)[1].lower().lstrip(".")
+    if extension in ("jsonl", "ndjson"):
+        return "jsonl"
+    if extension in FORMATS:
+        return extension
+    return "text"
+
+
+def iter_entries(stream, fmt):
+    """
+    Yield name entries from an open text stream.
+
+    JSON documents are parsed whole; use JSON Lines for very large lists.
+
+    Args:
+        stream: Text stream to read
+        fmt: One of FORMATS
+
+    Yields:
+        Name entry dictionaries
+    """
+    if fmt == "csv":
+        for row in csv.DictReader(stream):
+            yield normalize_entry(row)
+    elif fmt == "json":
+        for item in json.load(stream):
+            yield normalize_entry(item)
+    elif fmt == "jsonl":
+        for line in stream:
+            if line.strip():
+                yield normalize_entry(json.loads(line))
+    elif fmt == "text":
+        for line in stream:
+            if line.strip():
+                yield normalize_entry(line.strip())
+    else:
+        raise ValueError(f"Unknown name list format {fmt!r}")
+
+
+class NameFile:
+    """
+    A re-iterable name source backed by a file or stdin.
+
+    Each iteration re-reads the file, so several passes (per-name PDFs, then
+    the combined sheet) never hold the list in memory. stdin can only be read
+    once, so it is spooled to a temporary file on the first pass.
+    """
+
+    def __init__(self, path, fmt=None):
+        self.path = path
+        self.fmt = fmt or detect_format(path)
+        self._spool = None
+
+    def _stdin_spool(self):
+        if self._spool is None:
+            self._spool = tempfile.TemporaryFile("w+", newline="", encoding="utf-8")
+            shutil.copyfileobj(sys.stdin, self._spool)
+        self._spool.seek(0)
+        return self._spool
+
+    def __iter__(self):
+        if self.path == "-":
+            yield from iter_entries(self._stdin_spool(), self.fmt)
+            return
+
+        with open(self.path, "r", newline="", encoding="utf-8") as stream:
+            yield from iter_entries(stream, self.fmt)
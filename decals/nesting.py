@@ -0,0 +1,160 @@
+"""
+Rectangle packing of designs onto material sheets.
+
+Uses the MaxRects algorithm with the best-short-side-fit rule: every sheet
+keeps a list of maximal free rectangles, and each design goes into the
+free rectangle where it leaves the smallest leftover strip. Designs are
+packed largest first, onto the first open sheet they fit.
+"""
+
+import re
+
+from reportlab.lib.pagesizes import A3, A4
+from reportlab.lib.units import mm
+
+SHEET_SIZES = {"A4": A4, "A3": A3}
+
+
+def parse_sheet_size(value):
+    """
+    Parse a sheet size name or custom material dimensions.
+
+    Args:
+        value: "A4", "A3", or "<width>x<height>" in millimetres (e.g. "600x400")
+
+    Returns:
+        Tuple of (width, height) in points
+    """
+    if value.upper() in SHEET_SIZES:
+        return SHEET_SIZES[value.upper()]
+
+    match = re.fullmatch(r"\s*([\d.]+)\s*x\s*([\d.]+)\s*(mm)?\s*", value, re.I)
+    if not match:
+        raise ValueError(
+            f"Unknown sheet size {value!r}: use A4, A3 or WIDTHxHEIGHT in mm"
+        )
+    return float(match.group(1)) * mm, float(match.group(2)) * mm
+
+
+class _Sheet:
+    """Free-space bookkeeping for one sheet"""
+
+    def __init__(self, width, height):
+        self.free = [(0.0, 0.0, width, height)]
+
+    def find(self, width, height):
+        """Best-short-side-fit position for a width x height item, or None"""
+        best = None
+        for fx, fy, fw, fh in self.free:
+            if width <= fw and height <= fh:
+                score = (min(fw - width, fh - height), max(fw - width, fh - height))
+                if best is None or score < best[0]:
+                    best = (score, fx, fy)
+        return None if best is None else best[1:]
+
+    def place(self, x, y, width, height):
+        """Carve a placed item out of every free rectangle it overlaps"""
+        split = []
+        for fx, fy, fw, fh in self.free:
+            if x >= fx + fw or x + width <= fx or y >= fy + fh or y + height <= fy:
+                split.append((fx, fy, fw, fh))
+                continue
+            if x > fx:
+                split.append((fx, fy, x - fx, fh))
+            if x + width < fx + fw:
+                split.append((x + width, fy, fx + fw - x - width, fh))
+            if y > fy:
+                split.append((fx, fy, fw, y - fy))
+            if y + height < fy + fh:
+                split.append((fx, y + height, fw, fy + fh - y - height))
+
+        # Drop free rectangles contained in another one
+        self.free = [
+            rect
+            for i, rect in enumerate(split)
+            if not any(
+                i != j
+                and other[0] <= rect[0]
+                and other[1] <= rect[1]
+                and other[0] + other[2] >= rect[0] + rect[2]
+                and other[1] + other[3] >= rect[1] + rect[3]
+                and (other != rect or j < i)
+                for j, other in enumerate(split)
+            )
+        ]
+
+
+def fits_on_sheet(size, sheet_width, sheet_height, spacing=0.0):
+    """Whether a design fits on an empty sheet with its spacing margins"""
+    width, height = size
+    return width + 2 * spacing <= sheet_width and height + 2 * spacing <= sheet_height
+
+
+def pack_rectangles(sizes, sheet_width, sheet_height, spacing=0.0):
+    """
+    Pack rectangles onto as few sheets as possible.
+
+    Designs are kept at least `spacing` apart and away from the sheet edge.
+    A design too large for a sheet (see fits_on_sheet) is left off every
+    sheet rather than failing the whole packing.
+
+    Args:
+        sizes: List of (width, height) per design, in points
+        sheet_width: Sheet width in points
+        sheet_height: Sheet height in points
+        spacing: Kerf/spacing margin in points
+
+    Returns:
+        List of sheets, each a list of (design index, x, y) with (x, y) the
+        bottom-left corner of the design on the sheet
+    """
+    # Each design claims its spacing on the right and top; the sheet loses
+    # one spacing on its left and bottom edges to match
+    usable_width = sheet_width - spacing
+    usable_height = sheet_height - spacing
+
+    order = sorted(
+        range(len(sizes)),
+        key=lambda i: (sizes[i][0] * sizes[i][1], sizes[i][1]),
+        reverse=True,
+    )
+
+    sheets = []
+    placements = []
+    for i in order:
+        if not fits_on_sheet(sizes[i], sheet_width, sheet_height, spacing):
+            continue
+        width, height = sizes[i][0] + spacing, sizes[i][1] + spacing
+
+        for sheet, placed in zip(sheets, placements):
+            position = sheet.find(width, height)
+            if position is not None:
+                break
+        else:
+            sheet, placed = _Sheet(usable_width, usable_height), []
+            sheets.append(sheet)
+            placements.append(placed)
+            position = sheet.find(width, height)
+
+        sheet.place(*position, width, height)
+        placed.append((i, position[0] + spacing, position[1] + spacing))
+
+    # Designs keep their input order within each sheet
+    return [sorted(placed) for placed in placements]
+
+
+def sheet_utilization(sizes, placed, sheet_width, sheet_height):
+    """
+    Fraction of a sheet's area covered by its designs' bounding boxes.
+
+    Args:
+        sizes: List of (width, height) per design, in points
+        placed: One sheet from pack_rectangles
+        sheet_width: Sheet width in points
+        sheet_height: Sheet height in points
+
+    Returns:
+        Utilization between 0 and 1
+    """
+    used = sum(sizes[i][0] * sizes[i][1] for i, _, _ in placed)
+    return used / (sheet_width * sheet_height)
@@ -0,0 +1,247 @@
+"""
+Vector outline export of name designs for laser cutters.
+
+A design's display list is rasterized at high resolution and traced back
+into closed contours. Rasterizing merges every overlapping glyph and stroke,
+so each connected piece of material comes out as one outer cut path plus
+the holes inside it.
+"""
+
+import math
+
+import cv2
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont
+
+from display_list import PT_TO_MM
+from font_registry import BUNDLED_FONTS, font_path
+
+# Raster pixels per point: 8 px/pt resolves contours to ~0.03mm
+DEFAULT_SCALE = 8
+
+# Maximum deviation of the simplified contours from the traced ones, in points
+DEFAULT_TOLERANCE = 0.1
+
+
+def _stroke_polygons(segments, widths, extend=0.0):
+    """
+    Corners of butt-capped strokes, optionally extended past both ends.
+
+    Args:
+        segments: (N, 4) array of x1, y1, x2, y2
+        widths: (N,) stroke widths
+        extend: Scalar or (N,) distance to extend each end by
+
+    Returns:
+        (N, 4, 2) array of corners
+    """
+    start, end = segments[:, :2], segments[:, 2:4]
+    lengths = np.hypot(*(end - start).T)
+    direction = (end - start) / np.where(lengths > 0, lengths, 1)[:, None]
+    normal = direction[:, ::-1] * [-1, 1] * (np.asarray(widths) / 2)[:, None]
+    extend = np.broadcast_to(np.asarray(extend, dtype=float), len(segments))[:, None]
+    start = start - direction * extend
+    end = end + direction * extend
+    return np.stack([start + normal, end + normal, end - normal, start - normal], 1)
+
+
+def rasterize(display_list, scale=DEFAULT_SCALE):
+    """
+    Render a display list into a binary material mask.
+
+    Args:
+        display_list: DisplayList of the design
+        scale: Raster pixels per point
+
+    Returns:
+        uint8 array (rows from the top of the page), 255 where there is material
+    """
+    page_width, page_height = display_list.page_width, display_list.page_height
+    image = Image.new(
+        "L", (math.ceil(page_width * scale), math.ceil(page_height * scale))
+    )
+    draw = ImageDraw.Draw(image)
+
+    def to_pixels(points):
+        """Page points (..., 2) to pixel coordinates"""
+        return np.stack(
+            [points[..., 0] * scale, (page_height - points[..., 1]) * scale], -1
+        )
+
+    def fill_polygons(polygons, fill=255):
+        fills = np.broadcast_to(fill, len(polygons))
+        for polygon, value in zip(to_pixels(polygons), fills):
+            draw.polygon(polygon.ravel().tolist(), fill=int(value))
+
+    for x, y, text, font_name, font_size in display_list.text_runs():
+        if font_name not in BUNDLED_FONTS:
+            raise ValueError(f"Rasterizing needs a bundled TTF font, not {font_name!r}")
+        font = ImageFont.truetype(font_path(font_name), font_size * scale)
+        position = (x * scale, (page_height - y) * scale)
+        draw.text(position, text, font=font, fill=255, anchor="ls")
+
+    lines = display_list.lines
+    fill_polygons(_stroke_polygons(lines[:, :4], lines[:, 4]))
+
+    rects = display_list.rects
+    x, y, w, h = rects[:, :4].T
+    corners = np.stack(
+        [
+            np.column_stack(corner)
+            for corner in ((x, y), (x + w, y), (x + w, y + h), (x, y + h))
+        ],
+        1,
+    )
+    fill_polygons(corners[rects[:, 6] > 0])
+    # Rect sides overlap by half the width so the corners come out square
+    stroked = rects[:, 5] > 0
+    sides = np.concatenate(
+        [corners[stroked], np.roll(corners[stroked], -1, axis=1)], -1
+    ).reshape(-1, 4)
+    side_widths = np.repeat(rects[stroked, 4], 4)
+    fill_polygons(_stroke_polygons(sides, side_widths, side_widths / 2))
+
+    for x, y, r, width, stroke, fill in display_list.circles:
+        outer = r + width / 2 if stroke else r
+        box = to_pixels(np.array([(x - outer, y + outer), (x + outer, y - outer)]))
+        if fill:
+            draw.ellipse(box.ravel().tolist(), fill=255)
+        elif stroke:
+            draw.ellipse(
+                box.ravel().tolist(), outline=255, width=max(1, round(width * scale))
+            )
+
+    # Bridges go last: a fill of 0 cuts through the material
+    bridges = display_list.bridges
+    fill_polygons(_stroke_polygons(bridges[:, :4], bridges[:, 4]), bridges[:, 5])
+
+    return np.asarray(image)
+
+
+def trace_pieces(mask, page_height, scale=DEFAULT_SCALE, tolerance=DEFAULT_TOLERANCE):
+    """
+    Trace a material mask into pieces made of an outer contour and its holes.
+
+    Args:
+        mask: Material mask from rasterize
+        page_height: Page height in points
+        scale: Raster pixels per point the mask was drawn at
+        tolerance: Simplification tolerance in points
+
+    Returns:
+        List of {"outer": array, "holes": [array, ...], "depth": int,
+        "parent": (piece index, hole index) or None}, with contours as
+        (N, 2) float arrays of page coordinates in points. depth counts the
+        pieces enclosing this one and parent names the hole it sits in.
+    """
+    contours, hierarchy = cv2.findContours(mask, cv2.RETR_TREE, cv2.CHAIN_APPROX_SIMPLE)
+    if hierarchy is None:
+        return []
+    hierarchy = hierarchy[0]
+
+    def to_points(contour):
+        simplified = cv2.approxPolyDP(contour, tolerance * scale, True)[:, 0, :]
+        points = simplified.astype(float) / scale
+        points[:, 1] = page_height - points[:, 1]
+        return points
+
+    depths = np.zeros(len(contours), dtype=int)
+    for i in range(len(contours)):
+        parent = hierarchy[i][3]
+        while parent != -1:
+            depths[i] += 1
+            parent = hierarchy[parent][3]
+
+    # Even depths are material outlines, odd depths the holes inside them
+    piece_ids = {}
+    for i, contour in enumerate(contours):
+        if depths[i] % 2 == 0 and len(contour) >= 3:
+            piece_ids[i] = len(piece_ids)
+
+    holes = {i: [] for i in piece_ids}
+    hole_ids = {}
+    for i, contour in enumerate(contours):
+        owner = hierarchy[i][3]
+        if depths[i] % 2 and len(contour) >= 3 and owner in holes:
+            hole_ids[i] = len(holes[owner])
+            holes[owner].append(to_points(contour))
+
+    pieces = []
+    for i in piece_ids:
+        hole = hierarchy[i][3]
+        parent = None
+        if hole in hole_ids:
+            parent = (piece_ids[hierarchy[hole][3]], hole_ids[hole])
+        pieces.append(
+            {
+                "outer": to_points(contours[i]),
+                "holes": holes[i],
+                "depth": depths[i] // 2,
+                "parent": parent,
+            }
+        )
+
+    return pieces
+
+
+def outline_pieces(display_list, scale=DEFAULT_SCALE, tolerance=DEFAULT_TOLERANCE):
+    """Rasterize a display list and trace it into cut pieces"""
+    mask = rasterize(display_list, scale)
+    return trace_pieces(mask, display_list.page_height, scale, tolerance)
+
+
+def node_count(contours):
+    """Total number of vertices across a list of contours"""
+    return sum(len(contour) for contour in contours)
+
+
+def svg_document(contours, page_width, page_height):
+    """
+    Contours as SVG paths in cutting order, sized in millimetres.
+
+    Args:
+        contours: List of (N, 2) contour arrays in points
+        page_width: Page width in points
+        page_height: Page height in points
+
+    Returns:
+        SVG document text
+    """
+    lines = [
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        f'<svg xmlns="http://www.w3.org/2000/svg" '
+        f'width="{page_width * PT_TO_MM:.3f}mm" height="{page_height * PT_TO_MM:.3f}mm" '
+        f'viewBox="0 0 {page_width:.3f} {page_height:.3f}">',
+        '<g fill="none" stroke="#ff0000" stroke-width="0.25">',
+    ]
+    for contour in contours:
+        points = " L".join(f"{x:.3f},{page_height - y:.3f}" for x, y in contour)
+        lines.append(f'<path d="M{points} Z"/>')
+    lines += ["</g>", "</svg>"]
+    return "\n".join(lines) + "\n"
+
+
+def dxf_document(contours):
+    """
+    Contours as closed polylines in a minimal R12 DXF, in millimetres.
+
+    Args:
+        contours: List of (N, 2) contour arrays in points, in cutting order
+
+    Returns:
+        DXF document text
+    """
+    pairs = [
+        (0, "SECTION"), (2, "HEADER"),
+        (9, "$ACADVER"), (1, "AC1009"),
+        (9, "$INSUNITS"), (70, 4),
+        (0, "ENDSEC"),
+        (0, "SECTION"), (2, "ENTITIES"),
+    ]  # fmt: skip
+    for contour in contours:
+        pairs += [(0, "POLYLINE"), (8, "CUT"), (66, 1), (70, 1)]
+        for x, y in contour * PT_TO_MM:
+            pairs += [(0, "VERTEX"), (8, "CUT"), (10, f"{x:.4f}"), (20, f"{y:.4f}")]
+        pairs.append((0, "SEQEND"))
+    pairs += [(0, "ENDSEC"), (0, "EOF")]
+    return "".join(f"{code}\n{value}\n" for code, value in pairs)
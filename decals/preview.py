@@ -0,0 +1,136 @@
+"""
+PNG previews of name designs, for checking a batch without a PDF reader.
+
+Previews are drawn from a design's display list, the same geometry its
+PDF is drawn from, by the PIL rasterizer the outlines already use.
+Thumbnails are drawn at SUPERSAMPLE times their size and box-filtered down
+for smooth edges.
+"""
+
+import io
+import math
+
+from PIL import Image, ImageDraw, ImageFont
+
+from outlines import rasterize
+
+# Thumbnail width in pixels; the height follows the page's aspect ratio
+THUMBNAIL_WIDTH = 300
+
+# Thumbnails are rasterized this many times larger, then reduced
+SUPERSAMPLE = 4
+
+# Contact sheet layout: thumbnails per row and per sheet, spacing in pixels
+CONTACT_SHEET_COLUMNS = 5
+CONTACT_SHEET_SIZE = 30
+CONTACT_SHEET_GAP = 12
+CAPTION_HEIGHT = 22
+
+
+def render_preview(display_list, width=THUMBNAIL_WIDTH):
+    """
+    Rasterize a display list into a thumbnail.
+
+    Args:
+        display_list: DisplayList of the design
+        width: Thumbnail width in pixels
+
+    Returns:
+        Grayscale PIL image, black design on white
+    """
+    scale = width * SUPERSAMPLE / display_list.page_width
+    mask = rasterize(display_list, scale)
+    image = Image.fromarray(255 - mask)
+    return image.reduce(SUPERSAMPLE)
+
+
+def preview_png(display_list, width=THUMBNAIL_WIDTH):
+    """A design's thumbnail as PNG file data"""
+    buffer = io.BytesIO()
+    render_preview(display_list, width).save(buffer, format="PNG", optimize=True)
+    return buffer.getvalue()
+
+
+def contact_sheet_png(previews, columns=CONTACT_SHEET_COLUMNS):
+    """
+    Lay thumbnails out in a captioned grid on one image.
+
+    Args:
+        previews: List of (caption, thumbnail PNG path or PNG data)
+        columns: Thumbnails per row
+
+    Returns:
+        The contact sheet as PNG file data
+    """
+    thumbnails = [
+        (caption, Image.open(io.BytesIO(png) if isinstance(png, bytes) else png))
+        for caption, png in previews
+    ]
+    cell_width = max(image.width for _, image in thumbnails)
+    cell_height = max(image.height for _, image in thumbnails) + CAPTION_HEIGHT
+    columns = min(columns, len(thumbnails))
+    rows = math.ceil(len(thumbnails) / columns)
+
+    sheet = Image.new(
+        "L",
+        (
+            columns * (cell_width + CONTACT_SHEET_GAP) + CONTACT_SHEET_GAP,
+            rows * (cell_height + CONTACT_SHEET_GAP) + CONTACT_SHEET_GAP,
+        ),
+        color=200,
+    )
+    draw = ImageDraw.Draw(sheet)
+    font = ImageFont.load_default(size=CAPTION_HEIGHT - 8)
+
+    for k, (caption, image) in enumerate(thumbnails):
+        x = CONTACT_SHEET_GAP + (k % columns) * (cell_width + CONTACT_SHEET_GAP)
+        y = CONTACT_SHEET_GAP + (k // columns) * (cell_height + CONTACT_SHEET_GAP)
+        sheet.paste(image, (x, y))
+        draw.text(
+            (x + cell_width / 2, y + cell_height - CAPTION_HEIGHT / 2),
+            caption,
+            fill=0,
+            font=font,
+            anchor="mm",
+        )
+        image.close()
+
+    buffer = io.BytesIO()
+    sheet.save(buffer, format="PNG", optimize=True)
+    return buffer.getvalue()
+
+
+class ContactSheets:
+    """
+    Builds contact sheets as thumbnails arrive, per_sheet at a time.
+
+    Only one sheet's worth of thumbnails is held at once, however long the
+    batch. Sheets are named <basename>_01.png, <basename>_02.png, ...
+
+    Args:
+        write: Called with (path, PNG data) for each finished sheet; its
+            return value is collected in self.paths
+        basename: Path prefix of the sheets
+        per_sheet: Thumbnails per contact sheet
+    """
+
+    def __init__(self, write, basename, per_sheet=CONTACT_SHEET_SIZE):
+        self.write = write
+        self.basename = basename
+        self.per_sheet = per_sheet
+        self.pending = []
+        self.paths = []
+
+    def add(self, caption, png):
+        """Add a thumbnail, given as a PNG path or PNG data"""
+        self.pending.append((caption, png))
+        if len(self.pending) >= self.per_sheet:
+            self.flush()
+
+    def flush(self):
+        """Write out the thumbnails added since the last sheet"""
+        if not self.pending:
+            return
+        path = f"{self.basename}_{len(self.paths) + 1:02d}.png"
+        self.paths.append(self.write(path, contact_sheet_png(self.pending)))
+        self.pending = []
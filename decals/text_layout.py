@@ -0,0 +1,90 @@
+"""
+Auto-fit sizing and line wrapping of names into a box.
+
+Widths come from font_registry.string_width, whose per-font width tables
+and per-(text, font) widths are cached, so each step of the binary search
+is a multiplication rather than a walk over the glyphs. Whole fits are
+memoized too, since large batches repeat the same names and boxes.
+"""
+
+import math
+from functools import lru_cache
+from itertools import combinations
+
+from font_registry import font_metrics, register_font, string_width
+
+# Baseline-to-baseline distance as a multiple of the font's ascent - descent
+LINE_SPACING = 1.05
+
+# Stop the binary search once the size is known to this many points
+SIZE_PRECISION = 0.1
+
+
+def line_height(font_name, font_size):
+    """Baseline-to-baseline distance for a font at a size, in points"""
+    ascent, descent = font_metrics(font_name)
+    return (ascent - descent) * font_size / 1000 * LINE_SPACING
+
+
+def wrap_candidates(text, max_lines):
+    """
+    Every way to break text into 1..max_lines lines at word boundaries.
+
+    Yields:
+        Tuples of lines
+    """
+    words = text.split()
+    for line_count in range(1, min(max_lines, len(words)) + 1):
+        for breaks in combinations(range(1, len(words)), line_count - 1):
+            bounds = (0, *breaks, len(words))
+            yield tuple(
+                " ".join(words[start:end]) for start, end in zip(bounds, bounds[1:])
+            )
+
+
+def _fits(lines, font_name, font_size, box_width, box_height):
+    if len(lines) * line_height(font_name, font_size) > box_height:
+        return False
+    return all(string_width(line, font_name, font_size) <= box_width for line in lines)
+
+
+@lru_cache(maxsize=4096)
+def fit_text(text, font_name, box_width, box_height, min_size, max_size, max_lines=2):
+    """
+    Find the largest font size, and the line breaks, that fit text in a box.
+
+    Each way of wrapping the text is binary-searched for its largest size
+    that fits; the wrapping with the largest size wins, fewer lines on a tie.
+
+    Args:
+        text: Text to fit
+        font_name: Font name (bundled or standard)
+        box_width: Available width in points
+        box_height: Available height in points for all lines
+        min_size: Smallest allowed font size; used even if it overflows
+        max_size: Largest allowed font size
+        max_lines: Most lines the text may be wrapped onto
+
+    Returns:
+        Tuple of (font size, tuple of lines)
+    """
+    font_name = register_font(font_name)
+    best_size, best_lines = min_size, (text,)
+
+    for lines in wrap_candidates(text, max_lines):
+        low, high = min_size, max_size
+        if not _fits(lines, font_name, low, box_width, box_height):
+            continue
+        while high - low > SIZE_PRECISION:
+            middle = (low + high) / 2
+            if _fits(lines, font_name, middle, box_width, box_height):
+                low = middle
+            else:
+                high = middle
+        if _fits(lines, font_name, high, box_width, box_height):
+            low = high
+        if low > best_size + SIZE_PRECISION:
+            best_size, best_lines = low, lines
+
+    # Round down so the reported size still fits
+    return round(math.floor(best_size / SIZE_PRECISION) * SIZE_PRECISION, 1), best_lines
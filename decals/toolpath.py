@@ -0,0 +1,244 @@
+"""
+Cut ordering that keeps the laser head's non-cutting travel short.
+
+Every contour is closed, so the head can enter it at any vertex and leaves
+from the same point. Ordering is a precedence-constrained tour: a hole is
+cut before the outline around it, and a piece sitting inside a hole is cut
+before that hole, so nothing drops out of the sheet before it is finished.
+"""
+
+import numpy as np
+
+# Laser heads home to the sheet origin, the bottom-left corner of the page
+DEFAULT_START = (0.0, 0.0)
+
+MAX_TWO_OPT_PASSES = 20
+
+
+def cut_contours(pieces):
+    """
+    Flatten traced pieces into contours with their cutting precedence.
+
+    Args:
+        pieces: Pieces from outlines.trace_pieces
+
+    Returns:
+        Tuple of (contours, predecessors): contours in trace order, and for
+        each one the set of contour indexes that must be cut before it
+    """
+    contours = []
+    outer_ids = []
+    hole_ids = []
+    for piece in pieces:
+        outer_ids.append(len(contours))
+        contours.append(piece["outer"])
+        hole_ids.append(list(range(len(contours), len(contours) + len(piece["holes"]))))
+        contours.extend(piece["holes"])
+
+    predecessors = [set() for _ in contours]
+    for p, piece in enumerate(pieces):
+        predecessors[outer_ids[p]].update(hole_ids[p])
+        if piece["parent"] is not None:
+            parent_piece, parent_hole = piece["parent"]
+            predecessors[hole_ids[parent_piece][parent_hole]].add(outer_ids[p])
+
+    return contours, predecessors
+
+
+def _entry_points(contours, order, start):
+    """Nearest vertex of each contour to where the head was left"""
+    position = np.asarray(start, dtype=float)
+    entries = []
+    for i in order:
+        contour = contours[i]
+        vertex = int(np.argmin(((contour - position) ** 2).sum(axis=1)))
+        entries.append(vertex)
+        position = contour[vertex]
+    return entries
+
+
+def travel_distance(contours, order, entries, start=DEFAULT_START):
+    """
+    Total non-cutting travel for a cut order.
+
+    Args:
+        contours: List of (N, 2) contour arrays
+        order: Contour indexes in cutting order
+        entries: Entry vertex for each contour in order
+        start: Head position before the first cut
+
+    Returns:
+        Travel distance in the contours' units
+    """
+    if not order:
+        return 0.0
+    points = np.array(
+        [start] + [contours[i][vertex] for i, vertex in zip(order, entries)]
+    )
+    return float(np.hypot(*np.diff(points, axis=0).T).sum())
+
+
+def nearest_neighbour_order(contours, predecessors, start=DEFAULT_START):
+    """
+    Greedy order: always move to the closest contour that is ready to cut.
+
+    Args:
+        contours: List of (N, 2) contour arrays
+        predecessors: Sets of contour indexes that must be cut first
+        start: Head position before the first cut
+
+    Returns:
+        List of contour indexes in cutting order
+    """
+    # All vertices in one array so each step is a single vectorized distance
+    vertices = np.concatenate(contours)
+    owners = np.repeat(np.arange(len(contours)), [len(c) for c in contours])
+
+    remaining = [set(p) for p in predecessors]
+    dependents = [[] for _ in contours]
+    for i, preds in enumerate(predecessors):
+        for pred in preds:
+            dependents[pred].append(i)
+
+    ready = np.array([not preds for preds in remaining])
+    done = np.zeros(len(contours), dtype=bool)
+    position = np.asarray(start, dtype=float)
+    order = []
+
+    while len(order) < len(contours):
+        candidates = ready[owners] & ~done[owners]
+        distances = np.where(
+            candidates, ((vertices - position) ** 2).sum(axis=1), np.inf
+        )
+        nearest = int(np.argmin(distances))
+        chosen = int(owners[nearest])
+
+        order.append(chosen)
+        done[chosen] = True
+        position = vertices[nearest]
+        for dependent in dependents[chosen]:
+            remaining[dependent].discard(chosen)
+            if not remaining[dependent]:
+                ready[dependent] = True
+
+    return order
+
+
+def two_opt(contours, order, predecessors, start=DEFAULT_START):
+    """
+    Improve an order by reversing segments that shorten travel.
+
+    A reversal is only taken if no precedence pair falls inside the
+    reversed segment. Gains are measured between the contours' current
+    entry points, which are re-chosen after every pass.
+
+    Args:
+        contours: List of (N, 2) contour arrays
+        order: Valid cutting order to improve
+        predecessors: Sets of contour indexes that must be cut first
+        start: Head position before the first cut
+
+    Returns:
+        Improved list of contour indexes
+    """
+    order = list(order)
+    n = len(order)
+    if n < 3:
+        return order
+
+    for _ in range(MAX_TWO_OPT_PASSES):
+        entries = _entry_points(contours, order, start)
+        points = np.array(
+            [start] + [contours[i][v] for i, v in zip(order, entries)], dtype=float
+        )
+        position_of = {contour: k for k, contour in enumerate(order)}
+        improved = False
+
+        # Edge k joins points[k] (head before order[k]) to points[k + 1]
+        for k in range(n - 1):
+            a, b = points[k], points[k + 1]
+            c, d = points[k + 2 : n + 1], points[k + 3 : n + 2]
+            gain = np.hypot(*(b - a)) - np.hypot(*(c - a).T)
+            # Reversing through to the last contour leaves no closing edge
+            gain += np.append(np.hypot(*(d - c[: len(d)]).T), 0.0)
+            gain -= np.append(np.hypot(*(d - b).T), 0.0)
+
+            candidates = np.flatnonzero(gain > 1e-9)
+            for j in candidates[np.argsort(-gain[candidates])]:
+                end = k + 1 + j
+                segment = order[k : end + 1]
+                if any(
+                    position_of[pred] >= k
+                    for contour in segment
+                    for pred in predecessors[contour]
+                ):
+                    continue
+                order[k : end + 1] = segment[::-1]
+                points[k + 1 : end + 2] = points[k + 1 : end + 2][::-1].copy()
+                position_of.update(
+                    (contour, k + m) for m, contour in enumerate(order[k : end + 1])
+                )
+                improved = True
+                break
+
+        if not improved:
+            break
+
+    return order
+
+
+def greedy_travel(contours, predecessors, start=DEFAULT_START):
+    """
+    Head travel of the nearest-neighbour order, without refining it.
+
+    A quick estimate for costing; optimize_cut_order improves on it.
+
+    Args:
+        contours: List of (N, 2) contour arrays
+        predecessors: Sets of contour indexes that must be cut first
+        start: Head position before the first cut
+
+    Returns:
+        Travel distance in the contours' units
+    """
+    if not contours:
+        return 0.0
+    order = nearest_neighbour_order(contours, predecessors, start)
+    return travel_distance(
+        contours, order, _entry_points(contours, order, start), start
+    )
+
+
+def optimize_cut_order(contours, predecessors, start=DEFAULT_START):
+    """
+    Reorder contours and pick entry points to minimize head travel.
+
+    Args:
+        contours: List of (N, 2) contour arrays
+        predecessors: Sets of contour indexes that must be cut first
+        start: Head position before the first cut
+
+    Returns:
+        Tuple of (ordered contours rotated to start at their entry vertex,
+        travel in the original order, travel in the optimized order)
+    """
+    if not contours:
+        return [], 0.0, 0.0
+
+    original = list(range(len(contours)))
+    travel_before = travel_distance(contours, original, [0] * len(contours), start)
+
+    order = nearest_neighbour_order(contours, predecessors, start)
+    entries = _entry_points(contours, order, start)
+    travel_after = travel_distance(contours, order, entries, start)
+
+    refined = two_opt(contours, order, predecessors, start)
+    refined_entries = _entry_points(contours, refined, start)
+    refined_travel = travel_distance(contours, refined, refined_entries, start)
+    if refined_travel < travel_after:
+        order, entries, travel_after = refined, refined_entries, refined_travel
+
+    ordered = [
+        np.roll(contours[i], -vertex, axis=0) for i, vertex in zip(order, entries)
+    ]
+    return ordered, travel_before, travel_after
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Compare peak RSS and wall time of create_excel.py in normal and streaming mode.
+
+Run from the project directory:
+    python benchmarks/bench_excel_streaming.py [rows]
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_DIR)
+
+from bench_snapshot import synthetic_expenses  # noqa: E402
+from calculations import (  # noqa: E402
+    calculate_category_summary,
+    calculate_pending_amounts,
+    calculate_project_totals,
+    calculate_summary_stats,
+    process_expenses,
+)
+from data import get_outstanding_balances, get_pending_purchases  # noqa: E402
+from reports import export_dashboard_data  # noqa: E402
+
+
+def write_synthetic_json(rows, path):
+    """Export a synthetic ledger in the same JSON shape as process_expenses.py."""
+    outstanding_balances = get_outstanding_balances()
+    df = process_expenses(synthetic_expenses(rows))
+    summary_stats = calculate_summary_stats(df)
+    pending_amounts = calculate_pending_amounts(
+        df, outstanding_balances, get_pending_purchases()
+    )
+    export_dashboard_data(
+        df,
+        summary_stats,
+        pending_amounts,
+        calculate_project_totals(summary_stats, pending_amounts),
+        calculate_category_summary(df),
+        outstanding_balances,
+        path,
+    )
+
+
+def run_mode(json_path, output_path, streaming):
+    """Run create_excel.py in a fresh process and return (seconds, peak RSS MB)."""
+    command = [
+        sys.executable,
+        os.path.join(PROJECT_DIR, "create_excel.py"),
+        "--input",
+        json_path,
+        "--output",
+        output_path,
+    ]
+    if streaming:
+        command.append("--streaming")
+
+    # Measure in a wrapper process so each mode gets its own RUSAGE_CHILDREN
+    wrapper = (
+        "import resource, subprocess, sys, time\n"
+        "start = time.perf_counter()\n"
+        "subprocess.run(sys.argv[1:], check=True, stdout=subprocess.DEVNULL)\n"
+        "elapsed = time.perf_counter() - start\n"
+        "peak = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss\n"
+        "print(elapsed, peak)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", wrapper, *command],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    elapsed, peak = result.stdout.split()
+    # ru_maxrss is KiB on Linux and bytes on macOS
+    scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return float(elapsed), int(peak) / scale
+
+
+def main():
+    """Benchmark both workbook modes on one synthetic ledger."""
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+
+    with tempfile.TemporaryDirectory() as workdir:
+        json_path = os.path.join(workdir, "expense_data.json")
+        write_synthetic_json(rows, json_path)
+
+        print(f"=== create_excel.py on {rows:,} rows ===")
+        for label, streaming in (("Normal", False), ("Streaming", True)):
+            elapsed, peak_mb = run_mode(
+                json_path, os.path.join(workdir, f"{label}.xlsx"), streaming
+            )
+            print(f"{label:<10} wall {elapsed:7.2f}s  peak RSS {peak_mb:8.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
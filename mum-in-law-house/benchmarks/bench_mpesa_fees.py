@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Benchmark the scalar and batch M-Pesa fee calculators.
+
+Run from the project directory:
+    python benchmarks/bench_mpesa_fees.py [rows]
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import calculate_mpesa_fee, calculate_mpesa_fees  # noqa: E402
+
+
+def main():
+    """Time both fee calculators over the same synthetic amounts."""
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rng = np.random.default_rng(42)
+    amounts = rng.integers(1, 80_000, size=rows).astype(float)
+
+    start = time.perf_counter()
+    scalar_fees = [calculate_mpesa_fee(amount) for amount in amounts.tolist()]
+    scalar_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch_fees = calculate_mpesa_fees(amounts)
+    batch_time = time.perf_counter() - start
+
+    assert np.array_equal(np.asarray(scalar_fees, dtype=float), batch_fees)
+
+    print(f"=== M-PESA FEE BENCHMARK ({rows:,} rows) ===")
+    print(f"Scalar (per row):     {scalar_time:.3f}s")
+    print(f"Batch (searchsorted): {batch_time:.3f}s")
+    print(f"Speedup: {scalar_time / batch_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
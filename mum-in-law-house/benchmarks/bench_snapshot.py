@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Compare the JSON export against the Arrow snapshot: file size and load time.
+
+Run from the project directory:
+    python benchmarks/bench_snapshot.py [rows ...]
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from calculations import calculate_category_summary, process_expenses  # noqa: E402
+from snapshot import (  # noqa: E402
+    CATEGORY_SUMMARY_FILENAME,
+    EXPENSES_FILENAME,
+    load_snapshot,
+    write_snapshot,
+)
+
+CATEGORIES = (
+    "Building Materials",
+    "Labor Costs",
+    "Hardware Items",
+    "Metal & Steel",
+    "Utilities",
+    "Transport & Logistics",
+    "Workers Accommodation",
+    "Miscellaneous",
+    "Furniture & Fixtures",
+)
+
+
+def synthetic_expenses(rows, seed=42):
+    """Synthetic expense rows shaped like the real ledger."""
+    rng = np.random.default_rng(seed)
+    days = pd.date_range("2025-09-15", periods=120).strftime("%d/%m/%Y")
+    category = rng.choice(CATEGORIES, size=rows)
+    return pd.DataFrame(
+        {
+            "date": rng.choice(days, size=rows),
+            "category": category,
+            "subcategory": [
+                f"{c} - Type {i}"
+                for c, i in zip(category, rng.integers(0, 5, size=rows))
+            ],
+            "description": np.where(
+                rng.random(rows) < 0.03, "Daily labor (UNPAID)", "Purchase"
+            ),
+            "amount": rng.integers(50, 60_000, size=rows).astype(float),
+            "vendor": [f"Vendor {i}" for i in rng.integers(0, 300, size=rows)],
+        }
+    ).to_dict("records")
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def bench(rows, workdir):
+    """Size and load time of both formats for one row count."""
+    df = process_expenses(synthetic_expenses(rows))
+    category_summary = calculate_category_summary(df)
+
+    json_path = os.path.join(workdir, "expense_data.json")
+    with open(json_path, "w") as f:
+        json.dump(
+            {
+                "category_summary": category_summary.to_dict("records"),
+                "daily_expenses": df.to_dict("records"),
+            },
+            f,
+            indent=2,
+        )
+    write_snapshot(df, category_summary, workdir)
+
+    def load_json():
+        with open(json_path, "r") as f:
+            return json.load(f)
+
+    _, json_time = timed(load_json)
+    _, arrow_time = timed(lambda: load_snapshot(workdir))
+
+    json_size = os.path.getsize(json_path)
+    arrow_size = os.path.getsize(
+        os.path.join(workdir, EXPENSES_FILENAME)
+    ) + os.path.getsize(os.path.join(workdir, CATEGORY_SUMMARY_FILENAME))
+
+    print(f"=== {rows:,} rows ===")
+    print(f"JSON:  {json_size / 1e6:8.2f} MB  load {json_time:.3f}s")
+    print(f"Arrow: {arrow_size / 1e6:8.2f} MB  load {arrow_time:.3f}s")
+    print(
+        f"Arrow is {json_size / arrow_size:.1f}x smaller and "
+        f"{json_time / arrow_time:.1f}x faster to load\n"
+    )
+
+
+def main():
+    """Run the comparison at each requested row count."""
+    row_counts = [int(arg) for arg in sys.argv[1:]] or [10_000, 1_000_000]
+    with tempfile.TemporaryDirectory() as workdir:
+        for rows in row_counts:
+            bench(rows, workdir)
+
+
+if __name__ == "__main__":
+    main()
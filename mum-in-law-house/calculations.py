@@ -1,7 +1,10 @@
 """Financial calculations for expense tracking."""
 
+import numpy as np
 import pandas as pd
-from config import TOTAL_BUDGET, calculate_mpesa_fee
+from config import TOTAL_BUDGET, calculate_mpesa_fees
+
+EXPENSE_COLUMNS = ("date", "category", "subcategory", "description", "amount", "vendor")
 
 
 def process_expenses(expenses_data):
@@ -9,24 +12,26 @@ def process_expenses(expenses_data):
     Process expenses data and calculate M-Pesa fees.
 
     Args:
-        expenses_data: List of expense dictionaries
+        expenses_data: List of expense dictionaries (left unmodified)
 
     Returns:
         DataFrame with processed expenses including fees and status
     """
-    # Calculate M-Pesa fees for each expense
-    for expense in expenses_data:
-        # For unpaid expenses, set M-Pesa fee to 0 and mark as unpaid
-        if "UNPAID" in expense["description"]:
-            expense["mpesa_fee"] = 0.0
-            expense["total_cost"] = 0.0  # Don't count in spending until paid
-            expense["status"] = "unpaid"
-        else:
-            expense["mpesa_fee"] = calculate_mpesa_fee(expense["amount"])
-            expense["total_cost"] = expense["amount"] + expense["mpesa_fee"]
-            expense["status"] = "paid"
+    # Build the frame first so the caller's list of dicts is never mutated;
+    # an empty list still gets the expense columns (e.g. no unpaid expenses)
+    df = pd.DataFrame(expenses_data)
+    if df.empty:
+        df = pd.DataFrame(columns=EXPENSE_COLUMNS).astype({"amount": float})
+
+    # Unpaid expenses carry no M-Pesa fee and don't count in spending until paid
+    is_paid = ~df["description"].str.contains("UNPAID", regex=False)
 
-    return pd.DataFrame(expenses_data)
+    df["mpesa_fee"] = 0.0
+    df.loc[is_paid, "mpesa_fee"] = calculate_mpesa_fees(df.loc[is_paid, "amount"])
+    df["total_cost"] = (df["amount"] + df["mpesa_fee"]).where(is_paid, 0.0)
+    df["status"] = np.where(is_paid, "paid", "unpaid")
+
+    return df
 
 
 def calculate_summary_stats(df):
@@ -57,23 +62,62 @@ def calculate_summary_stats(df):
     }
 
 
-def calculate_category_summary(paid_df):
+def calculate_category_summary(df):
     """
-    Calculate category-wise expense breakdown.
+    Calculate category-wise expense breakdown in a single groupby.
+
+    Amounts, fees and per-transaction statistics cover paid expenses only;
+    unpaid expenses are reported separately as a count and amount.
 
     Args:
-        paid_df: DataFrame with paid expenses only
+        df: DataFrame with processed expenses (must include the status column)
 
     Returns:
         DataFrame with category summary sorted by budget percentage
     """
+    is_paid = df["status"] == "paid"
+    paid_amount = df["amount"].where(is_paid)
+
     category_summary = (
-        paid_df.groupby("category")
-        .agg({"amount": "sum", "mpesa_fee": "sum", "total_cost": "sum"})
+        df.assign(
+            paid_amount=paid_amount,
+            is_paid=is_paid,
+            is_unpaid=~is_paid,
+            unpaid_amount=df["amount"].where(~is_paid, 0.0),
+        )
+        .groupby("category")
+        .agg(
+            amount=("paid_amount", "sum"),
+            mpesa_fee=("mpesa_fee", "sum"),
+            total_cost=("total_cost", "sum"),
+            transaction_count=("amount", "size"),
+            paid_count=("is_paid", "sum"),
+            unpaid_count=("is_unpaid", "sum"),
+            unpaid_amount=("unpaid_amount", "sum"),
+            mean_amount=("paid_amount", "mean"),
+            median_amount=("paid_amount", "median"),
+            max_amount=("paid_amount", "max"),
+        )
         .reset_index()
     )
 
-    # Calculate budget percentage and sort by it (descending)
+    # Categories with only unpaid expenses have no paid statistics
+    stat_columns = ["mean_amount", "median_amount", "max_amount"]
+    category_summary[stat_columns] = category_summary[stat_columns].fillna(0.0)
+
+    return rank_category_summary(category_summary)
+
+
+def rank_category_summary(category_summary):
+    """
+    Add budget percentage to a category summary and sort by it.
+
+    Args:
+        category_summary: DataFrame with a total_cost column per category
+
+    Returns:
+        DataFrame sorted by budget percentage (descending)
+    """
     category_summary["budget_percentage"] = (
         category_summary["total_cost"] / TOTAL_BUDGET
     ) * 100
@@ -89,7 +133,7 @@ def calculate_pending_amounts(df, outstanding_balances, pending_purchases):
     Calculate all pending amounts including unpaid labor and purchases.
 
     Args:
-        df: DataFrame with all expenses
+        df: DataFrame with processed expenses; only the unpaid ones are used
         outstanding_balances: List of outstanding balance items
         pending_purchases: List of pending purchase items (without contingency)
 
@@ -1,7 +1,11 @@
 """Configuration and constants for Mother-in-Law House expense tracking."""
 
+from bisect import bisect_left
 from datetime import datetime
 
+import numpy as np
+import pandas as pd
+
 # Project constants
 TOTAL_BUDGET = (
     1_000_000  # KES - Original budget (to show true picture of budget overrun)
@@ -10,33 +14,122 @@ PROJECT_START = datetime(2025, 9, 15)
 
 
 # M-Pesa fee structure (KES)
+# Upper bound (inclusive) of each fee bracket, sorted ascending
+MPESA_BRACKET_BOUNDS = (
+    49,
+    100,
+    500,
+    1000,
+    1500,
+    3000,
+    5000,
+    7500,
+    10000,
+    15000,
+    20000,
+    35000,
+    50000,
+)
+# Fee for each bracket; the extra last entry applies above the final bound
+MPESA_BRACKET_FEES = (0, 1, 5, 10, 15, 25, 40, 75, 96, 156, 171.5, 355, 455, 455)
+
+
+class FeeSchedule:
+    """Tiered fee schedule: sorted inclusive upper bounds plus one fee per bracket"""
+
+    def __init__(self, bounds, fees):
+        if len(fees) != len(bounds) + 1:
+            raise ValueError("Fee schedule needs one fee per bound plus one above")
+        if list(bounds) != sorted(bounds):
+            raise ValueError("Fee schedule bounds must be sorted ascending")
+
+        self.bounds = tuple(bounds)
+        self.fees = tuple(fees)
+        self.labels = tuple(
+            [f"0-{bounds[0]}"]
+            + [f"{low + 1}-{high}" for low, high in zip(bounds, bounds[1:])]
+            + [f"{bounds[-1] + 1}+"]
+        )
+        self._bounds_array = np.asarray(bounds, dtype=float)
+        self._fees_array = np.asarray(fees, dtype=float)
+        self._bins = [-np.inf, *bounds, np.inf]
+
+    def fee_for(self, amount):
+        """Fee for a single amount"""
+        return self.fees[bisect_left(self.bounds, amount)]
+
+    def fee(self, amounts):
+        """
+        Fees for many amounts in one searchsorted call.
+
+        Args:
+            amounts: NumPy array, pandas Series or any sequence of amounts
+
+        Returns:
+            Fees as a float array, or a Series aligned to the input's index
+            when a Series is passed
+        """
+        values = np.asarray(amounts, dtype=float)
+        fees = self._fees_array[
+            np.searchsorted(self._bounds_array, values, side="left")
+        ]
+
+        if isinstance(amounts, pd.Series):
+            return pd.Series(fees, index=amounts.index, name="mpesa_fee")
+        return fees
+
+    def bracket_label(self, amounts):
+        """
+        Amount-range label of each amount's fee bracket.
+
+        Args:
+            amounts: NumPy array, pandas Series or any sequence of amounts
+
+        Returns:
+            Categorical labels (a categorical Series when a Series is passed)
+        """
+        return pd.cut(amounts, bins=self._bins, labels=list(self.labels), right=True)
+
+    def summarize(self, amounts, fees):
+        """
+        Per-bracket transaction count and total fees.
+
+        Args:
+            amounts: Transaction amounts
+            fees: Fee charged on each transaction
+
+        Returns:
+            DataFrame with bracket, fee, count and total_fees for each
+            non-empty bracket, in bracket order
+        """
+        summary = (
+            pd.DataFrame(
+                {
+                    "bracket": self.bracket_label(np.asarray(amounts, dtype=float)),
+                    "fees": np.asarray(fees, dtype=float),
+                }
+            )
+            .groupby("bracket", observed=True)
+            .agg(count=("fees", "size"), total_fees=("fees", "sum"))
+            .reset_index()
+        )
+        summary.insert(
+            1,
+            "fee",
+            summary["bracket"].map(dict(zip(self.labels, self.fees))).astype(float),
+        )
+        summary["bracket"] = summary["bracket"].astype(str)
+        return summary
+
+
+MPESA_FEE_SCHEDULE = FeeSchedule(MPESA_BRACKET_BOUNDS, MPESA_BRACKET_FEES)
+
+
 def calculate_mpesa_fee(amount):
     """Calculate M-Pesa transaction fee based on amount"""
-    if amount <= 49:
-        return 0
-    elif amount <= 100:
-        return 1
-    elif amount <= 500:
-        return 5
-    elif amount <= 1000:
-        return 10
-    elif amount <= 1500:
-        return 15
-    elif amount <= 3000:
-        return 25
-    elif amount <= 5000:
-        return 40
-    elif amount <= 7500:
-        return 75
-    elif amount <= 10000:
-        return 96
-    elif amount <= 15000:
-        return 156
-    elif amount <= 20000:
-        return 171.5
-    elif amount <= 35000:
-        return 355
-    elif amount <= 50000:
-        return 455
-    else:
-        return 455  # Max fee for amounts above 50K
+    return MPESA_FEE_SCHEDULE.fee_for(amount)
+
+
+def calculate_mpesa_fees(amounts):
+    """Calculate M-Pesa transaction fees for many amounts at once (see FeeSchedule.fee)"""
+    return MPESA_FEE_SCHEDULE.fee(amounts)
@@ -1,31 +1,43 @@
+#!/usr/bin/env python3
+"""
+Excel report builder for Mother-in-Law House expense tracking.
+
+Builds the multi-sheet expense workbook either in-process from the data
+produced by process_expenses.py, or from the exported expense_data.json:
+
+    python create_excel.py [--input JSON] [--output XLSX] [--streaming]
+"""
+
+import argparse
 import json
-from datetime import datetime
+import os
+from copy import copy
 
 import pandas as pd
+from config import MPESA_FEE_SCHEDULE
 from openpyxl import Workbook
-from openpyxl.chart import BarChart, PieChart, Reference
-from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
-
-# Load the processed data
-with open(
-    "/Users/lemaiyan/dev/all/personal/mum-in-law-house/expense_data.json", "r"
-) as f:
-    data = json.load(f)
-
-# Create Excel workbook
-wb = Workbook()
-
-# Remove default sheet and create custom sheets
-wb.remove(wb.active)
-
-# Create sheets
-summary_sheet = wb.create_sheet("Home Summary")
-daily_sheet = wb.create_sheet("Daily Expenses")
-category_sheet = wb.create_sheet("Category Analysis")
-mpesa_sheet = wb.create_sheet("M-Pesa Fees")
-outstanding_sheet = wb.create_sheet("Outstanding Balances")
-unpaid_sheet = wb.create_sheet("Unpaid Labor")
-pending_purchases_sheet = wb.create_sheet("Pending Purchases")
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Border, Font, NamedStyle, PatternFill, Side
+from openpyxl.styles.fonts import DEFAULT_FONT
+
+DEFAULT_INPUT_PATH = (
+    "/Users/lemaiyan/dev/all/personal/mum-in-law-house/expense_data.json"
+)
+DEFAULT_OUTPUT_PATH = "/Users/lemaiyan/dev/all/personal/mum-in-law-house/Mother-In-Law-House-Expenses.xlsx"
+
+DAILY_EXPENSES_SHEET = "Daily Expenses"
+
+EXPENSE_HEADERS = [
+    "Date",
+    "Category",
+    "Subcategory",
+    "Description",
+    "Amount",
+    "M-Pesa Fee",
+    "Total Cost",
+    "Vendor",
+    "Status",
+]
 
 # Define styles
 header_font = Font(bold=True, size=12, color="FFFFFF")
@@ -38,469 +50,652 @@ border = Border(
     top=Side(style="thin"),
     bottom=Side(style="thin"),
 )
+unpaid_fill = PatternFill(start_color="FFCCCC", end_color="FFCCCC", fill_type="solid")
+unpaid_font = Font(color="CC0000", bold=True)
+
 
-# === HOME SUMMARY SHEET ===
-ws = summary_sheet
-
-# Project header
-ws["A1"] = "MOTHER-IN-LAW HOUSE - EXPENSE TRACKER"
-ws["A1"].font = Font(bold=True, size=16, color="2C5F2D")
-ws.merge_cells("A1:E1")
-
-# Key metrics
-ws["A3"] = "Project Overview"
-ws["A3"].font = title_font
-
-project_info = data["project_info"]
-ws["A4"] = "Total Budget:"
-ws["B4"] = f"KES {project_info['total_budget']:,}"
-ws["A5"] = "Total Spent:"
-ws["B5"] = f"KES {project_info['total_cost']:,}"
-ws["A6"] = "Balance Remaining:"
-ws["B6"] = f"KES {project_info['balance_remaining']:,}"
-ws["A7"] = "Budget Used:"
-ws["B7"] = f"{project_info['percentage_used']}%"
-ws["A8"] = "M-Pesa Fees:"
-ws["B8"] = f"KES {project_info['total_mpesa_fees']:,}"
-
-# Outstanding amounts section
-ws["A10"] = "Outstanding Amounts"
-ws["A10"].font = title_font
-
-if "total_outstanding" in project_info:
-    ws["A11"] = "Outstanding Balances:"
-    ws["B11"] = f"KES {project_info['total_outstanding']:,}"
-    ws["A12"] = "Unpaid Labor:"
-    ws["B12"] = f"KES {project_info['total_unpaid_labor']:,}"
-    ws["A13"] = "Total Pending:"
-    ws["B13"] = f"KES {project_info['total_pending']:,}"
-    ws["A14"] = "Total Committed:"
-    ws["B14"] = (
-        f"KES {project_info.get('total_committed', project_info['total_cost'] + project_info['total_pending']):,}"
+def register_named_styles(workbook):
+    """Register the shared cell styles used by the Daily Expenses sheet"""
+    workbook.add_named_style(
+        NamedStyle(
+            name="expense_header", font=header_font, fill=header_fill, border=border
+        )
+    )
+    workbook.add_named_style(
+        NamedStyle(name="expense_cell", font=copy(DEFAULT_FONT), border=border)
+    )
+    workbook.add_named_style(
+        NamedStyle(
+            name="expense_unpaid",
+            font=copy(DEFAULT_FONT),
+            fill=unpaid_fill,
+            border=border,
+        )
     )
-    ws["A15"] = "Budget Used (Inclusive):"
-    ws["B15"] = f"{project_info.get('percentage_used_inclusive', 0):.2f}%"
-    ws["A16"] = "Effective Balance:"
-    ws["B16"] = (
-        f"KES {project_info.get('effective_balance', project_info['balance_remaining'] - project_info['total_pending']):,}"
+    workbook.add_named_style(
+        NamedStyle(
+            name="expense_unpaid_status",
+            font=unpaid_font,
+            fill=unpaid_fill,
+            border=border,
+        )
     )
 
-    category_start_row = 18
-
-    # Add Project Completion Estimate if pending purchases exist
-    if "total_pending_purchases" in project_info:
-        ws["A18"] = "Project Completion Estimate"
-        ws["A18"].font = title_font
-        ws["A19"] = "Pending Purchases:"
-        ws["B19"] = f"KES {project_info['total_pending_purchases']:,}"
-        ws["A20"] = "Total Project Cost:"
-        ws["B20"] = f"KES {project_info['total_project_cost']:,}"
-        ws["B20"].font = Font(bold=True, size=12, color="E74C3C")
-        ws["A21"] = "Additional Funds Needed:"
-        ws["B21"] = f"KES {project_info['additional_funds_needed']:,}"
-        ws["B21"].font = Font(bold=True, size=12, color="E74C3C")
-
-        category_start_row = 23
-else:
-    category_start_row = 11
-
-# Category summary
-ws[f"A{category_start_row}"] = "Category Breakdown"
-ws[f"A{category_start_row}"].font = title_font
-
-# Headers
-headers = ["Category", "Amount Spent", "M-Pesa Fees", "Total Cost", "Budget %"]
-header_row = category_start_row + 1
-for col, header in enumerate(headers, 1):
-    cell = ws.cell(row=header_row, column=col, value=header)
-    cell.font = header_font
-    cell.fill = header_fill
-    cell.border = border
-
-# Category data
-for row, category in enumerate(data["category_summary"], header_row + 1):
-    ws.cell(row=row, column=1, value=category["category"]).border = border
-    ws.cell(row=row, column=2, value=category["amount"]).border = border
-    ws.cell(row=row, column=3, value=category["mpesa_fee"]).border = border
-    ws.cell(row=row, column=4, value=category["total_cost"]).border = border
-    percentage = (category["total_cost"] / project_info["total_budget"]) * 100
-    ws.cell(row=row, column=5, value=f"{percentage:.2f}%").border = border
-
-# Adjust column widths
-ws.column_dimensions["A"].width = 25
-ws.column_dimensions["B"].width = 15
-ws.column_dimensions["C"].width = 15
-ws.column_dimensions["D"].width = 15
-ws.column_dimensions["E"].width = 12
-
-# === DAILY EXPENSES SHEET ===
-ws = daily_sheet
-
-# Headers
-expense_headers = [
-    "Date",
-    "Category",
-    "Subcategory",
-    "Description",
-    "Amount",
-    "M-Pesa Fee",
-    "Total Cost",
-    "Vendor",
-    "Status",
-]
-for col, header in enumerate(expense_headers, 1):
-    cell = ws.cell(row=1, column=col, value=header)
-    cell.font = header_font
-    cell.fill = header_fill
-    cell.border = border
-
-# Expense data
-for row, expense in enumerate(data["daily_expenses"], 2):
-    ws.cell(row=row, column=1, value=expense["date"]).border = border
-    ws.cell(row=row, column=2, value=expense["category"]).border = border
-    ws.cell(row=row, column=3, value=expense["subcategory"]).border = border
-    ws.cell(row=row, column=4, value=expense["description"]).border = border
-    ws.cell(row=row, column=5, value=expense["amount"]).border = border
-    ws.cell(row=row, column=6, value=expense["mpesa_fee"]).border = border
-    ws.cell(row=row, column=7, value=expense["total_cost"]).border = border
-    ws.cell(row=row, column=8, value=expense["vendor"]).border = border
-
-    # Status column and highlighting for unpaid items
-    status = expense.get("status", "paid")
-    status_cell = ws.cell(row=row, column=9, value=status.upper())
-    status_cell.border = border
-
-    if status == "unpaid":
-        # Highlight unpaid rows in light red
-        unpaid_fill = PatternFill(
-            start_color="FFCCCC", end_color="FFCCCC", fill_type="solid"
+
+def resolve_named_styles(ws, names):
+    """Resolve named styles once so every row can reuse the same style arrays"""
+    resolved = {}
+    for name in names:
+        template = WriteOnlyCell(ws)
+        template.style = name
+        resolved[name] = template._style
+    return resolved
+
+
+def styled_row(ws, values, style, last_style=None):
+    """Build a row of cells sharing one resolved style (works in write-only mode)"""
+    cells = []
+    for value in values:
+        cell = WriteOnlyCell(ws, value=value)
+        cell._style = copy(style)
+        cells.append(cell)
+    if last_style is not None:
+        cells[-1]._style = copy(last_style)
+    return cells
+
+
+def write_daily_expenses(ws, expenses):
+    """Write the Daily Expenses sheet row by row using pre-built named styles"""
+    # Column widths must be set before any rows in write-only mode
+    for col in ["A", "B", "C", "D", "E", "F", "G", "H", "I"]:
+        ws.column_dimensions[col].width = 18
+
+    styles = resolve_named_styles(
+        ws,
+        ["expense_header", "expense_cell", "expense_unpaid", "expense_unpaid_status"],
+    )
+    ws.append(styled_row(ws, EXPENSE_HEADERS, styles["expense_header"]))
+
+    for expense in expenses:
+        status = expense.get("status", "paid")
+        values = [
+            expense["date"],
+            expense["category"],
+            expense["subcategory"],
+            expense["description"],
+            expense["amount"],
+            expense["mpesa_fee"],
+            expense["total_cost"],
+            expense["vendor"],
+            status.upper(),
+        ]
+        if status == "unpaid":
+            # Highlight unpaid rows in light red
+            ws.append(
+                styled_row(
+                    ws,
+                    values,
+                    styles["expense_unpaid"],
+                    styles["expense_unpaid_status"],
+                )
+            )
+        else:
+            ws.append(styled_row(ws, values, styles["expense_cell"]))
+
+
+def copy_to_write_only(source, target):
+    """Copy a small random-access sheet into a write-only sheet"""
+    for key, dimension in source.column_dimensions.items():
+        target.column_dimensions[key].width = dimension.width
+    for merged_range in source.merged_cells.ranges:
+        target.merged_cells.add(merged_range.coord)
+
+    # Styles are copied once per distinct source style, then shared
+    copied_styles = {}
+
+    for row in source.iter_rows(min_row=1, min_col=1):
+        cells = []
+        for cell in row:
+            if cell.value is None and not cell.has_style:
+                cells.append(None)
+                continue
+            new_cell = WriteOnlyCell(target, value=cell.value)
+            if cell.has_style:
+                if cell.style_id not in copied_styles:
+                    new_cell.font = copy(cell.font)
+                    new_cell.fill = copy(cell.fill)
+                    new_cell.border = copy(cell.border)
+                    new_cell.alignment = copy(cell.alignment)
+                    new_cell.number_format = cell.number_format
+                    copied_styles[cell.style_id] = new_cell._style
+                new_cell._style = copy(copied_styles[cell.style_id])
+            cells.append(new_cell)
+        target.append(cells)
+
+
+def build_daily_expenses_sheet(ws, data):
+    """Write the Daily Expenses sheet"""
+    write_daily_expenses(ws, data["daily_expenses"])
+
+
+def build_home_summary_sheet(ws, data):
+    """Write the Home Summary sheet: key metrics and category breakdown"""
+    # Project header
+    ws["A1"] = "MOTHER-IN-LAW HOUSE - EXPENSE TRACKER"
+    ws["A1"].font = Font(bold=True, size=16, color="2C5F2D")
+    ws.merge_cells("A1:E1")
+
+    # Key metrics
+    ws["A3"] = "Project Overview"
+    ws["A3"].font = title_font
+
+    project_info = data["project_info"]
+    ws["A4"] = "Total Budget:"
+    ws["B4"] = f"KES {project_info['total_budget']:,}"
+    ws["A5"] = "Total Spent:"
+    ws["B5"] = f"KES {project_info['total_cost']:,}"
+    ws["A6"] = "Balance Remaining:"
+    ws["B6"] = f"KES {project_info['balance_remaining']:,}"
+    ws["A7"] = "Budget Used:"
+    ws["B7"] = f"{project_info['percentage_used']}%"
+    ws["A8"] = "M-Pesa Fees:"
+    ws["B8"] = f"KES {project_info['total_mpesa_fees']:,}"
+
+    # Outstanding amounts section
+    ws["A10"] = "Outstanding Amounts"
+    ws["A10"].font = title_font
+
+    if "total_outstanding" in project_info:
+        ws["A11"] = "Outstanding Balances:"
+        ws["B11"] = f"KES {project_info['total_outstanding']:,}"
+        ws["A12"] = "Unpaid Labor:"
+        ws["B12"] = f"KES {project_info['total_unpaid_labor']:,}"
+        ws["A13"] = "Total Pending:"
+        ws["B13"] = f"KES {project_info['total_pending']:,}"
+        ws["A14"] = "Total Committed:"
+        ws["B14"] = (
+            f"KES {project_info.get('total_committed', project_info['total_cost'] + project_info['total_pending']):,}"
         )
-        unpaid_font = Font(color="CC0000", bold=True)
-        for col in range(1, 10):
-            cell = ws.cell(row=row, column=col)
-            cell.fill = unpaid_fill
-            if col == 9:  # Status column
-                cell.font = unpaid_font
-
-# Adjust column widths
-for col in ["A", "B", "C", "D", "E", "F", "G", "H", "I"]:
-    ws.column_dimensions[col].width = 18
-
-# === CATEGORY ANALYSIS SHEET ===
-ws = category_sheet
-
-ws["A1"] = "EXPENSE CATEGORY ANALYSIS"
-ws["A1"].font = Font(bold=True, size=16, color="2C5F2D")
-ws.merge_cells("A1:H1")
-
-# Category summary table
-ws["A3"] = "Category Breakdown"
-ws["A3"].font = Font(bold=True, size=14)
-
-# Headers for category analysis
-cat_headers = [
-    "Category",
-    "Amount (KES)",
-    "M-Pesa Fees",
-    "Total Cost",
-    "Budget %",
-    "Transaction Count",
-    "Avg per Transaction",
-    "% of Total",
-]
-for col, header in enumerate(cat_headers, 1):
-    cell = ws.cell(row=4, column=col, value=header)
-    cell.font = header_font
-    cell.fill = header_fill
-    cell.border = border
-
-# Category data from JSON
-category_data = data["category_summary"]
-total_project_cost = sum(cat["total_cost"] for cat in category_data)
-total_budget = data["project_info"]["total_budget"]
-
-for row, category in enumerate(category_data, 5):
-    ws.cell(row=row, column=1, value=category["category"]).border = border
-    ws.cell(row=row, column=2, value=category["amount"]).border = border
-    ws.cell(row=row, column=3, value=category["mpesa_fee"]).border = border
-    ws.cell(row=row, column=4, value=category["total_cost"]).border = border
-
-    # Budget percentage
-    budget_pct = (category["total_cost"] / total_budget) * 100
-    ws.cell(row=row, column=5, value=f"{budget_pct:.2f}%").border = border
-
-    # Transaction count (count expenses for this category)
-    cat_transactions = [
-        exp for exp in data["daily_expenses"] if exp["category"] == category["category"]
+        ws["A15"] = "Budget Used (Inclusive):"
+        ws["B15"] = f"{project_info.get('percentage_used_inclusive', 0):.2f}%"
+        ws["A16"] = "Effective Balance:"
+        ws["B16"] = (
+            f"KES {project_info.get('effective_balance', project_info['balance_remaining'] - project_info['total_pending']):,}"
+        )
+
+        category_start_row = 18
+
+        # Add Project Completion Estimate if pending purchases exist
+        if "total_pending_purchases" in project_info:
+            ws["A18"] = "Project Completion Estimate"
+            ws["A18"].font = title_font
+            ws["A19"] = "Pending Purchases:"
+            ws["B19"] = f"KES {project_info['total_pending_purchases']:,}"
+            ws["A20"] = "Total Project Cost:"
+            ws["B20"] = f"KES {project_info['total_project_cost']:,}"
+            ws["B20"].font = Font(bold=True, size=12, color="E74C3C")
+            ws["A21"] = "Additional Funds Needed:"
+            ws["B21"] = f"KES {project_info['additional_funds_needed']:,}"
+            ws["B21"].font = Font(bold=True, size=12, color="E74C3C")
+
+            category_start_row = 23
+    else:
+        category_start_row = 11
+
+    # Category summary
+    ws[f"A{category_start_row}"] = "Category Breakdown"
+    ws[f"A{category_start_row}"].font = title_font
+
+    # Headers
+    headers = ["Category", "Amount Spent", "M-Pesa Fees", "Total Cost", "Budget %"]
+    header_row = category_start_row + 1
+    for col, header in enumerate(headers, 1):
+        cell = ws.cell(row=header_row, column=col, value=header)
+        cell.font = header_font
+        cell.fill = header_fill
+        cell.border = border
+
+    # Category data
+    for row, category in enumerate(data["category_summary"], header_row + 1):
+        ws.cell(row=row, column=1, value=category["category"]).border = border
+        ws.cell(row=row, column=2, value=category["amount"]).border = border
+        ws.cell(row=row, column=3, value=category["mpesa_fee"]).border = border
+        ws.cell(row=row, column=4, value=category["total_cost"]).border = border
+        percentage = (category["total_cost"] / project_info["total_budget"]) * 100
+        ws.cell(row=row, column=5, value=f"{percentage:.2f}%").border = border
+
+    # Adjust column widths
+    ws.column_dimensions["A"].width = 25
+    ws.column_dimensions["B"].width = 15
+    ws.column_dimensions["C"].width = 15
+    ws.column_dimensions["D"].width = 15
+    ws.column_dimensions["E"].width = 12
+
+
+def build_category_analysis_sheet(ws, data):
+    """Write the Category Analysis sheet"""
+    ws["A1"] = "EXPENSE CATEGORY ANALYSIS"
+    ws["A1"].font = Font(bold=True, size=16, color="2C5F2D")
+    ws.merge_cells("A1:L1")
+
+    # Category summary table
+    ws["A3"] = "Category Breakdown"
+    ws["A3"].font = Font(bold=True, size=14)
+
+    # Headers for category analysis
+    cat_headers = [
+        "Category",
+        "Amount (KES)",
+        "M-Pesa Fees",
+        "Total Cost",
+        "Budget %",
+        "Paid Count",
+        "Avg per Transaction",
+        "Median",
+        "Max",
+        "Unpaid Count",
+        "Unpaid Amount",
+        "% of Total",
     ]
-    trans_count = len(cat_transactions)
-    ws.cell(row=row, column=6, value=trans_count).border = border
-
-    # Average per transaction
-    avg_per_trans = category["amount"] / trans_count if trans_count > 0 else 0
-    ws.cell(row=row, column=7, value=f"{avg_per_trans:.0f}").border = border
-
-    # Percentage of total project
-    pct_of_total = (category["total_cost"] / total_project_cost) * 100
-    ws.cell(row=row, column=8, value=f"{pct_of_total:.1f}%").border = border
-
-# Add totals row
-total_row = len(category_data) + 5
-ws.cell(row=total_row, column=1, value="TOTAL").font = Font(bold=True)
-ws.cell(row=total_row, column=1).border = border
-ws.cell(
-    row=total_row, column=2, value=sum(cat["amount"] for cat in category_data)
-).border = border
-ws.cell(
-    row=total_row, column=3, value=sum(cat["mpesa_fee"] for cat in category_data)
-).border = border
-ws.cell(
-    row=total_row, column=4, value=sum(cat["total_cost"] for cat in category_data)
-).border = border
-ws.cell(row=total_row, column=5, value="100.00%").border = border
-ws.cell(row=total_row, column=6, value=len(data["daily_expenses"])).border = border
-ws.cell(row=total_row, column=7, value="").border = border
-ws.cell(row=total_row, column=8, value="100.0%").border = border
-
-# Summary statistics
-ws[f"A{total_row + 3}"] = "CATEGORY INSIGHTS"
-ws[f"A{total_row + 3}"].font = Font(bold=True, size=14)
-
-ws[f"A{total_row + 5}"] = f"Top Category: {category_data[0]['category']}"
-ws[f"A{total_row + 6}"] = f"Top Category Amount: KES {category_data[0]['total_cost']:,}"
-ws[f"A{total_row + 7}"] = (
-    f"Top Category % of Budget: {(category_data[0]['total_cost'] / total_budget) * 100:.1f}%"
-)
-ws[f"A{total_row + 8}"] = f"Total Categories: {len(category_data)}"
-ws[f"A{total_row + 9}"] = (
-    f"Average per Category: KES {total_project_cost / len(category_data):,.0f}"
-)
+    for col, header in enumerate(cat_headers, 1):
+        cell = ws.cell(row=4, column=col, value=header)
+        cell.font = header_font
+        cell.fill = header_fill
+        cell.border = border
+
+    # Category data and per-category statistics from calculate_category_summary
+    category_data = data["category_summary"]
+    total_project_cost = sum(cat["total_cost"] for cat in category_data)
+    total_budget = data["project_info"]["total_budget"]
+
+    for row, category in enumerate(category_data, 5):
+        # Budget percentage and percentage of total project
+        budget_pct = (category["total_cost"] / total_budget) * 100
+        pct_of_total = (category["total_cost"] / total_project_cost) * 100
+
+        values = [
+            category["category"],
+            category["amount"],
+            category["mpesa_fee"],
+            category["total_cost"],
+            f"{budget_pct:.2f}%",
+            category["paid_count"],
+            f"{category['mean_amount']:.0f}",
+            category["median_amount"],
+            category["max_amount"],
+            category["unpaid_count"],
+            category["unpaid_amount"],
+            f"{pct_of_total:.1f}%",
+        ]
+        for col, value in enumerate(values, 1):
+            ws.cell(row=row, column=col, value=value).border = border
+
+    # Add totals row
+    total_row = len(category_data) + 5
+    totals = [
+        "TOTAL",
+        sum(cat["amount"] for cat in category_data),
+        sum(cat["mpesa_fee"] for cat in category_data),
+        sum(cat["total_cost"] for cat in category_data),
+        "100.00%",
+        sum(cat["paid_count"] for cat in category_data),
+        "",
+        "",
+        max((cat["max_amount"] for cat in category_data), default=0),
+        sum(cat["unpaid_count"] for cat in category_data),
+        sum(cat["unpaid_amount"] for cat in category_data),
+        "100.0%",
+    ]
+    for col, value in enumerate(totals, 1):
+        ws.cell(row=total_row, column=col, value=value).border = border
+    ws.cell(row=total_row, column=1).font = Font(bold=True)
+
+    # Summary statistics
+    ws[f"A{total_row + 3}"] = "CATEGORY INSIGHTS"
+    ws[f"A{total_row + 3}"].font = Font(bold=True, size=14)
+
+    ws[f"A{total_row + 5}"] = f"Top Category: {category_data[0]['category']}"
+    ws[f"A{total_row + 6}"] = (
+        f"Top Category Amount: KES {category_data[0]['total_cost']:,}"
+    )
+    ws[f"A{total_row + 7}"] = (
+        f"Top Category % of Budget: {(category_data[0]['total_cost'] / total_budget) * 100:.1f}%"
+    )
+    ws[f"A{total_row + 8}"] = f"Total Categories: {len(category_data)}"
+    ws[f"A{total_row + 9}"] = (
+        f"Average per Category: KES {total_project_cost / len(category_data):,.0f}"
+    )
+
+    # Adjust column widths for category analysis
+    for col in ["A", "B", "C", "D", "E", "F", "G", "H", "I", "J", "K", "L"]:
+        ws.column_dimensions[col].width = 18
+
+
+def build_mpesa_fees_sheet(ws, data):
+    """Write the M-Pesa Fees sheet"""
+    project_info = data["project_info"]
 
-# Adjust column widths for category analysis
-for col in ["A", "B", "C", "D", "E", "F", "G", "H"]:
-    ws.column_dimensions[col].width = 18
-
-# === M-PESA FEES SHEET ===
-ws = mpesa_sheet
-
-ws["A1"] = "M-Pesa Fee Analysis"
-ws["A1"].font = title_font
-
-# Fee structure table
-ws["A3"] = "Fee Structure"
-ws["A3"].font = Font(bold=True)
-
-fee_headers = ["Amount Range", "Fee (KES)", "Transactions", "Total Fees"]
-for col, header in enumerate(fee_headers, 1):
-    cell = ws.cell(row=4, column=col, value=header)
-    cell.font = header_font
-    cell.fill = header_fill
-
-# Calculate fee analysis from expenses
-fee_analysis = {}
-for expense in data["daily_expenses"]:
-    amount = expense["amount"]
-    fee = expense["mpesa_fee"]
-
-    # Determine fee bracket
-    if amount <= 49:
-        bracket = "0-49"
-    elif amount <= 100:
-        bracket = "50-100"
-    elif amount <= 500:
-        bracket = "101-500"
-    elif amount <= 1000:
-        bracket = "501-1000"
-    elif amount <= 1500:
-        bracket = "1001-1500"
-    elif amount <= 3000:
-        bracket = "1501-3000"
-    elif amount <= 5000:
-        bracket = "3001-5000"
-    elif amount <= 7500:
-        bracket = "5001-7500"
-    elif amount <= 10000:
-        bracket = "7501-10000"
-    elif amount <= 15000:
-        bracket = "10001-15000"
-    elif amount <= 20000:
-        bracket = "15001-20000"
-    elif amount <= 35000:
-        bracket = "20001-35000"
+    ws["A1"] = "M-Pesa Fee Analysis"
+    ws["A1"].font = title_font
+
+    # Fee structure table
+    ws["A3"] = "Fee Structure"
+    ws["A3"].font = Font(bold=True)
+
+    fee_headers = ["Amount Range", "Fee (KES)", "Transactions", "Total Fees"]
+    for col, header in enumerate(fee_headers, 1):
+        cell = ws.cell(row=4, column=col, value=header)
+        cell.font = header_font
+        cell.fill = header_fill
+
+    # Per-bracket counts and fees from the shared schedule (paid transactions only)
+    expenses = pd.DataFrame(
+        data["daily_expenses"], columns=["amount", "mpesa_fee", "status"]
+    )
+    paid = expenses[expenses["status"] == "paid"]
+    fee_analysis = MPESA_FEE_SCHEDULE.summarize(paid["amount"], paid["mpesa_fee"])
+
+    # Add fee analysis to sheet
+    row = 5
+    for bracket in fee_analysis.itertuples(index=False):
+        ws.cell(row=row, column=1, value=bracket.bracket)
+        ws.cell(row=row, column=2, value=bracket.fee)
+        ws.cell(row=row, column=3, value=bracket.count)
+        ws.cell(row=row, column=4, value=bracket.total_fees)
+        row += 1
+
+    # Summary
+    ws[f"A{row+2}"] = "Total M-Pesa Fees:"
+    ws[f"B{row+2}"] = f"KES {project_info['total_mpesa_fees']:,}"
+    ws[f"B{row+2}"].font = Font(bold=True)
+
+
+def build_outstanding_balances_sheet(ws, data):
+    """Write the Outstanding Balances sheet"""
+    project_info = data["project_info"]
+
+    # Title
+    ws["A1"] = "OUTSTANDING BALANCES"
+    ws["A1"].font = Font(bold=True, size=16, color="2C5F2D")
+    ws.merge_cells("A1:D1")
+
+    # Headers
+    headers = ["Vendor", "Description", "Amount", "Due Date"]
+    for col, header in enumerate(headers, 1):
+        cell = ws.cell(row=3, column=col, value=header)
+        cell.font = header_font
+        cell.fill = header_fill
+        cell.border = border
+
+    # Data
+    if "outstanding_balances" in data:
+        for row, balance in enumerate(data["outstanding_balances"], 4):
+            ws.cell(row=row, column=1, value=balance["vendor"]).border = border
+            ws.cell(row=row, column=2, value=balance["description"]).border = border
+            ws.cell(row=row, column=3, value=balance["amount"]).border = border
+            ws.cell(row=row, column=4, value=balance["due_date"]).border = border
+
+    # Total
+    if "outstanding_balances" in data:
+        total_row = len(data["outstanding_balances"]) + 5
+        ws[f"A{total_row}"] = "Total Outstanding:"
+        ws[f"A{total_row}"].font = Font(bold=True)
+        ws[f"C{total_row}"] = f"KES {project_info.get('total_outstanding', 0):,}"
+        ws[f"C{total_row}"].font = Font(bold=True)
+
+    # Adjust column widths
+    ws.column_dimensions["A"].width = 20
+    ws.column_dimensions["B"].width = 40
+    ws.column_dimensions["C"].width = 15
+    ws.column_dimensions["D"].width = 20
+
+
+def build_unpaid_labor_sheet(ws, data):
+    """Write the Unpaid Labor sheet"""
+    project_info = data["project_info"]
+
+    # Title
+    ws["A1"] = "UNPAID LABOR EXPENSES"
+    ws["A1"].font = Font(bold=True, size=16, color="2C5F2D")
+    ws.merge_cells("A1:D1")
+
+    # Headers
+    headers = ["Date", "Description", "Amount", "Status"]
+    for col, header in enumerate(headers, 1):
+        cell = ws.cell(row=3, column=col, value=header)
+        cell.font = header_font
+        cell.fill = header_fill
+        cell.border = border
+
+    # Data
+    if "unpaid_expenses" in data:
+        for row, expense in enumerate(data["unpaid_expenses"], 4):
+            ws.cell(row=row, column=1, value=expense["date"]).border = border
+            ws.cell(row=row, column=2, value=expense["description"]).border = border
+            ws.cell(row=row, column=3, value=expense["amount"]).border = border
+            ws.cell(row=row, column=4, value="PENDING").border = border
+            # Highlight pending status in red
+            ws.cell(row=row, column=4).font = Font(color="E74C3C", bold=True)
+
+    # Total
+    if "unpaid_expenses" in data:
+        total_row = len(data["unpaid_expenses"]) + 5
+        ws[f"A{total_row}"] = "Total Unpaid Labor:"
+        ws[f"A{total_row}"].font = Font(bold=True)
+        ws[f"C{total_row}"] = f"KES {project_info.get('total_unpaid_labor', 0):,}"
+        ws[f"C{total_row}"].font = Font(bold=True)
+
+    # Adjust column widths
+    ws.column_dimensions["A"].width = 15
+    ws.column_dimensions["B"].width = 30
+    ws.column_dimensions["C"].width = 15
+    ws.column_dimensions["D"].width = 15
+
+
+def build_pending_purchases_sheet(ws, data):
+    """Write the Pending Purchases sheet"""
+    project_info = data["project_info"]
+
+    # Title
+    ws["A1"] = "PENDING PURCHASES (Not Yet Procured)"
+    ws["A1"].font = Font(bold=True, size=16, color="2C5F2D")
+    ws.merge_cells("A1:C1")
+
+    # Headers
+    headers = ["Category", "Description", "Amount"]
+    for col, header in enumerate(headers, 1):
+        cell = ws.cell(row=3, column=col, value=header)
+        cell.font = header_font
+        cell.fill = header_fill
+        cell.border = border
+
+    # Data
+    if "pending_purchases" in data:
+        for row, purchase in enumerate(data["pending_purchases"], 4):
+            ws.cell(row=row, column=1, value=purchase["category"]).border = border
+            ws.cell(row=row, column=2, value=purchase["description"]).border = border
+            ws.cell(row=row, column=3, value=purchase["amount"]).border = border
+
+            # Highlight contingency row in different color
+            if "Contingency" in purchase.get("category", ""):
+                ws.cell(row=row, column=1).fill = PatternFill(
+                    start_color="FFF3CD", end_color="FFF3CD", fill_type="solid"
+                )
+                ws.cell(row=row, column=2).fill = PatternFill(
+                    start_color="FFF3CD", end_color="FFF3CD", fill_type="solid"
+                )
+                ws.cell(row=row, column=3).fill = PatternFill(
+                    start_color="FFF3CD", end_color="FFF3CD", fill_type="solid"
+                )
+
+        # Total
+        total_row = len(data["pending_purchases"]) + 5
+        ws[f"A{total_row}"] = "Total Pending Purchases:"
+        ws[f"A{total_row}"].font = Font(bold=True)
+        ws[f"C{total_row}"] = f"KES {project_info.get('total_pending_purchases', 0):,}"
+        ws[f"C{total_row}"].font = Font(bold=True, size=12, color="E74C3C")
+
+        # Add breakdown summary
+        ws[f"A{total_row+2}"] = "SUMMARY:"
+        ws[f"A{total_row+2}"].font = Font(bold=True, size=12, color="2C5F2D")
+        ws[f"A{total_row+3}"] = "1. Already Spent (Paid):"
+        ws[f"B{total_row+3}"] = f"KES {project_info['total_cost']:,}"
+        ws[f"A{total_row+4}"] = "2. Outstanding Balances:"
+        ws[f"B{total_row+4}"] = f"KES {project_info['total_outstanding']:,}"
+        ws[f"A{total_row+5}"] = "3. Unpaid Labor:"
+        ws[f"B{total_row+5}"] = f"KES {project_info['total_unpaid_labor']:,}"
+        ws[f"A{total_row+6}"] = "4. Pending Purchases:"
+        ws[f"B{total_row+6}"] = f"KES {project_info['total_pending_purchases']:,}"
+        ws[f"A{total_row+8}"] = "TOTAL PROJECT COST:"
+        ws[f"A{total_row+8}"].font = Font(bold=True, size=14, color="E74C3C")
+        ws[f"B{total_row+8}"] = f"KES {project_info['total_project_cost']:,}"
+        ws[f"B{total_row+8}"].font = Font(bold=True, size=14, color="E74C3C")
+        ws[f"A{total_row+9}"] = "Current Budget:"
+        ws[f"B{total_row+9}"] = f"KES {project_info['total_budget']:,}"
+        ws[f"A{total_row+10}"] = "Additional Funds Needed:"
+        ws[f"A{total_row+10}"].font = Font(bold=True, size=12, color="C0392B")
+        ws[f"B{total_row+10}"] = f"KES {project_info['additional_funds_needed']:,}"
+        ws[f"B{total_row+10}"].font = Font(bold=True, size=12, color="C0392B")
+
+    # Adjust column widths
+    ws.column_dimensions["A"].width = 30
+    ws.column_dimensions["B"].width = 60
+    ws.column_dimensions["C"].width = 15
+
+
+# Sheet title -> builder, in workbook order
+SHEET_BUILDERS = {
+    "Home Summary": build_home_summary_sheet,
+    DAILY_EXPENSES_SHEET: build_daily_expenses_sheet,
+    "Category Analysis": build_category_analysis_sheet,
+    "M-Pesa Fees": build_mpesa_fees_sheet,
+    "Outstanding Balances": build_outstanding_balances_sheet,
+    "Unpaid Labor": build_unpaid_labor_sheet,
+    "Pending Purchases": build_pending_purchases_sheet,
+}
+SHEET_TITLES = list(SHEET_BUILDERS)
+
+
+def _as_report_data(data_or_df):
+    """Dashboard-shaped data from a dashboard dict or a processed DataFrame"""
+    if not isinstance(data_or_df, pd.DataFrame):
+        return data_or_df
+
+    # Imported here so building from a ready-made dict stays lightweight
+    from calculations import (
+        calculate_category_summary,
+        calculate_pending_amounts,
+        calculate_project_totals,
+        calculate_summary_stats,
+    )
+    from data import get_outstanding_balances, get_pending_purchases
+    from reports import build_dashboard_data
+
+    df = data_or_df
+    outstanding_balances = get_outstanding_balances()
+    summary_stats = calculate_summary_stats(df)
+    pending_amounts = calculate_pending_amounts(
+        df, outstanding_balances, get_pending_purchases()
+    )
+    return build_dashboard_data(
+        df,
+        summary_stats,
+        pending_amounts,
+        calculate_project_totals(summary_stats, pending_amounts),
+        calculate_category_summary(df),
+        outstanding_balances,
+    )
+
+
+def build_workbook(data_or_df, output_path, sheets=None, streaming=False):
+    """
+    Build the expense workbook and save it.
+
+    Args:
+        data_or_df: Dictionary from reports.build_dashboard_data (or the
+            parsed expense_data.json), or a processed expenses DataFrame
+            whose summaries are then calculated here
+        output_path: Path to save the .xlsx file
+        sheets: Optional list of sheet titles to build (default: all)
+        streaming: Stream the Daily Expenses sheet through a write-only
+            workbook to keep memory flat for large ledgers
+
+    Returns:
+        List of sheet titles created, in workbook order
+    """
+    if sheets is None:
+        titles = SHEET_TITLES
     else:
-        bracket = "35001+"
-
-    if bracket not in fee_analysis:
-        fee_analysis[bracket] = {"count": 0, "total_fees": 0, "fee_rate": fee}
-    fee_analysis[bracket]["count"] += 1
-    fee_analysis[bracket]["total_fees"] += fee
-
-# Add fee analysis to sheet
-row = 5
-for bracket, analysis in fee_analysis.items():
-    ws.cell(row=row, column=1, value=bracket)
-    ws.cell(row=row, column=2, value=analysis["fee_rate"])
-    ws.cell(row=row, column=3, value=analysis["count"])
-    ws.cell(row=row, column=4, value=analysis["total_fees"])
-    row += 1
-
-# Summary
-ws[f"A{row+2}"] = "Total M-Pesa Fees:"
-ws[f"B{row+2}"] = f"KES {project_info['total_mpesa_fees']:,}"
-ws[f"B{row+2}"].font = Font(bold=True)
-
-# === OUTSTANDING BALANCES SHEET ===
-ws = outstanding_sheet
-
-# Title
-ws["A1"] = "OUTSTANDING BALANCES"
-ws["A1"].font = Font(bold=True, size=16, color="2C5F2D")
-ws.merge_cells("A1:D1")
-
-# Headers
-headers = ["Vendor", "Description", "Amount", "Due Date"]
-for col, header in enumerate(headers, 1):
-    cell = ws.cell(row=3, column=col, value=header)
-    cell.font = header_font
-    cell.fill = header_fill
-    cell.border = border
-
-# Data
-if "outstanding_balances" in data:
-    for row, balance in enumerate(data["outstanding_balances"], 4):
-        ws.cell(row=row, column=1, value=balance["vendor"]).border = border
-        ws.cell(row=row, column=2, value=balance["description"]).border = border
-        ws.cell(row=row, column=3, value=balance["amount"]).border = border
-        ws.cell(row=row, column=4, value=balance["due_date"]).border = border
-
-# Total
-if "outstanding_balances" in data:
-    total_row = len(data["outstanding_balances"]) + 5
-    ws[f"A{total_row}"] = "Total Outstanding:"
-    ws[f"A{total_row}"].font = Font(bold=True)
-    ws[f"C{total_row}"] = f"KES {project_info.get('total_outstanding', 0):,}"
-    ws[f"C{total_row}"].font = Font(bold=True)
-
-# Adjust column widths
-ws.column_dimensions["A"].width = 20
-ws.column_dimensions["B"].width = 40
-ws.column_dimensions["C"].width = 15
-ws.column_dimensions["D"].width = 20
-
-# === UNPAID LABOR SHEET ===
-ws = unpaid_sheet
-
-# Title
-ws["A1"] = "UNPAID LABOR EXPENSES"
-ws["A1"].font = Font(bold=True, size=16, color="2C5F2D")
-ws.merge_cells("A1:D1")
-
-# Headers
-headers = ["Date", "Description", "Amount", "Status"]
-for col, header in enumerate(headers, 1):
-    cell = ws.cell(row=3, column=col, value=header)
-    cell.font = header_font
-    cell.fill = header_fill
-    cell.border = border
-
-# Data
-if "unpaid_expenses" in data:
-    for row, expense in enumerate(data["unpaid_expenses"], 4):
-        ws.cell(row=row, column=1, value=expense["date"]).border = border
-        ws.cell(row=row, column=2, value=expense["description"]).border = border
-        ws.cell(row=row, column=3, value=expense["amount"]).border = border
-        ws.cell(row=row, column=4, value="PENDING").border = border
-        # Highlight pending status in red
-        ws.cell(row=row, column=4).font = Font(color="E74C3C", bold=True)
-
-# Total
-if "unpaid_expenses" in data:
-    total_row = len(data["unpaid_expenses"]) + 5
-    ws[f"A{total_row}"] = "Total Unpaid Labor:"
-    ws[f"A{total_row}"].font = Font(bold=True)
-    ws[f"C{total_row}"] = f"KES {project_info.get('total_unpaid_labor', 0):,}"
-    ws[f"C{total_row}"].font = Font(bold=True)
-
-# Adjust column widths
-ws.column_dimensions["A"].width = 15
-ws.column_dimensions["B"].width = 30
-ws.column_dimensions["C"].width = 15
-ws.column_dimensions["D"].width = 15
-
-# === PENDING PURCHASES SHEET ===
-ws = pending_purchases_sheet
-
-# Title
-ws["A1"] = "PENDING PURCHASES (Not Yet Procured)"
-ws["A1"].font = Font(bold=True, size=16, color="2C5F2D")
-ws.merge_cells("A1:C1")
-
-# Headers
-headers = ["Category", "Description", "Amount"]
-for col, header in enumerate(headers, 1):
-    cell = ws.cell(row=3, column=col, value=header)
-    cell.font = header_font
-    cell.fill = header_fill
-    cell.border = border
-
-# Data
-if "pending_purchases" in data:
-    for row, purchase in enumerate(data["pending_purchases"], 4):
-        ws.cell(row=row, column=1, value=purchase["category"]).border = border
-        ws.cell(row=row, column=2, value=purchase["description"]).border = border
-        ws.cell(row=row, column=3, value=purchase["amount"]).border = border
-
-        # Highlight contingency row in different color
-        if "Contingency" in purchase.get("category", ""):
-            ws.cell(row=row, column=1).fill = PatternFill(
-                start_color="FFF3CD", end_color="FFF3CD", fill_type="solid"
-            )
-            ws.cell(row=row, column=2).fill = PatternFill(
-                start_color="FFF3CD", end_color="FFF3CD", fill_type="solid"
-            )
-            ws.cell(row=row, column=3).fill = PatternFill(
-                start_color="FFF3CD", end_color="FFF3CD", fill_type="solid"
+        unknown = set(sheets) - set(SHEET_BUILDERS)
+        if unknown:
+            raise ValueError(f"Unknown sheets: {', '.join(sorted(unknown))}")
+        titles = [title for title in SHEET_TITLES if title in sheets]
+
+    data = _as_report_data(data_or_df)
+
+    # In streaming mode this holds only the small random-access sheets; they are
+    # copied into a write-only workbook alongside the streamed Daily Expenses sheet
+    wb = Workbook()
+    wb.remove(wb.active)
+    register_named_styles(wb)
+
+    streaming_wb = None
+    if streaming:
+        streaming_wb = Workbook(write_only=True)
+        register_named_styles(streaming_wb)
+
+    for title in titles:
+        if streaming and title == DAILY_EXPENSES_SHEET:
+            write_daily_expenses(
+                streaming_wb.create_sheet(title), data["daily_expenses"]
             )
+            continue
 
-    # Total
-    total_row = len(data["pending_purchases"]) + 5
-    ws[f"A{total_row}"] = "Total Pending Purchases:"
-    ws[f"A{total_row}"].font = Font(bold=True)
-    ws[f"C{total_row}"] = f"KES {project_info.get('total_pending_purchases', 0):,}"
-    ws[f"C{total_row}"].font = Font(bold=True, size=12, color="E74C3C")
-
-    # Add breakdown summary
-    ws[f"A{total_row+2}"] = "SUMMARY:"
-    ws[f"A{total_row+2}"].font = Font(bold=True, size=12, color="2C5F2D")
-    ws[f"A{total_row+3}"] = "1. Already Spent (Paid):"
-    ws[f"B{total_row+3}"] = f"KES {project_info['total_cost']:,}"
-    ws[f"A{total_row+4}"] = "2. Outstanding Balances:"
-    ws[f"B{total_row+4}"] = f"KES {project_info['total_outstanding']:,}"
-    ws[f"A{total_row+5}"] = "3. Unpaid Labor:"
-    ws[f"B{total_row+5}"] = f"KES {project_info['total_unpaid_labor']:,}"
-    ws[f"A{total_row+6}"] = "4. Pending Purchases:"
-    ws[f"B{total_row+6}"] = f"KES {project_info['total_pending_purchases']:,}"
-    ws[f"A{total_row+8}"] = "TOTAL PROJECT COST:"
-    ws[f"A{total_row+8}"].font = Font(bold=True, size=14, color="E74C3C")
-    ws[f"B{total_row+8}"] = f"KES {project_info['total_project_cost']:,}"
-    ws[f"B{total_row+8}"].font = Font(bold=True, size=14, color="E74C3C")
-    ws[f"A{total_row+9}"] = "Current Budget:"
-    ws[f"B{total_row+9}"] = f"KES {project_info['total_budget']:,}"
-    ws[f"A{total_row+10}"] = "Additional Funds Needed:"
-    ws[f"A{total_row+10}"].font = Font(bold=True, size=12, color="C0392B")
-    ws[f"B{total_row+10}"] = f"KES {project_info['additional_funds_needed']:,}"
-    ws[f"B{total_row+10}"].font = Font(bold=True, size=12, color="C0392B")
-
-# Adjust column widths
-ws.column_dimensions["A"].width = 30
-ws.column_dimensions["B"].width = 60
-ws.column_dimensions["C"].width = 15
-
-# Save the Excel file
-wb.save(
-    "/Users/lemaiyan/dev/all/personal/mum-in-law-house/Mother-In-Law-House-Expenses.xlsx"
-)
-print("Excel file created: Mother-In-Law-House-Expenses.xlsx")
-print(
-    "Sheets created: Home Summary, Daily Expenses, Category Analysis, M-Pesa Fees, Outstanding Balances, Unpaid Labor, Pending Purchases"
-)
+        ws = wb.create_sheet(title)
+        SHEET_BUILDERS[title](ws, data)
+        if streaming:
+            copy_to_write_only(ws, streaming_wb.create_sheet(title))
+
+    (streaming_wb if streaming else wb).save(output_path)
+    return titles
+
+
+def main():
+    """Build the workbook from the exported expense_data.json."""
+    parser = argparse.ArgumentParser(description="Create the expense Excel workbook.")
+    parser.add_argument(
+        "--input",
+        default=DEFAULT_INPUT_PATH,
+        help="processed expense JSON from process_expenses.py",
+    )
+    parser.add_argument(
+        "--output",
+        default=DEFAULT_OUTPUT_PATH,
+        help="path of the workbook to write",
+    )
+    parser.add_argument(
+        "--streaming",
+        action="store_true",
+        help="stream the Daily Expenses sheet through a write-only workbook",
+    )
+    parser.add_argument(
+        "--sheets",
+        nargs="+",
+        metavar="TITLE",
+        help="only build these sheets (default: all)",
+    )
+    args = parser.parse_args()
+
+    # Load the processed data
+    with open(args.input, "r") as f:
+        data = json.load(f)
+
+    titles = build_workbook(
+        data, args.output, sheets=args.sheets, streaming=args.streaming
+    )
+    print(f"Excel file created: {os.path.basename(args.output)}")
+    print(f"Sheets created: {', '.join(titles)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,22 @@
 """Data package for Mother-in-Law House expense tracking."""
 
-from .expenses import get_expenses_data
 from .pending_items import get_outstanding_balances, get_pending_purchases
+from .store import (
+    add_expense,
+    add_expenses,
+    get_expenses_data,
+    get_store_state,
+    mark_paid,
+    update_expense,
+)
 
 __all__ = [
+    "add_expense",
+    "add_expenses",
     "get_expenses_data",
     "get_outstanding_balances",
     "get_pending_purchases",
+    "get_store_state",
+    "mark_paid",
+    "update_expense",
 ]
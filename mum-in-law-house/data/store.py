@@ -0,0 +1,338 @@
+"""SQLite-backed expense store."""
+
+import os
+import sqlite3
+from datetime import date, datetime
+
+DEFAULT_DB_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "expenses.db"
+)
+
+SCHEMA_VERSION = 1
+
+EXPENSE_FIELDS = (
+    "date",
+    "category",
+    "subcategory",
+    "description",
+    "amount",
+    "vendor",
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS expenses (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    date TEXT NOT NULL,
+    category TEXT NOT NULL,
+    subcategory TEXT NOT NULL,
+    description TEXT NOT NULL,
+    amount NUMERIC NOT NULL,
+    vendor TEXT NOT NULL,
+    -- DD/MM/YYYY is kept for display; the ISO form makes ranges indexable
+    date_iso TEXT GENERATED ALWAYS AS (
+        substr(date, 7, 4) || '-' || substr(date, 4, 2) || '-' || substr(date, 1, 2)
+    ) STORED,
+    status TEXT GENERATED ALWAYS AS (
+        CASE WHEN instr(description, 'UNPAID') > 0 THEN 'unpaid' ELSE 'paid' END
+    ) STORED
+);
+CREATE INDEX IF NOT EXISTS idx_expenses_date ON expenses (date_iso);
+CREATE INDEX IF NOT EXISTS idx_expenses_category ON expenses (category);
+CREATE INDEX IF NOT EXISTS idx_expenses_vendor ON expenses (vendor);
+CREATE INDEX IF NOT EXISTS idx_expenses_status ON expenses (status);
+
+-- Lets incremental readers (the ledger) notice a replaced database and
+-- edits to rows they have already read, without rereading them
+CREATE TABLE IF NOT EXISTS store_meta (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO store_meta VALUES ('store_id', abs(random()));
+INSERT OR IGNORE INTO store_meta VALUES ('edit_count', 0);
+CREATE TRIGGER IF NOT EXISTS expenses_count_updates AFTER UPDATE ON expenses
+BEGIN
+    UPDATE store_meta SET value = value + 1 WHERE name = 'edit_count';
+END;
+CREATE TRIGGER IF NOT EXISTS expenses_count_deletes AFTER DELETE ON expenses
+BEGIN
+    UPDATE store_meta SET value = value + 1 WHERE name = 'edit_count';
+END;
+"""
+
+
+def _to_iso(value):
+    """Convert a DD/MM/YYYY string, date or datetime to YYYY-MM-DD."""
+    if isinstance(value, (date, datetime)):
+        return value.strftime("%Y-%m-%d")
+    return datetime.strptime(value, "%d/%m/%Y").strftime("%Y-%m-%d")
+
+
+def _to_stored_date(value):
+    """
+    Normalize an expense date to the zero-padded DD/MM/YYYY the store keeps.
+
+    Raises:
+        ValueError: If the value is not a DD/MM/YYYY string, date or datetime
+    """
+    if isinstance(value, (date, datetime)):
+        return value.strftime("%d/%m/%Y")
+    try:
+        return datetime.strptime(value, "%d/%m/%Y").strftime("%d/%m/%Y")
+    except (TypeError, ValueError):
+        raise ValueError(f"Expense date must be DD/MM/YYYY, got {value!r}") from None
+
+
+def connect(db_path=None):
+    """
+    Open the expense store, creating and migrating it on first use.
+
+    Args:
+        db_path: Path to the SQLite database (defaults to data/expenses.db)
+
+    Returns:
+        sqlite3.Connection with the schema in place
+    """
+    conn = sqlite3.connect(db_path or DEFAULT_DB_PATH)
+    conn.row_factory = sqlite3.Row
+    conn.executescript(SCHEMA)
+
+    # user_version marks a completed migration; it is set in the same
+    # transaction as the imported rows, so a failed migration leaves neither
+    if conn.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+        with conn:
+            migrate_from_literal(conn)
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    return conn
+
+
+def migrate_from_literal(conn):
+    """
+    One-time import of the legacy Python literal in data/expenses.py.
+
+    Rows are inserted in their original order so the store's ids keep the
+    append order the incremental ledger relies on. The caller owns the
+    transaction, so the import can commit together with the schema version.
+
+    Args:
+        conn: Open connection to an empty expense store
+
+    Returns:
+        Number of rows imported
+    """
+    # Imported here so normal reads never compile the 4,600-line literal
+    from .expenses import get_expenses_data as get_literal_expenses_data
+
+    return _insert_expenses(conn, get_literal_expenses_data())
+
+
+def _insert_expenses(conn, expenses):
+    """
+    Insert expense rows without committing; returns the row count.
+
+    Raises:
+        ValueError: If an expense's date is not a valid DD/MM/YYYY date
+    """
+    cursor = conn.executemany(
+        f"INSERT INTO expenses ({', '.join(EXPENSE_FIELDS)}) "
+        f"VALUES ({', '.join('?' * len(EXPENSE_FIELDS))})",
+        (
+            tuple(
+                _to_stored_date(expense[field]) if field == "date" else expense[field]
+                for field in EXPENSE_FIELDS
+            )
+            for expense in expenses
+        ),
+    )
+    return cursor.rowcount
+
+
+def add_expenses(expenses, conn=None, db_path=None):
+    """
+    Append expense rows to the store.
+
+    Args:
+        expenses: Iterable of expense dictionaries with the standard fields;
+            dates are DD/MM/YYYY strings or dates
+        conn: Optional open connection (takes precedence over db_path)
+        db_path: Path to the SQLite database when no connection is given
+
+    Returns:
+        Number of rows inserted
+
+    Raises:
+        ValueError: If an expense's date is not a valid DD/MM/YYYY date; no
+            rows are inserted then
+    """
+    owns_conn = conn is None
+    if owns_conn:
+        conn = connect(db_path)
+
+    try:
+        with conn:
+            return _insert_expenses(conn, expenses)
+    finally:
+        if owns_conn:
+            conn.close()
+
+
+def add_expense(expense, db_path=None):
+    """Append a single expense row to the store."""
+    return add_expenses([expense], db_path=db_path)
+
+
+def update_expense(expense_id, changes, db_path=None):
+    """
+    Change fields of a stored expense.
+
+    Args:
+        expense_id: Store id of the expense (see get_expenses_data's include_ids)
+        changes: Dictionary of standard fields to new values
+        db_path: Path to the SQLite database (defaults to data/expenses.db)
+
+    Returns:
+        Number of rows updated (0 if there is no such expense)
+
+    Raises:
+        ValueError: If a field is unknown or the date is not a valid
+            DD/MM/YYYY date
+    """
+    unknown = set(changes) - set(EXPENSE_FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown expense fields: {', '.join(sorted(unknown))}")
+    if not changes:
+        return 0
+    if "date" in changes:
+        changes = {**changes, "date": _to_stored_date(changes["date"])}
+
+    assignments = ", ".join(f"{field} = ?" for field in changes)
+    conn = connect(db_path)
+    try:
+        with conn:
+            cursor = conn.execute(
+                f"UPDATE expenses SET {assignments} WHERE id = ?",
+                (*changes.values(), expense_id),
+            )
+        return cursor.rowcount
+    finally:
+        conn.close()
+
+
+def mark_paid(expense_id, paid_on=None, db_path=None):
+    """
+    Mark an unpaid expense as paid.
+
+    The "UNPAID" marker in its description, which is what makes the status
+    unpaid, is replaced with "paid <date>".
+
+    Args:
+        expense_id: Store id of the expense (see get_expenses_data's include_ids)
+        paid_on: Payment date, DD/MM/YYYY string or date (defaults to today)
+        db_path: Path to the SQLite database (defaults to data/expenses.db)
+
+    Returns:
+        Number of rows updated (0 if there is no such unpaid expense)
+    """
+    if paid_on is None:
+        paid_on = date.today()
+    paid_on = _to_stored_date(paid_on)
+
+    conn = connect(db_path)
+    try:
+        with conn:
+            cursor = conn.execute(
+                "UPDATE expenses SET description = replace(description, 'UNPAID', ?) "
+                "WHERE id = ? AND status = 'unpaid'",
+                (f"paid {paid_on}", expense_id),
+            )
+        return cursor.rowcount
+    finally:
+        conn.close()
+
+
+def get_expenses_data(
+    start_date=None,
+    end_date=None,
+    category=None,
+    vendor=None,
+    status=None,
+    after_id=None,
+    include_ids=False,
+    db_path=None,
+):
+    """
+    Returns expense transactions from the store, in the order they were added.
+    Each expense includes: date, category, subcategory, description, amount, vendor
+
+    Filters are applied in SQL so only matching rows are loaded.
+
+    Args:
+        start_date: Earliest date (inclusive), DD/MM/YYYY string or date
+        end_date: Latest date (inclusive), DD/MM/YYYY string or date
+        category: Only expenses in this category
+        vendor: Only expenses from this vendor
+        status: Only "paid" or "unpaid" expenses
+        after_id: Only expenses added after the one with this store id
+        include_ids: Add each expense's store "id", for update_expense and
+            mark_paid
+        db_path: Path to the SQLite database (defaults to data/expenses.db)
+
+    Returns:
+        List of expense dictionaries
+    """
+    clauses = []
+    params = []
+
+    if start_date is not None:
+        clauses.append("date_iso >= ?")
+        params.append(_to_iso(start_date))
+    if end_date is not None:
+        clauses.append("date_iso <= ?")
+        params.append(_to_iso(end_date))
+    if category is not None:
+        clauses.append("category = ?")
+        params.append(category)
+    if vendor is not None:
+        clauses.append("vendor = ?")
+        params.append(vendor)
+    if status is not None:
+        clauses.append("status = ?")
+        params.append(status)
+    if after_id is not None:
+        clauses.append("id > ?")
+        params.append(after_id)
+
+    columns = ("id", *EXPENSE_FIELDS) if include_ids else EXPENSE_FIELDS
+    query = f"SELECT {', '.join(columns)} FROM expenses"
+    if clauses:
+        query += " WHERE " + " AND ".join(clauses)
+    query += " ORDER BY id"
+
+    conn = connect(db_path)
+    try:
+        return [dict(row) for row in conn.execute(query, params)]
+    finally:
+        conn.close()
+
+
+def get_store_state(db_path=None):
+    """
+    Markers an incremental reader compares to know what changed.
+
+    Args:
+        db_path: Path to the SQLite database (defaults to data/expenses.db)
+
+    Returns:
+        Dictionary of store_id (random, fixed when the database is
+        created), last_id (highest expense id, 0 when empty) and
+        edit_count (updates and deletes ever made to expenses)
+    """
+    conn = connect(db_path)
+    try:
+        state = dict(conn.execute("SELECT name, value FROM store_meta").fetchall())
+        state["last_id"] = conn.execute(
+            "SELECT coalesce(max(id), 0) FROM expenses"
+        ).fetchone()[0]
+        return state
+    finally:
+        conn.close()
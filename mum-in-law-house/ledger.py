@@ -0,0 +1,333 @@
+"""
+Incremental expense ledger with persisted running totals.
+
+Only aggregates are persisted, with the store id of the last expense
+folded in as the watermark. Each run reads just the expenses past the
+watermark from the store. Edits to earlier rows are detected through the
+store's edit counter, which triggers keep up to date, and force a rebuild.
+"""
+
+import json
+import math
+import os
+
+import pandas as pd
+from calculations import (
+    calculate_category_summary,
+    calculate_summary_stats,
+    process_expenses,
+    rank_category_summary,
+)
+from config import MPESA_FEE_SCHEDULE, TOTAL_BUDGET
+from data import get_expenses_data, get_store_state
+
+LEDGER_VERSION = 3
+
+TOTAL_KEYS = ("total_spent", "total_mpesa_fees", "total_cost")
+CATEGORY_KEYS = (
+    "amount",
+    "mpesa_fee",
+    "total_cost",
+    "transaction_count",
+    "paid_count",
+    "unpaid_count",
+    "unpaid_amount",
+)
+CATEGORY_COUNT_KEYS = ("transaction_count", "paid_count", "unpaid_count")
+STATUS_KEYS = ("count", "amount", "total_cost")
+FEE_BRACKET_KEYS = ("count", "total_fees")
+MARKER_KEYS = ("store_id", "edit_count", "watermark")
+
+
+def empty_ledger_state():
+    """
+    Create a ledger state with no expenses folded in.
+
+    Returns:
+        Dictionary with zeroed aggregates and a watermark of 0
+    """
+    return {
+        "version": LEDGER_VERSION,
+        "watermark": 0,
+        "store_id": None,
+        "edit_count": 0,
+        "totals": {key: 0.0 for key in TOTAL_KEYS},
+        "categories": {},
+        "statuses": {},
+        "fee_brackets": {},
+    }
+
+
+def load_ledger_state(path):
+    """
+    Load a persisted ledger state.
+
+    Args:
+        path: Path to the ledger JSON file
+
+    Returns:
+        Ledger state dictionary, or None if missing or from another version
+    """
+    if not os.path.exists(path):
+        return None
+
+    with open(path, "r") as f:
+        state = json.load(f)
+
+    if state.get("version") != LEDGER_VERSION:
+        return None
+    return state
+
+
+def save_ledger_state(state, path):
+    """
+    Persist a ledger state to disk.
+
+    Args:
+        state: Ledger state dictionary
+        path: Path to the ledger JSON file
+    """
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(state, f)
+    os.replace(tmp_path, path)
+
+
+def _add_records(target, records, key_column, value_keys):
+    """Fold grouped records into a {key: {value_key: total}} mapping."""
+    for record in records:
+        bucket = target.setdefault(record[key_column], {key: 0.0 for key in value_keys})
+        for key in value_keys:
+            bucket[key] += float(record[key])
+
+
+def fold_expenses(state, df):
+    """
+    Fold newly processed expenses into the ledger aggregates.
+
+    Args:
+        state: Ledger state dictionary (updated in place)
+        df: DataFrame from process_expenses for the appended rows only
+
+    Returns:
+        The updated ledger state
+    """
+    summary_stats = calculate_summary_stats(df)
+    paid_df = summary_stats["paid_df"]
+    category_summary = calculate_category_summary(df)
+
+    for key in TOTAL_KEYS:
+        state["totals"][key] += float(summary_stats[key])
+
+    category_records = category_summary.to_dict("records")
+    _add_records(state["categories"], category_records, "category", CATEGORY_KEYS)
+    for record in category_records:
+        bucket = state["categories"][record["category"]]
+        bucket["max_amount"] = max(
+            bucket.get("max_amount", 0.0), float(record["max_amount"])
+        )
+
+    status_summary = (
+        df.groupby("status")
+        .agg(
+            count=("amount", "size"),
+            amount=("amount", "sum"),
+            total_cost=("total_cost", "sum"),
+        )
+        .reset_index()
+    )
+    _add_records(
+        state["statuses"], status_summary.to_dict("records"), "status", STATUS_KEYS
+    )
+
+    # Fees only apply to paid expenses, so brackets are tracked over those
+    bracket_summary = MPESA_FEE_SCHEDULE.summarize(
+        paid_df["amount"], paid_df["mpesa_fee"]
+    )
+    _add_records(
+        state["fee_brackets"],
+        bracket_summary.to_dict("records"),
+        "bracket",
+        FEE_BRACKET_KEYS,
+    )
+
+    return state
+
+
+def update_ledger(state, db_path=None):
+    """
+    Bring a ledger state up to date with the expense store.
+
+    Only expenses added after the watermark are read and processed. If an
+    earlier row was updated or deleted (e.g. labor marked as paid), or the
+    database was replaced, the ledger is rebuilt from scratch so the stored
+    totals never go stale.
+
+    Args:
+        state: Ledger state from load_ledger_state, or None to rebuild
+        db_path: Path to the expense store (defaults to data/expenses.db)
+
+    Returns:
+        Tuple of (state, DataFrame from process_expenses of the rows
+        processed, with their store "id", or None if there were none,
+        whether it was rebuilt)
+    """
+    store = get_store_state(db_path)
+    rebuilt = (
+        state is None
+        or state["store_id"] != store["store_id"]
+        or state["edit_count"] != store["edit_count"]
+        or state["watermark"] > store["last_id"]
+    )
+    if rebuilt:
+        state = empty_ledger_state()
+        state["store_id"] = store["store_id"]
+        state["edit_count"] = store["edit_count"]
+
+    new_rows = get_expenses_data(
+        after_id=state["watermark"], include_ids=True, db_path=db_path
+    )
+    if not new_rows:
+        return state, None, rebuilt
+
+    new_df = process_expenses(new_rows)
+    fold_expenses(state, new_df)
+    state["watermark"] = new_rows[-1]["id"]
+    return state, new_df, rebuilt
+
+
+def ledger_markers(state):
+    """
+    What a ledger state is current to: the store and the last expense read.
+
+    Args:
+        state: Ledger state dictionary
+
+    Returns:
+        Dictionary of store_id, edit_count and watermark
+    """
+    return {key: state[key] for key in MARKER_KEYS}
+
+
+def ledger_summary_stats(state):
+    """
+    Summary statistics from the ledger's running totals.
+
+    Args:
+        state: Ledger state dictionary
+
+    Returns:
+        Dictionary shaped like calculate_summary_stats, without paid_df
+    """
+    totals = state["totals"]
+    return {
+        "total_spent": totals["total_spent"],
+        "total_mpesa_fees": totals["total_mpesa_fees"],
+        "total_cost": totals["total_cost"],
+        "balance_remaining": TOTAL_BUDGET - totals["total_cost"],
+        "percentage_used": (totals["total_cost"] / TOTAL_BUDGET) * 100,
+    }
+
+
+def ledger_category_summary(state, df):
+    """
+    Category breakdown from the ledger's running totals.
+
+    Medians can't be folded incrementally, so they are the one statistic
+    computed from the expenses themselves.
+
+    Args:
+        state: Ledger state dictionary
+        df: Every processed expense up to the watermark (see
+            process_expenses.load_processed_expenses)
+
+    Returns:
+        DataFrame shaped like calculate_category_summary
+    """
+    category_summary = pd.DataFrame(
+        [
+            {"category": category, **totals}
+            for category, totals in state["categories"].items()
+        ],
+        columns=["category", *CATEGORY_KEYS, "max_amount"],
+    )
+    category_summary = category_summary.astype(
+        {key: "int64" for key in CATEGORY_COUNT_KEYS}
+    )
+
+    paid_counts = category_summary["paid_count"]
+    category_summary["mean_amount"] = (
+        category_summary["amount"] / paid_counts.where(paid_counts > 0)
+    ).fillna(0.0)
+
+    if df.empty:
+        medians = pd.Series(dtype=float)
+    else:
+        paid_rows = df[df["status"] == "paid"]
+        medians = paid_rows.groupby("category")["amount"].median()
+    category_summary["median_amount"] = (
+        category_summary["category"].map(medians).fillna(0.0)
+    )
+
+    column_order = [
+        "category",
+        "amount",
+        "mpesa_fee",
+        "total_cost",
+        "transaction_count",
+        "paid_count",
+        "unpaid_count",
+        "unpaid_amount",
+        "mean_amount",
+        "median_amount",
+        "max_amount",
+    ]
+    return rank_category_summary(category_summary[column_order])
+
+
+def check_ledger_consistency(state, db_path=None):
+    """
+    Compare incremental ledger totals against a full recompute.
+
+    Args:
+        state: Ledger state dictionary to verify
+        db_path: Path to the expense store (defaults to data/expenses.db)
+
+    Returns:
+        List of mismatch descriptions (empty when consistent)
+    """
+    full_state, _, _ = update_ledger(None, db_path)
+    mismatches = []
+
+    if state["watermark"] != full_state["watermark"]:
+        mismatches.append(
+            f"watermark: ledger {state['watermark']} != full {full_state['watermark']}"
+        )
+
+    for key in TOTAL_KEYS:
+        if not math.isclose(
+            state["totals"][key], full_state["totals"][key], abs_tol=0.01
+        ):
+            mismatches.append(
+                f"totals.{key}: ledger {state['totals'][key]} != full {full_state['totals'][key]}"
+            )
+
+    for section, value_keys in (
+        ("categories", (*CATEGORY_KEYS, "max_amount")),
+        ("statuses", STATUS_KEYS),
+        ("fee_brackets", FEE_BRACKET_KEYS),
+    ):
+        ledger_groups = state[section]
+        full_groups = full_state[section]
+        for group in sorted(set(ledger_groups) | set(full_groups)):
+            ledger_values = ledger_groups.get(group, {})
+            full_values = full_groups.get(group, {})
+            for key in value_keys:
+                ledger_value = ledger_values.get(key, 0.0)
+                full_value = full_values.get(key, 0.0)
+                if not math.isclose(ledger_value, full_value, abs_tol=0.01):
+                    mismatches.append(
+                        f"{section}[{group}].{key}: ledger {ledger_value} != full {full_value}"
+                    )
+
+    return mismatches
@@ -4,37 +4,156 @@ Main expense processing script for Mother-in-Law House construction project.
 
 This script orchestrates the expense tracking by:
 1. Loading expense data from data modules
-2. Processing expenses and calculating fees
+2. Processing newly appended expenses into the incremental ledger
 3. Generating summary reports
 4. Exporting data for dashboards
+5. Optionally building the Excel workbook in-process
+
+Usage:
+    python process_expenses.py [--full-rebuild] [--check] [--excel [--streaming]]
 """
 
+import argparse
+import os
+
+import pandas as pd
 from calculations import (
-    calculate_category_summary,
     calculate_pending_amounts,
     calculate_project_totals,
-    calculate_summary_stats,
     process_expenses,
 )
 from data import get_expenses_data, get_outstanding_balances, get_pending_purchases
-from reports import export_dashboard_data, print_summary_report
+from ledger import (
+    check_ledger_consistency,
+    ledger_category_summary,
+    ledger_markers,
+    ledger_summary_stats,
+    load_ledger_state,
+    save_ledger_state,
+    update_ledger,
+)
+from reports import build_dashboard_data, print_summary_report, save_dashboard_data
+from snapshot import (
+    CATEGORY_SUMMARY_FILENAME,
+    EXPENSES_FILENAME,
+    load_snapshot,
+    snapshot_available,
+    snapshot_markers,
+    write_snapshot,
+)
+
+OUTPUT_DIR = "/Users/lemaiyan/dev/all/personal/mum-in-law-house"
+LEDGER_PATH = os.path.join(OUTPUT_DIR, "expense_ledger.json")
+
+
+def parse_args():
+    """Parse command line options."""
+    parser = argparse.ArgumentParser(
+        description="Process Mother-in-Law House expenses and generate reports."
+    )
+    parser.add_argument(
+        "--full-rebuild",
+        action="store_true",
+        help="ignore the stored ledger and reprocess every expense",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="verify the incremental ledger totals against a full recompute",
+    )
+    parser.add_argument(
+        "--excel",
+        action="store_true",
+        help="also build the Excel workbook from the in-memory data",
+    )
+    parser.add_argument(
+        "--streaming",
+        action="store_true",
+        help="with --excel, stream the Daily Expenses sheet (large ledgers)",
+    )
+    return parser.parse_args()
+
+
+def load_processed_expenses(state, new_df, rebuilt, previous_markers):
+    """
+    Every processed expense up to the ledger's watermark.
+
+    After a rebuild the ledger has just processed every expense. Otherwise
+    the previous run's Arrow snapshot is reused when it was written at the
+    ledger's previous markers, and only the appended expenses are added to
+    it. Without such a snapshot (pyarrow missing, or a first run) the store
+    is read and processed in full.
+
+    Args:
+        state: Ledger state after update_ledger
+        new_df: Processed rows from update_ledger, or None
+        rebuilt: Whether update_ledger rebuilt the ledger
+        previous_markers: ledger_markers of the state before update_ledger,
+            or None if there was none
+
+    Returns:
+        DataFrame like process_expenses returns, in store order
+    """
+    if rebuilt and new_df is not None:
+        return new_df.drop(columns="id")
+
+    if (
+        snapshot_available()
+        and previous_markers is not None
+        and snapshot_markers(OUTPUT_DIR) == previous_markers
+    ):
+        df, _ = load_snapshot(OUTPUT_DIR, categoricals=False)
+        if new_df is None:
+            return df
+        return pd.concat([df, new_df.drop(columns="id")], ignore_index=True)
+
+    # Stop at the watermark so the rows match the ledger's totals
+    df = process_expenses(get_expenses_data(include_ids=True))
+    df = df[df["id"] <= state["watermark"]]
+    return df.drop(columns="id").reset_index(drop=True)
 
 
 def main():
     """Main function to process expenses and generate reports."""
+    args = parse_args()
+
     # Load data
-    expenses_data = get_expenses_data()
     outstanding_balances = get_outstanding_balances()
     pending_purchases = get_pending_purchases()
 
-    # Process expenses
-    df = process_expenses(expenses_data)
+    # Fold only the expenses appended to the store since the last run
+    state = None if args.full_rebuild else load_ledger_state(LEDGER_PATH)
+    previous_markers = None if state is None else ledger_markers(state)
+    state, new_df, rebuilt = update_ledger(state)
+    save_ledger_state(state, LEDGER_PATH)
 
-    # Calculate summaries
-    summary_stats = calculate_summary_stats(df)
-    category_summary = calculate_category_summary(summary_stats["paid_df"])
+    new_rows = 0 if new_df is None else len(new_df)
+    if rebuilt:
+        print(f"Ledger rebuilt: {new_rows} transactions processed\n")
+    else:
+        print(f"Ledger updated: {new_rows} new transactions processed\n")
+
+    if args.check:
+        mismatches = check_ledger_consistency(state)
+        if mismatches:
+            print("Ledger consistency check FAILED:")
+            for mismatch in mismatches:
+                print(f"  - {mismatch}")
+            raise SystemExit(1)
+        print("Ledger consistency check passed\n")
+
+    # The dashboard lists every expense and the medians need them too; the
+    # frame is the previous snapshot plus the appended rows, the totals come
+    # from the ledger and the unpaid expenses straight from the store
+    df = load_processed_expenses(state, new_df, rebuilt, previous_markers)
+    summary_stats = ledger_summary_stats(state)
+    category_summary = ledger_category_summary(state, df)
+    # Amounts keep the full frame's dtype so unpaid rows print like the rest
+    unpaid_df = process_expenses(get_expenses_data(status="unpaid")).astype(
+        {"amount": df["amount"].dtype}
+    )
     pending_amounts = calculate_pending_amounts(
-        df, outstanding_balances, pending_purchases
+        unpaid_df, outstanding_balances, pending_purchases
     )
     project_totals = calculate_project_totals(summary_stats, pending_amounts)
 
@@ -48,22 +167,43 @@ def main():
     )
 
     # Export dashboard data
-    output_path = "/Users/lemaiyan/dev/all/personal/mum-in-law-house/expense_data.json"
-    num_transactions = export_dashboard_data(
+    output_path = os.path.join(OUTPUT_DIR, "expense_data.json")
+    dashboard_data = build_dashboard_data(
         df,
         summary_stats,
         pending_amounts,
         project_totals,
         category_summary,
         outstanding_balances,
-        output_path,
     )
+    num_transactions = save_dashboard_data(dashboard_data, output_path)
 
     print(
         f"\nData exported for HTML dashboard: {num_transactions} transactions processed"
     )
     print(f"JSON file created: expense_data.json")
 
+    # Columnar snapshot for consumers that can memory-map instead of parsing JSON
+    if snapshot_available():
+        write_snapshot(df, category_summary, OUTPUT_DIR, ledger_markers(state))
+        print(
+            f"Arrow snapshot created: {EXPENSES_FILENAME}, {CATEGORY_SUMMARY_FILENAME}"
+        )
+    else:
+        print("Arrow snapshot skipped: install pyarrow to enable it")
+
+    # Excel workbook straight from memory, no JSON round trip; openpyxl is
+    # only needed when it is asked for
+    if args.excel:
+        from create_excel import DEFAULT_OUTPUT_PATH as EXCEL_OUTPUT_PATH
+        from create_excel import build_workbook
+
+        sheets = build_workbook(
+            dashboard_data, EXCEL_OUTPUT_PATH, streaming=args.streaming
+        )
+        print(f"Excel file created: {os.path.basename(EXCEL_OUTPUT_PATH)}")
+        print(f"Sheets created: {', '.join(sheets)}")
+
 
 if __name__ == "__main__":
     main()
@@ -117,17 +117,16 @@ def print_summary_report(
     print(f"{'='*50}")
 
 
-def export_dashboard_data(
+def build_dashboard_data(
     df,
     summary_stats,
     pending_amounts,
     project_totals,
     category_summary,
     outstanding_balances,
-    output_path,
 ):
     """
-    Export data to JSON for HTML dashboard.
+    Build the dashboard/report data structure in memory.
 
     Args:
         df: Complete DataFrame with all expenses
@@ -136,12 +135,11 @@ def export_dashboard_data(
         project_totals: Dictionary from calculate_project_totals
         category_summary: DataFrame with category breakdown
         outstanding_balances: List of outstanding balance items
-        output_path: Path to save JSON file
 
     Returns:
-        Number of transactions processed
+        Dictionary in the same shape as the exported JSON
     """
-    dashboard_data = {
+    return {
         "project_info": {
             "name": "Mother-in-Law House Completion",
             "start_date": "15/09/2025",
@@ -174,8 +172,54 @@ def export_dashboard_data(
         "last_updated": "24/09/2025 12:00:00",
     }
 
-    # Save data for HTML dashboard
+
+def export_dashboard_data(
+    df,
+    summary_stats,
+    pending_amounts,
+    project_totals,
+    category_summary,
+    outstanding_balances,
+    output_path,
+):
+    """
+    Export data to JSON for HTML dashboard.
+
+    Args:
+        df: Complete DataFrame with all expenses
+        summary_stats: Dictionary from calculate_summary_stats
+        pending_amounts: Dictionary from calculate_pending_amounts
+        project_totals: Dictionary from calculate_project_totals
+        category_summary: DataFrame with category breakdown
+        outstanding_balances: List of outstanding balance items
+        output_path: Path to save JSON file
+
+    Returns:
+        Number of transactions processed
+    """
+    dashboard_data = build_dashboard_data(
+        df,
+        summary_stats,
+        pending_amounts,
+        project_totals,
+        category_summary,
+        outstanding_balances,
+    )
+    return save_dashboard_data(dashboard_data, output_path)
+
+
+def save_dashboard_data(dashboard_data, output_path):
+    """
+    Save data built by build_dashboard_data to JSON for HTML dashboard.
+
+    Args:
+        dashboard_data: Dictionary from build_dashboard_data
+        output_path: Path to save JSON file
+
+    Returns:
+        Number of transactions processed
+    """
     with open(output_path, "w") as f:
         json.dump(dashboard_data, f, indent=2)
 
-    return len(df)
+    return len(dashboard_data["daily_expenses"])
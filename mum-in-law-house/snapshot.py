@@ -0,0 +1,146 @@
+"""Columnar Arrow IPC snapshots of the processed expense data."""
+
+import json
+import os
+
+try:
+    import pyarrow as pa
+    from pyarrow import feather
+except ImportError:  # pragma: no cover - optional dependency
+    pa = feather = None
+
+# Repeated labels are dictionary-encoded so the snapshot stays small
+CATEGORICAL_COLUMNS = ("category", "subcategory", "vendor", "status")
+
+EXPENSES_FILENAME = "expense_data.arrow"
+CATEGORY_SUMMARY_FILENAME = "expense_categories.arrow"
+
+# Schema metadata key of the store markers the expenses are current to
+MARKERS_KEY = b"expense_store"
+
+
+def snapshot_available():
+    """Whether pyarrow is installed so snapshots can be written and read."""
+    return feather is not None
+
+
+def _require_pyarrow():
+    if feather is None:
+        raise ImportError(
+            "pyarrow is required for Arrow snapshots: pip install pyarrow"
+        )
+
+
+def _encode_categoricals(df):
+    """Copy of df with the label columns converted to categoricals."""
+    columns = [column for column in CATEGORICAL_COLUMNS if column in df.columns]
+    return df.astype({column: "category" for column in columns})
+
+
+def _decode_categoricals(df):
+    """Copy of df with the label columns converted back to strings."""
+    columns = [column for column in CATEGORICAL_COLUMNS if column in df.columns]
+    return df.astype({column: str for column in columns})
+
+
+def _write_feather(data, path):
+    """
+    Write an Arrow IPC file through a temporary file and a rename.
+
+    Frames loaded from the previous snapshot may still be memory-mapped, so
+    the file must never be truncated in place.
+    """
+    tmp_path = f"{path}.tmp"
+    feather.write_feather(data, tmp_path, compression="uncompressed")
+    os.replace(tmp_path, path)
+
+
+def write_snapshot(df, category_summary, output_dir, markers=None):
+    """
+    Write the processed expenses and category summary as Arrow IPC files.
+
+    Files are left uncompressed so readers can memory-map them.
+
+    Args:
+        df: Complete DataFrame with all processed expenses
+        category_summary: DataFrame with category breakdown
+        output_dir: Directory to write the snapshot files into
+        markers: Optional ledger markers (see ledger.ledger_markers) the
+            expenses are current to, saved in the expenses file's metadata
+
+    Returns:
+        Tuple of (expenses path, category summary path)
+    """
+    _require_pyarrow()
+
+    expenses_path = os.path.join(output_dir, EXPENSES_FILENAME)
+    category_path = os.path.join(output_dir, CATEGORY_SUMMARY_FILENAME)
+
+    table = pa.Table.from_pandas(
+        _encode_categoricals(df).reset_index(drop=True), preserve_index=False
+    )
+    if markers is not None:
+        table = table.replace_schema_metadata(
+            {**table.schema.metadata, MARKERS_KEY: json.dumps(markers).encode()}
+        )
+    _write_feather(table, expenses_path)
+    _write_feather(
+        _encode_categoricals(category_summary).reset_index(drop=True), category_path
+    )
+
+    return expenses_path, category_path
+
+
+def load_snapshot(output_dir, columns=None, categoricals=True):
+    """
+    Load a snapshot written by write_snapshot via memory mapping.
+
+    Args:
+        output_dir: Directory containing the snapshot files
+        columns: Optional list of expense columns to read
+        categoricals: Keep the label columns as categoricals; otherwise
+            they come back as strings, like process_expenses returns them
+
+    Returns:
+        Tuple of (expenses DataFrame, category summary DataFrame)
+    """
+    _require_pyarrow()
+
+    df = feather.read_table(
+        os.path.join(output_dir, EXPENSES_FILENAME),
+        columns=columns,
+        memory_map=True,
+    ).to_pandas()
+    if not categoricals:
+        df = _decode_categoricals(df)
+    category_summary = feather.read_table(
+        os.path.join(output_dir, CATEGORY_SUMMARY_FILENAME),
+        memory_map=True,
+    ).to_pandas()
+
+    return df, category_summary
+
+
+def snapshot_markers(output_dir):
+    """
+    Ledger markers a snapshot's expenses are current to.
+
+    Only the schema is read, so this is cheap however large the snapshot.
+
+    Args:
+        output_dir: Directory containing the snapshot files
+
+    Returns:
+        Markers passed to write_snapshot, or None if there is no snapshot
+        or it was written without them
+    """
+    _require_pyarrow()
+
+    path = os.path.join(output_dir, EXPENSES_FILENAME)
+    if not os.path.exists(path):
+        return None
+    with pa.memory_map(path) as source:
+        metadata = pa.ipc.open_file(source).schema.metadata or {}
+    if MARKERS_KEY not in metadata:
+        return None
+    return json.loads(metadata[MARKERS_KEY])
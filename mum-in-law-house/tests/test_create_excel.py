@@ -0,0 +1,74 @@
+from openpyxl import Workbook
+
+from calculations import calculate_category_summary, process_expenses
+from config import TOTAL_BUDGET
+from create_excel import build_category_analysis_sheet
+
+EXPENSES = [
+    {
+        "date": "01/10/2025",
+        "category": "Materials",
+        "subcategory": "Cement",
+        "description": "Cement bags",
+        "amount": 6000,
+        "vendor": "Hardware",
+    },
+    {
+        "date": "02/10/2025",
+        "category": "Materials",
+        "subcategory": "Sand",
+        "description": "Sand delivery",
+        "amount": 3000,
+        "vendor": "Quarry",
+    },
+    {
+        "date": "03/10/2025",
+        "category": "Materials",
+        "subcategory": "Ballast",
+        "description": "Ballast (UNPAID)",
+        "amount": 9000,
+        "vendor": "Quarry",
+    },
+    {
+        "date": "03/10/2025",
+        "category": "Labor",
+        "subcategory": "Fundi",
+        "description": "Fundi wages",
+        "amount": 4000,
+        "vendor": "Fundi",
+    },
+]
+
+
+def category_rows():
+    summary = calculate_category_summary(process_expenses(EXPENSES))
+    data = {
+        "project_info": {"total_budget": TOTAL_BUDGET},
+        "category_summary": summary.to_dict("records"),
+    }
+    ws = Workbook().active
+    build_category_analysis_sheet(ws, data)
+    headers = [cell.value for cell in ws[4]]
+    rows = {}
+    for row in ws.iter_rows(min_row=5, values_only=True):
+        if row[0] is None:
+            break
+        rows[row[0]] = dict(zip(headers, row))
+    return rows
+
+
+def test_count_matches_paid_amount_and_average():
+    materials = category_rows()["Materials"]
+
+    assert materials["Paid Count"] == 2
+    assert materials["Amount (KES)"] == 9000
+    assert materials["Avg per Transaction"] == "4500"
+    assert materials["Unpaid Count"] == 1
+    assert materials["Unpaid Amount"] == 9000
+
+
+def test_totals_count_paid_transactions():
+    rows = category_rows()
+
+    assert rows["TOTAL"]["Paid Count"] == 3
+    assert rows["TOTAL"]["Unpaid Count"] == 1
@@ -0,0 +1,59 @@
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from calculations import calculate_category_summary, process_expenses  # noqa: E402
+from snapshot import load_snapshot, snapshot_markers, write_snapshot  # noqa: E402
+
+EXPENSES = [
+    {
+        "date": "01/10/2025",
+        "category": "Materials",
+        "subcategory": "Cement",
+        "description": "Cement bags",
+        "amount": 6000,
+        "vendor": "Hardware",
+    },
+    {
+        "date": "02/10/2025",
+        "category": "Labor",
+        "subcategory": "Fundi",
+        "description": "Fundi wages (UNPAID)",
+        "amount": 4000,
+        "vendor": "Fundi",
+    },
+]
+MARKERS = {"store_id": 12345, "edit_count": 2, "watermark": 7}
+
+
+def write(df, output_dir, markers=MARKERS):
+    write_snapshot(df, calculate_category_summary(df), output_dir, markers)
+
+
+def test_markers_round_trip(tmp_path):
+    assert snapshot_markers(tmp_path) is None
+
+    write(process_expenses(EXPENSES), tmp_path, markers=None)
+    assert snapshot_markers(tmp_path) is None
+
+    write(process_expenses(EXPENSES), tmp_path)
+    assert snapshot_markers(tmp_path) == MARKERS
+
+
+def test_loads_like_process_expenses(tmp_path):
+    df = process_expenses(EXPENSES)
+    write(df, tmp_path)
+
+    loaded, _ = load_snapshot(tmp_path, categoricals=False)
+    assert loaded.to_dict("records") == df.to_dict("records")
+    assert loaded["category"].dtype == df["category"].dtype
+
+
+def test_overwrite_while_loaded(tmp_path):
+    write(process_expenses(EXPENSES), tmp_path)
+    loaded, _ = load_snapshot(tmp_path)
+
+    # The loaded frame may still map the old file
+    write(process_expenses(EXPENSES[:1]), tmp_path)
+    assert loaded["amount"].tolist() == [6000, 4000]
+    assert load_snapshot(tmp_path)[0]["amount"].tolist() == [6000]
@@ -0,0 +1,59 @@
+from datetime import date
+
+import pytest
+
+from data.store import add_expense, add_expenses, get_expenses_data, update_expense
+
+
+def expense(**fields):
+    return {
+        "date": "05/10/2025",
+        "category": "Materials",
+        "subcategory": "Cement",
+        "description": "Cement bags",
+        "amount": 6000,
+        "vendor": "Hardware",
+        **fields,
+    }
+
+
+@pytest.fixture
+def db_path(tmp_path, monkeypatch):
+    # An empty store: skip the one-time import of the legacy literal
+    monkeypatch.setattr("data.store.migrate_from_literal", lambda conn: 0)
+    return str(tmp_path / "expenses.db")
+
+
+def test_dates_are_normalized_on_insert(db_path):
+    add_expenses(
+        [expense(date="5/10/2025"), expense(date=date(2025, 10, 6))],
+        db_path=db_path,
+    )
+
+    rows = get_expenses_data(start_date="05/10/2025", db_path=db_path)
+    assert [row["date"] for row in rows] == ["05/10/2025", "06/10/2025"]
+
+
+@pytest.mark.parametrize("bad_date", ["2025-10-05", "31/02/2025", "", None])
+def test_invalid_date_is_rejected(db_path, bad_date):
+    with pytest.raises(ValueError):
+        add_expense(expense(date=bad_date), db_path=db_path)
+    assert get_expenses_data(db_path=db_path) == []
+
+
+def test_invalid_date_rejects_the_whole_batch(db_path):
+    with pytest.raises(ValueError):
+        add_expenses([expense(), expense(date="10/13/2025")], db_path=db_path)
+    assert get_expenses_data(db_path=db_path) == []
+
+
+def test_update_normalizes_and_validates_date(db_path):
+    add_expense(expense(), db_path=db_path)
+    [row] = get_expenses_data(include_ids=True, db_path=db_path)
+
+    update_expense(row["id"], {"date": "7/10/2025"}, db_path=db_path)
+    assert get_expenses_data(db_path=db_path)[0]["date"] == "07/10/2025"
+
+    with pytest.raises(ValueError):
+        update_expense(row["id"], {"date": "2025-10-07"}, db_path=db_path)
+    assert get_expenses_data(db_path=db_path)[0]["date"] == "07/10/2025"